@@ -0,0 +1,242 @@
+"""
+Kommandozeilen-Oberfläche des Pip Paket-Managers (ohne Tkinter).
+
+Beispiele:
+    python Pip_Paket_Manager_cli.py search requests --limit 20
+    python Pip_Paket_Manager_cli.py outdated --json
+    python Pip_Paket_Manager_cli.py autoremove
+    python Pip_Paket_Manager_cli.py autoremove --yes
+    python Pip_Paket_Manager_cli.py conflicts
+    python Pip_Paket_Manager_cli.py conflicts flask 3.0.0
+    python Pip_Paket_Manager_cli.py audit --python /pfad/zum/venv/bin/python
+    python Pip_Paket_Manager_cli.py yanked --concurrency 64
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from logic.engine import PackageEngine  # pylint: disable=wrong-import-position
+from utils.translations import TranslationCatalog  # pylint: disable=wrong-import-position
+
+APP_DIR = os.path.join(os.path.expanduser('~'), '.pip_paket_manager')
+
+
+def _print_json(data):
+    json.dump(data, sys.stdout, indent=2, ensure_ascii=False, default=str)
+    sys.stdout.write("\n")
+
+
+def cmd_search(engine, args):
+    """Durchsucht den lokalen PyPI-Index (optional nach einem Delta-Update)."""
+    index = engine.load_index(update=not args.offline)
+    result = engine.search(index, args.query, args.limit)
+    if args.json:
+        _print_json(result)
+    else:
+        print("\n".join(result))
+    return 0
+
+
+def cmd_outdated(engine, args):
+    """Listet veraltete Pakete."""
+    outdated = engine.outdated() or {}
+    if args.json:
+        _print_json(outdated)
+    else:
+        for name in sorted(outdated, key=str.lower):
+            info = outdated[name]
+            print(f"{name} {info.get('current', '?')} -> {info.get('latest', '?')}")
+    return 0
+
+
+def cmd_autoremove(engine, args):
+    """
+    Listet nicht mehr benötigte Pakete; entfernt sie nur mit --yes.
+
+    Kandidaten sind alle Pakete, von denen kein anderes abhängt, also auch bewusst
+    installierte Werkzeuge. Wie in der GUI wird deshalb nie ohne Bestätigung deinstalliert.
+    """
+    candidates = engine.autoremove_candidates()
+    dry_run = not args.yes or args.dry_run
+    removed, failed = [], []
+    if not dry_run and candidates:
+        removed, failed = engine.uninstall(candidates)
+    if args.json:
+        _print_json({"candidates": candidates, "dry_run": dry_run, "removed": removed,
+                     "failed": [{"package": pkg, "error": error} for pkg, error in failed]})
+    else:
+        print("\n".join(candidates))
+        for pkg, error in failed:
+            print(f"{pkg}: {error.strip()}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def cmd_conflicts(engine, args):
+    """Prüft die Umgebung oder die geplante Installation eines Pakets auf Konflikte."""
+    if args.package:
+        can_install, required, conflicts, cross_conflicts = engine.resolve_dependencies(
+            args.package, args.version)
+        data = {
+            "package": args.package, "version": args.version, "can_install": can_install,
+            "requires": [{"name": name, "specifier": spec} for name, spec in required],
+            "conflicts": [{"dependency": name, "installed": current, "required": spec}
+                          for name, current, spec in conflicts],
+            "cross_conflicts": [{"dependency": dep, "package": pkg, "requirement": req}
+                                for dep, entries in cross_conflicts.items()
+                                for pkg, req in entries],
+        }
+        if args.json:
+            _print_json(data)
+        else:
+            for entry in data["conflicts"]:
+                print(f"{entry['dependency']} {entry['installed']} !{entry['required']}")
+            for entry in data["cross_conflicts"]:
+                print(f"{entry['package']}: {entry['requirement']}")
+        return 0 if can_install else 1
+
+    conflicts = engine.environment_conflicts()
+    if args.json:
+        _print_json(conflicts)
+    else:
+        for entry in conflicts:
+            print(f"{entry['package']}: {entry['requirement']} "
+                  f"(installed {entry['dependency']} {entry['installed']})")
+    return 1 if conflicts else 0
+
+
+def cmd_audit(engine, args):
+    """Prüft installierte Pakete auf bekannte Sicherheitslücken."""
+    from logic.vulnerability_db import VulnerabilityDatabase
+    db = VulnerabilityDatabase(os.path.join(APP_DIR, 'vulnerability_db.json'))
+    result = engine.audit(db)
+    if args.json:
+        _print_json({
+            "source": result.source,
+            "issue_count": result.issue_count,
+            "packages": {
+                pkg: ([v._asdict() if hasattr(v, "_asdict") else vars(v)
+                       for v in result.vulnerabilities[pkg]]
+                      if pkg in result.vulnerabilities else [{"issue": result.issues[pkg]}])
+                for pkg in sorted(result.packages, key=str.lower)},
+        })
+    else:
+        for pkg in sorted(result.packages, key=str.lower):
+            print(f"{pkg}:\n{result.issues.get(pkg, '')}")
+    return 1 if result.issue_count else 0
+
+
+def cmd_yanked(engine, args):
+    """Prüft alle installierten Versionen gleichzeitig auf zurückgezogene Releases."""
+    from logic.async_pypi import AsyncIndexClient
+
+    async def sweep():
+        async with AsyncIndexClient(engine.index, max_concurrency=args.concurrency) as client:
+            return await client.yanked_releases(engine.installed_versions())
+
+    yanked = asyncio.run(sweep())
+    if args.json:
+        _print_json({name: {"version": version, "reason": reason}
+                     for name, (version, reason) in yanked.items()})
+    else:
+        for name in sorted(yanked, key=str.lower):
+            version, reason = yanked[name]
+            print(f"{name} {version}" + (f": {reason}" if reason else ""))
+    return 1 if yanked else 0
+
+
+def _add_common_options(parser, with_defaults=True):
+    """
+    Fügt die gemeinsamen Optionen hinzu.
+
+    Sie gelten vor und nach dem Unterbefehl ('--json outdated' wie 'outdated --json').
+    Bei den Unterbefehlen fehlen die Standardwerte (SUPPRESS), damit sie vor dem
+    Unterbefehl angegebene Werte nicht überschreiben.
+    """
+    def default(value):
+        return value if with_defaults else argparse.SUPPRESS
+
+    parser.add_argument("--python", default=default(sys.executable),
+                        help="Interpreter der Zielumgebung (Standard: aktueller)")
+    parser.add_argument("--index-url", default=default(os.environ.get("PIP_MANAGER_INDEX_URL")),
+                        help="Paketindex (Spiegel, 'file://' oder Pfad) statt pypi.org")
+    parser.add_argument("--index-json-url",
+                        default=default(os.environ.get("PIP_MANAGER_INDEX_JSON_URL")),
+                        help="JSON-API des Spiegels ('<url>/<projekt>/json'), optional")
+    parser.add_argument("--lang", default=default("en"),
+                        help="Sprache der Meldungen (Standard: en)")
+    parser.add_argument("--json", action="store_true", default=default(False),
+                        help="Ausgabe als JSON")
+    parser.add_argument("-v", "--verbose", action="store_true", default=default(False),
+                        help="Meldungen auf stderr ausgeben")
+
+
+def build_parser():
+    """Erstellt den Argument-Parser mit allen Unterbefehlen."""
+    parser = argparse.ArgumentParser(prog="pip-paket-manager",
+                                     description="Pip Paket-Manager (headless)")
+    _add_common_options(parser)
+    common = argparse.ArgumentParser(add_help=False)
+    _add_common_options(common, with_defaults=False)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    search = sub.add_parser("search", parents=[common], help="PyPI-Index durchsuchen")
+    search.add_argument("query")
+    search.add_argument("--limit", type=int, default=None)
+    search.add_argument("--offline", action="store_true", help="Nur den lokalen Cache verwenden")
+    search.set_defaults(func=cmd_search)
+
+    outdated = sub.add_parser("outdated", parents=[common], help="Veraltete Pakete anzeigen")
+    outdated.set_defaults(func=cmd_outdated)
+
+    autoremove = sub.add_parser("autoremove", parents=[common],
+                                help="Nicht benötigte Pakete anzeigen (mit --yes entfernen)")
+    autoremove.add_argument("--yes", action="store_true",
+                            help="Die angezeigten Pakete tatsächlich deinstallieren")
+    autoremove.add_argument("--dry-run", action="store_true",
+                            help="Nur anzeigen (Standard; hat Vorrang vor --yes)")
+    autoremove.set_defaults(func=cmd_autoremove)
+
+    conflicts = sub.add_parser("conflicts", parents=[common], help="Abhängigkeitskonflikte prüfen")
+    conflicts.add_argument("package", nargs="?")
+    conflicts.add_argument("version", nargs="?")
+    conflicts.set_defaults(func=cmd_conflicts)
+
+    audit = sub.add_parser("audit", parents=[common], help="Sicherheitsprüfung")
+    audit.set_defaults(func=cmd_audit)
+
+    yanked = sub.add_parser("yanked", parents=[common],
+                            help="Installierte, zurückgezogene Versionen finden")
+    yanked.add_argument("--concurrency", type=int, default=32,
+                        help="Maximale Anzahl gleichzeitiger Anfragen (Standard: 32)")
+    yanked.set_defaults(func=cmd_yanked)
+    return parser
+
+
+def main(argv=None):
+    """Einstiegspunkt der Kommandozeile; gibt den Exit-Code zurück."""
+    args = build_parser().parse_args(argv)
+    catalog = TranslationCatalog(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lang'),
+                                 os.path.join(APP_DIR, 'translations'))
+    catalog.set_language(args.lang)
+
+    def log(message, level="INFO"):
+        if args.verbose or level in ("WARNING", "ERROR"):
+            print(f"[{level}] {message}", file=sys.stderr)
+
+    os.makedirs(APP_DIR, exist_ok=True)
+    engine = PackageEngine.for_interpreter(
+        args.python, log_callback=log, translate=catalog.get,
+        index_cache_path=os.path.join(APP_DIR, 'pypi_index_cache.json'))
+    if args.index_url:
+        from logic.index_client import apply_pip_environment
+        engine.configure_index(args.index_url, args.index_json_url)
+        apply_pip_environment(engine.index_url)
+    return args.func(engine, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
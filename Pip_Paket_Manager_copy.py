@@ -9,13 +9,62 @@ Paketen bietet.
 __version__ = 3
 
 # --- Bootstrap: Abhängigkeiten prüfen und installieren ---
+import time
+_STARTUP_TIME = time.perf_counter()
+
 import subprocess
 import sys
 import importlib.metadata
+import json
+import os
+
+REQUIRED_PACKAGES = ["requests", "Pillow", "packaging", "beautifulsoup4"]
+DEPS_STAMP_PATH = os.path.join(os.path.expanduser('~'), '.pip_paket_manager', 'deps_ok.json')
+
+
+def _dependency_stamp():
+    """
+    Bildet eine Signatur aus Interpreter, Skriptversion und den Änderungszeiten
+    der site-packages-Ordner. Ändert sich eine davon, wird erneut geprüft.
+    """
+    import site
+    site_dirs = set(site.getsitepackages()) if hasattr(site, "getsitepackages") else set()
+    if site.ENABLE_USER_SITE:
+        site_dirs.add(site.getusersitepackages())
+    mtimes = {}
+    for path in sorted(site_dirs):
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+    return {"executable": sys.executable, "python": sys.version, "app_version": __version__,
+            "packages": REQUIRED_PACKAGES, "site_mtimes": mtimes}
+
+
+def _dependency_stamp_matches(stamp):
+    """Prüft, ob der gespeicherte "Abhängigkeiten OK"-Stempel noch gilt."""
+    try:
+        with open(DEPS_STAMP_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f) == stamp
+    except (OSError, json.JSONDecodeError):
+        return False
+
+
+def _write_dependency_stamp(stamp):
+    """Speichert den "Abhängigkeiten OK"-Stempel."""
+    try:
+        os.makedirs(os.path.dirname(DEPS_STAMP_PATH), exist_ok=True)
+        with open(DEPS_STAMP_PATH, 'w', encoding='utf-8') as f:
+            json.dump(stamp, f)
+    except OSError:
+        pass
+
 
 def check_and_install_dependencies():
     """Check if all required packages are installed and install them if not."""
-    REQUIRED_PACKAGES = ["requests", "Pillow", "packaging", "beautifulsoup4"]
+    stamp = _dependency_stamp()
+    if _dependency_stamp_matches(stamp):
+        return
     missing_packages = []
 
     for package in REQUIRED_PACKAGES:
@@ -31,43 +80,56 @@ def check_and_install_dependencies():
         except subprocess.CalledProcessError as e:
             print(f"Error installing packages: {e}")
             print(f"Please install the packages manually with: pip install {' '.join(missing_packages)}")
+            return
+        # Die Installation hat site-packages verändert
+        stamp = _dependency_stamp()
+    _write_dependency_stamp(stamp)
 
 check_and_install_dependencies()
 
 # --- Pfad-Konfiguration für lokale Module ---
 # Fügt das Projekt-Stammverzeichnis zum Python-Pfad hinzu, um Import-Fehler
 # wie "Unable to import 'utils.helpers'" in IDEs und bei der Ausführung zu vermeiden.
-import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # --- Standard-Bibliothek ---
 import datetime
-import json
+import shutil
 import threading
 import tkinter as tk
 import webbrowser
 from tkinter import ttk, messagebox, filedialog
 
-# --- Drittanbieter-Bibliotheken ---
-import requests
-import packaging.version
-from PIL import Image, ImageTk
-from packaging import utils as packaging_utils
-
 # --- Eigene Module ---
+# requests, Pillow und packaging (sowie die Module, die sie benötigen) werden
+# erst bei der ersten Verwendung importiert, damit das Fenster schnell erscheint.
+from logic.engine import PackageEngine, normalize_name
+from logic.install_times import installed_since, sort_by_install_time
+from logic.package_detail import PackageDetailStore
 from logic.package_manager import PackageManager
-from logic.pypi_api import PyPiAPI
+from logic.pip_helper import PipHelperPool, PipHelperError
+from logic.venv_scanner import VenvScanner, DEFAULT_PRUNE
+from logic.venv_inventory import VenvInventory, find_site_packages, find_venv_python
 from gui.tab1_widgets import create_tab1_widgets
 from gui.tab2_widgets import create_tab2_widgets
+from gui.package_list_view import PackageListView
 from utils.config import ConfigManager
-from utils.helpers import resource_path, is_admin, get_package_path, get_current_system_tags_set
+from utils.cancellation import LatestWins, OperationCancelled
+from utils.log_store import LogStore, DEFAULT_MAX_RECORDS
+from utils.pip_progress import PipProgressReporter
+from utils.prefetch import LruCache, Prefetcher
+from utils.task_pipeline import TaskPipeline
+from utils.task_scheduler import TaskScheduler, LANE_BACKGROUND, LANE_INTERACTIVE, LANE_PIP
+from utils.ui_dispatcher import UiDispatcher
+from utils.translations import TranslationCatalog
+from utils.tracing import TRACER
+from utils.helpers import resource_path, is_admin, get_package_path
 
 # -----------------------------------------------------------------------------
-def load_translations():
+def create_translation_catalog():
     """
-    Lädt alle Sprach-JSON-Dateien aus dem 'lang'-Verzeichnis.
+    Erstellt den Sprachkatalog für das 'lang'-Verzeichnis (ohne ihn zu laden).
     """
-    translations = {}
     # Zuerst im normalen Pfad suchen
     lang_dir = os.path.join(
         os.path.dirname(os.path.abspath(__file__)), 'lang'
@@ -77,35 +139,43 @@ def load_translations():
     if not os.path.isdir(lang_dir):
         lang_dir = resource_path('lang')
 
-    if os.path.isdir(lang_dir):
-        for filename in os.listdir(lang_dir):
-            if filename.endswith('.json'):
-                lang_code = filename[:-5]
-                filepath = os.path.join(lang_dir, filename)
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        translations[lang_code] = json.load(f)
-                except (json.JSONDecodeError, IOError):
-                    # Im Fehlerfall eine leere Übersetzung bereitstellen
-                    translations[lang_code] = {}
-    # Fallback, falls keine Dateien geladen werden konnten
-    if 'de' not in translations:
-        translations['de'] = {"title": "Pip Paket-Manager (Fehler)",
-                              "select_python_title": "Python-Version auswählen",
-                              "label_select_python": "Wählen Sie eine Python-Version:",
-                              "btn_ok": "OK",
-                              "btn_cancel": "Abbrechen"}
-    if 'en' not in translations:
-        translations['en'] = {"title": "Pip Package Manager (Error)",
-                              "select_python_title": "Select Python Version",
-                              "label_select_python": "Select a Python version:",
-                              "btn_ok": "OK",
-                              "btn_cancel": "Cancel"}
-
-    return translations
+    # Fallback, falls keine Dateien geladen werden können
+    builtin = {
+        'de': {"title": "Pip Paket-Manager (Fehler)",
+               "select_python_title": "Python-Version auswählen",
+               "label_select_python": "Wählen Sie eine Python-Version:",
+               "btn_ok": "OK",
+               "btn_cancel": "Abbrechen"},
+        'en': {"title": "Pip Package Manager (Error)",
+               "select_python_title": "Select Python Version",
+               "label_select_python": "Select a Python version:",
+               "btn_ok": "OK",
+               "btn_cancel": "Cancel"},
+    }
+    cache_dir = os.path.join(os.path.expanduser('~'), '.pip_paket_manager', 'translations')
+    return TranslationCatalog(lang_dir, cache_dir, fallback='de', builtin=builtin)
 
 # --- Globale Variablen ---
-LANG_TEXTS = load_translations()
+TRANSLATIONS = create_translation_catalog()
+LOG_FLUSH_INTERVAL_MS = 100
+LOG_FLUSH_MAX_LINES = 2000
+WHEELHOUSE_DEFAULT_MAX_SIZE_MB = 2048
+# Beim Blättern mit den Pfeiltasten startet erst eine Auswahl, die so lange bestehen bleibt
+INFO_SELECTION_DELAY_MS = 80
+# Anzahl der Zeilen ober- und unterhalb der Auswahl, deren Details vorgeladen werden
+DETAIL_PREFETCH_RADIUS = 3
+DETAIL_CACHE_MAX_ENTRIES = 300
+DETAIL_CACHE_MAX_BYTES = 16 * 1024 * 1024
+# Zeiträume (in Tagen) für den Filter "zuletzt installiert" im Kontextmenü der Paketliste
+INSTALL_DATE_FILTER_DAYS = (7, 30, 90)
+
+
+def _estimate_detail_size(detail):
+    """Schätzt den Speicherbedarf eines Detail-Eintrags (Record plus PyPI-Daten)."""
+    record, pypi_info = detail
+    return (sum(sys.getsizeof(value) for value in (record.summary, record.homepage,
+                                                   record.license, record.requires))
+            + len(repr(pypi_info)) + 1024)
 
 
 # -----------------------------------------------------------------------------
@@ -125,29 +195,60 @@ class PipPackageManager:
             Das Hauptfenster der Anwendung.
         """
         self.root = root_window
+        self.log_store = LogStore()
+        self.log_window = None
+        self.translations = TRANSLATIONS
+        self.current_lang = "de"
         self.root.title("Pip Paket-Manager")
         self.root.geometry("950x650")
         try:
             self.root.iconbitmap(resource_path('PyPi-128px.ico'))
         except tk.TclError:
             self.log_message(self.t("warning_icon_not_found"))
-        self.pypi_api = PyPiAPI(self.log_message)
+        self._lazy_lock = threading.Lock()
+        self._pypi_api = None
+        self._download_engine = None
+        self._async_bridge = None
+        self._active_downloads = {}
+        self._info_requests = LatestWins()
+        self.scheduler = TaskScheduler(log_callback=self.log_message)
+        # Alle GUI-Aktualisierungen aus Worker-Threads laufen gebündelt über diese Warteschlange
+        self.ui = UiDispatcher(
+            self.root, error_callback=lambda e: self.log_message(
+                self.t("log_ui_update_error").format(e=e), "DEBUG"))
+        self.ui.start()
+        self.tasks_window = None
+        self.detail_cache = LruCache(DETAIL_CACHE_MAX_ENTRIES, DETAIL_CACHE_MAX_BYTES,
+                                     size_func=_estimate_detail_size)
+        self.detail_prefetcher = Prefetcher(self.scheduler, self._load_package_detail,
+                                            self.detail_cache, log_callback=self.log_message)
+        self._info_after_id = None
+        self.pip_helpers = PipHelperPool(self.log_message)
 
         self.config_manager = ConfigManager(self.log_message)
         # --- Anwendungszustand (ersetzt globale Variablen) ---
         self.version = __version__
-        self.current_lang = "de"
         self.remember_language_var = tk.BooleanVar(value=False)
         self.storage_method_var = tk.StringVar(value="config")
-        self.log_records = []
         self.pypi_index_cache = []
         self.pypi_package_releases_cache = {}
         self.installed_packages_cache = []
+        self.install_times_cache = {}
+        self.package_sort_var = tk.StringVar(value="name")
+        self.install_filter_days_var = tk.IntVar(value=0)
         self.pypi_cache_path = self._get_cache_path()
+        self.engine = PackageEngine(log_callback=self.log_message, translate=self.t,
+                                    index_cache_path=self.pypi_cache_path)
+        self.package_details = PackageDetailStore(self.engine)
         self.outdated_packages_cache = {}
-        self.security_packages_cache = []
+        self.security_packages_cache = set()
+        self.missing_deps_packages_cache = set()
         self.security_issues_cache = {}
-        self.current_system_tags = get_current_system_tags_set()
+        self.security_vulnerabilities_cache = {}
+        self._vulnerability_db = None
+        self._wheelhouse = None
+        self.wheelhouse_max_size_mb = WHEELHOUSE_DEFAULT_MAX_SIZE_MB
+        self._current_system_tags = None
         self.current_package_version_details_cache = {}
         self.current_searched_pkg_name = None
         self.new_script_content = None
@@ -159,7 +260,14 @@ class PipPackageManager:
         self.current_install_time = None
         self.current_missing_deps = None
         self.found_venvs_cache = []
+        self.venv_scan_prune = sorted(DEFAULT_PRUNE)
+        self._venv_search_cancel = None
         self.venv_paths = []
+        self.venv_inventory = VenvInventory(
+            os.path.join(os.path.dirname(self.pypi_cache_path), 'venv_inventory.json'))
+        self.venv_info_cache = {}
+        self._venv_display_to_path = {}
+        self._venv_combobox_refresh_pending = False
         self.selected_python_executable = sys.executable
         self.venv_var = tk.StringVar()
         self._is_programmatic_change = False
@@ -169,6 +277,7 @@ class PipPackageManager:
         self.notebook = None
         self.venv_selection_label = None
         self.package_listbox = None
+        self.package_list_view = None
         self.info_text = None
         self.py_version_text = None
         self.search_entry_var = tk.StringVar()
@@ -184,7 +293,9 @@ class PipPackageManager:
         self.btn_reinstall = None
         self.btn_refresh = None
         self.btn_show_log = None
+        self.btn_show_tasks = None
         self.btn_security_check = None
+        self.btn_check_yanked = None
         self.btn_install_local = None
         self.btn_autoremove = None
         self.btn_install_selected = None
@@ -210,24 +321,103 @@ class PipPackageManager:
         self.tab3_delete_pypi_index_label = None
         self.tab3_paths_frame = None
         self.tab3_find_venvs_btn = None
+        self.tab3_import_vuln_db_btn = None
         self.venv_selection_frame = None
         self.venv_combobox = None
         self.btn_update = None
         self.venv_selection_label = None
-        self._options_paths_after_id = None
         self._options_path_entries = []
+        self._paths_cache = {}
 
         # --- Initialisierung ---
         self.log_message(self.t("log_app_started"))
         self._create_widgets()
         self._load_startup_settings()
-        self._start_background_tasks()
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
-        self._schedule_periodic_update(self._update_paths_listbox, 5000)
+        # Erst das Fenster zeichnen, dann Icon und Hintergrundaufgaben laden
+        self.root.after_idle(self._on_window_shown)
+
+    def _on_window_shown(self):
+        """Wird aufgerufen, sobald das Hauptfenster angezeigt wurde."""
+        time_to_window = time.perf_counter() - _STARTUP_TIME
+        TRACER.record("startup.time_to_window", _STARTUP_TIME, time_to_window)
+        self.log_message(self.t("log_time_to_window").format(ms=time_to_window * 1000), "DEBUG")
+        self._load_logo_icon()
+        self._start_background_tasks()
+
+    def _lazy_attribute(self, attribute, factory):
+        """Erzeugt ein Objekt beim ersten Zugriff (threadsicher) und merkt es sich."""
+        value = getattr(self, attribute)
+        if value is None:
+            with self._lazy_lock:
+                value = getattr(self, attribute)
+                if value is None:
+                    value = factory()
+                    setattr(self, attribute, value)
+        return value
+
+    @property
+    def pypi_api(self):
+        """Client für die PyPI-API (importiert requests beim ersten Zugriff)."""
+        def create():
+            from logic.pypi_api import PyPiAPI
+            return PyPiAPI(self.log_message)
+        return self._lazy_attribute("_pypi_api", create)
+
+    @property
+    def async_bridge(self):
+        """asyncio-Schleife für Massenabfragen; Ergebnisse kommen über `root.after` zurück."""
+        def create():
+            from logic.async_pypi import AsyncBridge
+            return AsyncBridge(self.ui.post)
+        return self._lazy_attribute("_async_bridge", create)
+
+    @property
+    def download_engine(self):
+        """Download-Engine (importiert requests beim ersten Zugriff)."""
+        def create():
+            from logic.download_engine import DownloadEngine
+            return DownloadEngine(log_callback=self.log_message)
+        return self._lazy_attribute("_download_engine", create)
+
+    @property
+    def vulnerability_db(self):
+        """Lokale Schwachstellen-Datenbank (importiert packaging beim ersten Zugriff)."""
+        def create():
+            from logic.vulnerability_db import VulnerabilityDatabase
+            return VulnerabilityDatabase(
+                os.path.join(os.path.dirname(self.pypi_cache_path), 'vulnerability_db.json'))
+        return self._lazy_attribute("_vulnerability_db", create)
+
+    @property
+    def wheelhouse(self):
+        """Lokales Wheelhouse (importiert packaging beim ersten Zugriff)."""
+        def create():
+            from logic.wheelhouse import Wheelhouse
+            return Wheelhouse(os.path.join(os.path.dirname(self.pypi_cache_path), 'wheelhouse'),
+                              max_size=self.wheelhouse_max_size_mb * 1024 * 1024)
+        return self._lazy_attribute("_wheelhouse", create)
+
+    @property
+    def current_system_tags(self):
+        """Vom aktuellen System unterstützte Wheel-Tags (beim ersten Zugriff ermittelt)."""
+        def create():
+            from utils.helpers import get_current_system_tags_set
+            return get_current_system_tags_set()
+        return self._lazy_attribute("_current_system_tags", create)
 
     def t(self, key): # pylint: disable=invalid-name
         """Gibt den übersetzten Text für einen Schlüssel zurück."""
-        return LANG_TEXTS[self.current_lang].get(key, f"<{key}>")
+        return self.translations.get(key)
+
+    @property
+    def current_lang(self):
+        """Code der aktiven Sprache."""
+        return self.translations.language
+
+    @current_lang.setter
+    def current_lang(self, lang_code):
+        self.translations.set_language(lang_code)
 
     def _create_widgets(self):
         """Erstellt alle GUI-Elemente der Anwendung."""
@@ -240,12 +430,22 @@ class PipPackageManager:
         self.notebook.add(tab1, text=self.t("tab_manage"))
         self.notebook.add(tab2, text=self.t("tab_search"))
         self.notebook.add(tab3, text=self.t("tab_options"))
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_notebook_tab_changed)
 
         create_tab1_widgets(self, tab1)
+        self.package_list_view = PackageListView(self.package_listbox)
         create_tab2_widgets(self, tab2)
         self._create_tab3_widgets(tab3)
         self._create_statusbar()
 
+    def _on_notebook_tab_changed(self, _event=None):
+        """Aktualisiert die Pfadanzeige, sobald der Optionen-Tab sichtbar wird."""
+        try:
+            if self.notebook.index(self.notebook.select()) == 2:
+                self._update_paths_listbox()
+        except tk.TclError:
+            pass
+
     def _get_cache_path(self):
         """Gibt den Pfad zur Cache-Datei im Benutzerverzeichnis zurück."""
         app_dir = os.path.join(os.path.expanduser('~'), '.pip_paket_manager')
@@ -323,11 +523,21 @@ class PipPackageManager:
                                        width=25,
                                        command=self.show_log_window)
         self.btn_show_log.pack(fill=tk.X, pady=2)
+        self.btn_show_tasks = ttk.Button(self.btn_frame,
+                                         text=self.t("btn_show_tasks"),
+                                         width=25,
+                                         command=self.show_tasks_window)
+        self.btn_show_tasks.pack(fill=tk.X, pady=2)
         self.btn_security_check = ttk.Button(self.btn_frame,
                                              text=self.t("security_check_title"),
                                              width=25,
                                              command=self.check_security_vulnerabilities)
         self.btn_security_check.pack(fill=tk.X, pady=2)
+        self.btn_check_yanked = ttk.Button(self.btn_frame,
+                                           text=self.t("btn_check_yanked"),
+                                           width=25,
+                                           command=self.check_yanked_packages)
+        self.btn_check_yanked.pack(fill=tk.X, pady=2)
         self.btn_install_local = ttk.Button(self.btn_frame,
                                             text=self.t("btn_install_local"),
                                             width=25,
@@ -339,7 +549,12 @@ class PipPackageManager:
                                          command=self.autoremove_packages)
         self.btn_autoremove.pack(fill=tk.X, pady=2)
 
+        return main_middle_frame
+
+    def _load_logo_icon(self):
+        """Lädt das PyPI-Logo (Pillow wird erst hier importiert)."""
         try:
+            from PIL import Image, ImageTk
             img = Image.open(resource_path('PyPi-128px.ico')).resize(
                 (128, 128), Image.Resampling.LANCZOS
                 )
@@ -347,11 +562,9 @@ class PipPackageManager:
             icon_label = ttk.Label(self.btn_frame, image=self.root.icon_image, cursor="hand2")
             icon_label.pack(side=tk.BOTTOM, pady=10)
             icon_label.bind("<Button-1>", lambda e: webbrowser.open_new_tab("https://pypi.org/"))
-        except (FileNotFoundError, tk.TclError):
+        except (ImportError, FileNotFoundError, tk.TclError):
             pass # Icon ist optional
 
-        return main_middle_frame
-
     def _create_venv_action_widgets(self, parent_frame):
         """Erstellt die Widgets für die venv-Suche und -Auswahl."""
         venv_action_frame = tk.Frame(parent_frame)
@@ -431,6 +644,14 @@ class PipPackageManager:
 
             self._create_venv_action_widgets(main_frame)
 
+        self.tab3_import_vuln_db_btn = ttk.Button(main_frame,
+                                                  command=self.import_vulnerability_db,
+                                                  text=self.t("btn_import_vulnerability_db"))
+        self.tab3_import_vuln_db_btn.grid(
+            row=self.tab3_row_counter, column=0, sticky="w", pady=5, padx=5
+            )
+        self.tab3_row_counter += 1
+
         # Frame für wichtige Pfade
         self.tab3_paths_frame = tk.LabelFrame(main_frame,
                                               relief=tk.RAISED, borderwidth=2)
@@ -454,16 +675,14 @@ class PipPackageManager:
         self.progress_label = ttk.Label(status_frame, text="", anchor="e")
         self.progress_label.grid(row=0, column=1, sticky="ew")
 
+    @TRACER.traced("startup.background_tasks")
     def _start_background_tasks(self):
         """Startet die initialen Ladevorgänge in Hintergrundthreads."""
-        threading.Thread(target=self.load_packages, daemon=True).start()
-        threading.Thread(target=self.load_python_versions, daemon=True).start()
-        self.root.after(
-            2000, lambda: threading.Thread(target=self.load_pypi_index, daemon=True).start()
-            )
-        self.root.after(
-            3000, lambda: threading.Thread(target=self.check_for_updates, daemon=True).start()
-            )
+        self.load_packages()
+        self._start_venv_inventory()
+        self.load_python_versions()
+        self.root.after(2000, self.load_pypi_index)
+        self.root.after(3000, self.check_for_updates)
 
     def _enable_storage_method_radios(self):
         """Aktiviert die Radio buttons für die Speichermethode."""
@@ -481,15 +700,37 @@ class PipPackageManager:
         self.remember_language_var.set(settings.get("remember_language", False))
         self.storage_method_var.set(settings.get("storage_method", "config"))
         self.venv_paths = settings.get("venvs", [])
+        self.venv_scan_prune = settings.get("venv_scan_prune", self.venv_scan_prune)
+        self.log_store.set_max_records(settings.get("log_max_records", DEFAULT_MAX_RECORDS))
+        self.wheelhouse_max_size_mb = int(
+            settings.get("wheelhouse_max_size_mb", WHEELHOUSE_DEFAULT_MAX_SIZE_MB))
+        if settings.get("tracing_enabled"):
+            TRACER.enabled = True
+        self._configure_package_index(
+            os.environ.get("PIP_MANAGER_INDEX_URL") or settings.get("index_url"),
+            os.environ.get("PIP_MANAGER_INDEX_JSON_URL") or settings.get("index_json_url"))
 
         self._update_all_labels()
         self._update_venv_combobox_values() # <-- HIER WIEDER EINGEFÜGT
         self.root.after(10, lambda: setattr(self, '_is_programmatic_change', False))
 
+    def _configure_package_index(self, index_url, json_url=None):
+        """
+        Stellt Suche, Versionsliste, Downloads und Pip auf einen anderen Paketindex um
+        (z.B. einen internen Spiegel oder ein lokales 'file://'-Verzeichnis).
+        """
+        if not index_url:
+            return
+        from logic.index_client import apply_pip_environment
+        self.engine.configure_index(index_url, json_url)
+        apply_pip_environment(self.engine.index_url)
+        self.pypi_index_cache = []
+        self.pypi_package_releases_cache = {}
+        self.log_message(self.t("log_index_configured").format(url=self.engine.index_url))
+
     def _get_language_maps(self):
         """Erstellt dynamisch Mapping-Wörterbücher für Sprachen."""
-        code_to_display = {code: data.get("language_name", code) for code,
-                           data in LANG_TEXTS.items()}
+        code_to_display = dict(self.translations.language_names())
         display_to_code = {name: code for code, name in code_to_display.items()}
         return code_to_display, display_to_code
 
@@ -497,6 +738,8 @@ class PipPackageManager:
         """Ändert die Sprache und speichert sie, falls 'merken' aktiv ist.""" # pylint: disable=unused-argument
         _, display_to_code = self._get_language_maps()
         lang_code = display_to_code.get(self.lang_var.get(), "de")
+        if lang_code == self.current_lang:
+            return
         self.current_lang = lang_code
 
         self._update_all_labels()
@@ -530,7 +773,9 @@ class PipPackageManager:
             self.btn_refresh.config(text=self.t("btn_refresh"))
             self.btn_install_deps.config(text=self.t("btn_install_deps"))
             self.btn_show_log.config(text=self.t("btn_show_log"))
+            self.btn_show_tasks.config(text=self.t("btn_show_tasks"))
             self.btn_security_check.config(text=self.t("security_check_title"))
+            self.btn_check_yanked.config(text=self.t("btn_check_yanked"))
             self.btn_install_local.config(text=self.t("btn_install_local"))
             self.btn_autoremove.config(text=self.t("btn_autoremove"))
 
@@ -563,10 +808,16 @@ class PipPackageManager:
                     text=self.t("delete_pypi_index_btn"))
             if self.tab3_paths_frame:
                 self.tab3_paths_frame.config(text=self.t("options_paths_title"))
+                if self.selected_python_executable in self._paths_cache:
+                    self._render_paths_listbox(
+                        self._paths_cache[self.selected_python_executable])
             if self.tab3_find_venvs_btn:
                 self.tab3_find_venvs_btn.config(text=self.t("btn_find_venvs"))
+            if self.tab3_import_vuln_db_btn:
+                self.tab3_import_vuln_db_btn.config(text=self.t("btn_import_vulnerability_db"))
             if self.venv_selection_frame:
                 self.venv_selection_label.config(text=self.t("venv_selection_label"))
+                self._update_venv_combobox_values()
 
         except (tk.TclError, AttributeError) as e:
             self.log_message(self.t("log_gui_update_error").format(e=e), "ERROR")
@@ -602,6 +853,9 @@ class PipPackageManager:
             method=self.storage_method_var.get(),
             venv_paths=self.venv_paths
         )
+        # Die Konfigurationsdatei kann entstanden oder gelöscht worden sein.
+        self._paths_cache.clear()
+        self._update_paths_listbox()
 
     def _verify_registry_deletion(self):
         """Überprüft, ob der Registry-Eintrag gelöscht wurde."""
@@ -621,7 +875,7 @@ class PipPackageManager:
         """Löscht den Pip Index Cache."""
         def delete_in_thread():
             try:
-                cache_path = self._get_cache_path()
+                cache_path = self.engine.index_cache_path
                 if os.path.exists(cache_path):
                     os.remove(cache_path)
                     self.pypi_index_cache = []
@@ -630,7 +884,7 @@ class PipPackageManager:
             except (IOError, OSError):
                 pass
 
-        threading.Thread(target=delete_in_thread, daemon=True).start()
+        self.scheduler.submit(delete_in_thread, "delete_pypi_index", LANE_BACKGROUND)
 
     def _save_venvs_to_config(self):
         """Speichert die aktuelle Liste der venvs in der Konfigurationsdatei."""
@@ -639,16 +893,12 @@ class PipPackageManager:
     # --- Logging und Status ---
 
     def log_message(self, message, level="INFO"):
-        """Fügt eine Nachricht zum In-Memory-Log hinzu."""
+        """Fügt eine Nachricht zum begrenzten In-Memory-Log hinzu (threadsicher)."""
         timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        full_message = f"{timestamp} [{level}] {message}"
-        self.log_records.append(full_message)
-        if hasattr(self, 'log_window') and self.log_window and self.log_window.winfo_exists():
-            self.log_window.log_text_widget.insert(tk.END, full_message + "\n")
+        self.log_store.append(f"{timestamp} [{level}] {message}")
 
     def show_log_window(self):
         """Erstellt und zeigt das Log-Fenster an."""
-        self.log_window = getattr(self, 'log_window', None) # Ensure log_window exists or is None
         if self.log_window and self.log_window.winfo_exists():
             self.log_window.lift()
             return
@@ -663,12 +913,106 @@ class PipPackageManager:
             command=self.log_window.log_text_widget.yview
         )
         self.log_window.log_text_widget.config(yscrollcommand=log_scrollbar.set)
+        if TRACER.enabled:
+            trace_frame = tk.Frame(self.log_window)
+            trace_frame.pack(side=tk.BOTTOM, fill=tk.X)
+            ttk.Button(trace_frame, text=self.t("btn_trace_summary"),
+                       command=self.log_trace_summary).pack(side=tk.LEFT, padx=5, pady=5)
+            ttk.Button(trace_frame, text=self.t("btn_trace_export"),
+                       command=self.export_trace).pack(side=tk.LEFT, padx=5, pady=5)
         log_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.log_window.log_text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.log_window.log_text_widget.bind(
             "<Button-3>", lambda e: self.show_text_context_menu(e, self.log_window.log_text_widget))
-        self.log_window.log_text_widget.insert(tk.END, "\n".join(self.log_records) + "\n")
+        self.log_window.protocol("WM_DELETE_WINDOW", self._close_log_window)
+        records = self.log_store.attach_consumer()
+        self.log_window.log_text_widget.insert(tk.END, "\n".join(records) + "\n")
         self.log_window.log_text_widget.see(tk.END)
+        self.log_window.after(LOG_FLUSH_INTERVAL_MS, self._flush_log_window)
+
+    def show_tasks_window(self):
+        """Zeigt laufende, wartende und zuletzt beendete Hintergrundaufgaben an."""
+        if self.tasks_window and self.tasks_window.winfo_exists():
+            self.tasks_window.lift()
+            return
+        self.tasks_window = tk.Toplevel(self.root)
+        self.tasks_window.title(self.t("tasks_window_title"))
+        self.tasks_window.geometry("700x350")
+        columns = ("lane", "state", "duration")
+        tree = ttk.Treeview(self.tasks_window, columns=columns)
+        tree.heading("#0", text=self.t("tasks_col_name"))
+        tree.heading("lane", text=self.t("tasks_col_lane"))
+        tree.heading("state", text=self.t("tasks_col_state"))
+        tree.heading("duration", text=self.t("tasks_col_duration"))
+        tree.column("#0", width=360)
+        for column in columns:
+            tree.column(column, width=100, anchor="w")
+        button_frame = tk.Frame(self.tasks_window)
+        button_frame.pack(side=tk.BOTTOM, fill=tk.X)
+        ttk.Button(button_frame, text=self.t("tasks_btn_cancel"),
+                   command=lambda: [self.scheduler.cancel(int(item)) for item in tree.selection()]
+                   ).pack(side=tk.LEFT, padx=5, pady=5)
+        tree.pack(fill=tk.BOTH, expand=True)
+
+        def refresh():
+            if not self.tasks_window or not self.tasks_window.winfo_exists():
+                return
+            selected = tree.selection()
+            tree.delete(*tree.get_children())
+            for task in self.scheduler.tasks():
+                duration = f"{task.duration:.1f} s" if task.duration is not None else ""
+                tree.insert("", tk.END, iid=str(task.task_id), text=task.name,
+                            values=(self.t(f"task_lane_{task.lane}"),
+                                    self.t(f"task_state_{task.state}"), duration))
+            tree.selection_set([item for item in selected if tree.exists(item)])
+            self.tasks_window.after(500, refresh)
+        refresh()
+
+    def log_trace_summary(self):
+        """Schreibt die Zusammenfassung der Zeitmessungen ins Log."""
+        self.log_message(self.t("log_trace_summary_title"))
+        for line in TRACER.format_summary():
+            self.log_message(line)
+
+    def export_trace(self):
+        """Exportiert die Zeitmessungen als Chrome-Trace-JSON."""
+        path = filedialog.asksaveasfilename(
+            parent=self.log_window, title=self.t("btn_trace_export"),
+            defaultextension=".json", initialfile="pip_paket_manager_trace.json",
+            filetypes=[("Chrome Trace", "*.json"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            count = TRACER.export_chrome_trace(path)
+            self.log_message(self.t("log_trace_exported").format(count=count, path=path))
+        except OSError as e:
+            self.log_message(self.t("log_trace_export_error").format(e=e), "ERROR")
+
+    def _close_log_window(self):
+        """Schließt das Log-Fenster und beendet das Puffern für die Anzeige."""
+        self.log_store.detach_consumer()
+        if self.log_window:
+            self.log_window.destroy()
+        self.log_window = None
+
+    def _flush_log_window(self):
+        """Überträgt wartende Log-Zeilen gebündelt in das Log-Fenster (GUI-Thread)."""
+        if not self.log_window or not self.log_window.winfo_exists():
+            self.log_store.detach_consumer()
+            return
+        lines = self.log_store.drain(LOG_FLUSH_MAX_LINES)
+        if lines:
+            text_widget = self.log_window.log_text_widget
+            at_bottom = text_widget.yview()[1] >= 0.999
+            text_widget.insert(tk.END, "\n".join(lines) + "\n")
+            # Widget auf die Größe des Ringpuffers begrenzen
+            line_count = int(text_widget.index("end-1c").split(".")[0]) - 1
+            excess = line_count - self.log_store.max_records
+            if excess > 0:
+                text_widget.delete("1.0", f"{excess + 1}.0")
+            if at_bottom:
+                text_widget.see(tk.END)
+        self.log_window.after(LOG_FLUSH_INTERVAL_MS, self._flush_log_window)
 
     def update_status_label(self, text_key, show=True):
         """Aktualisiert das zentrale Status-Label sicher aus jedem Thread.""" # pylint: disable=unused-private-member
@@ -689,92 +1033,285 @@ class PipPackageManager:
         """Macht die Fortschrittsbalken sichtbar und startet die Animation."""
         if self.progress_frame_tab1:
             self.progress_frame_tab1.grid()
+            self.progress_bar_tab1.config(mode="indeterminate")
             self.progress_bar_tab1.start()
         if self.progress_frame_tab2:
             self.progress_frame_tab2.grid()
+            self.progress_bar_tab2.config(mode="indeterminate")
             self.progress_bar_tab2.start()
 
+    def set_progress_steps(self, step, total):
+        """Schaltet die Fortschrittsbalken auf eine bestimmte Schrittanzeige um."""
+        for bar in (self.progress_bar_tab1, self.progress_bar_tab2):
+            if not bar:
+                continue
+            if str(bar.cget("mode")) != "determinate":
+                bar.stop()
+                bar.config(mode="determinate")
+            bar.config(maximum=total, value=step)
+
     def stop_progress(self):
         """Stoppt die Animation und blendet die Fortschrittsbalken aus."""
         if self.progress_frame_tab1:
             self.progress_bar_tab1.stop()
+            self.progress_bar_tab1.config(mode="indeterminate", value=0)
             self.progress_frame_tab1.grid_remove()
         if self.progress_frame_tab2:
             self.progress_bar_tab2.stop()
+            self.progress_bar_tab2.config(mode="indeterminate", value=0)
             self.progress_frame_tab2.grid_remove()
 
-    # --- Pip- und Daten-Logik ---
+    def _poll_pip_progress(self, reporter, last_revision=-1):
+        """Überträgt den Pip-Fortschritt im festen Takt in die GUI (GUI-Thread)."""
+        try:
+            revision, text, step, total, finished = reporter.snapshot()
+            if revision != last_revision:
+                if self.progress_label:
+                    self.progress_label.config(
+                        text=f"[{step}/{total}] {text}" if total else text)
+                if total:
+                    self.set_progress_steps(step, total)
+            if not finished:
+                self.root.after(reporter.interval_ms,
+                                lambda: self._poll_pip_progress(reporter, revision))
+        except (tk.TclError, RuntimeError):
+            pass
 
-    def run_pip_command(self, command_list, on_finish=None, show_progress=True):
-        """Führt einen Pip-Befehl in einem separaten Prozess aus."""
-        def task():
-            if show_progress:
-                self.root.after(0, self.start_progress)
+    # --- Pip- und Daten-Logik ---
 
-            pm = PackageManager(self.selected_python_executable, self.log_message)
+    def _execute_pip(self, command_list, reporter, python_executable, line_callback=None):
+        """Führt einen Pip-Befehl im angegebenen Interpreter blockierend aus (Rückgabewert)."""
+        pm = PackageManager(python_executable, self.log_message)
 
-            def line_handler(line):
-                self.log_message(line, level="PIP")
-                if show_progress and self.progress_label:
-                    self.root.after(0, lambda l=line: self.progress_label.config(text=l))
+        def line_handler(line):
+            self.log_message(line, level="PIP")
+            reporter.feed(line)
+            if line_callback:
+                line_callback(line)
 
-            start_msg = self.t("log_pip_command_start").format(
-                executable=os.path.basename(pm.python_executable),
-                command=' '.join(command_list))
-            self.log_message(start_msg)
-            if show_progress and self.progress_label:
-                self.root.after(0, lambda: self.progress_label.config(text=start_msg))
+        start_msg = self.t("log_pip_command_start").format(
+            executable=os.path.basename(pm.python_executable),
+            command=' '.join(command_list))
+        self.log_message(start_msg)
+        reporter.set_text(start_msg)
 
+        return_code = None
+        try:
             return_code = pm.run_command(command_list, line_callback=line_handler)
-
+        finally:
             end_msg = self.t("log_pip_command_finish").format(code=return_code)
             self.log_message(end_msg, level="STATUS")
-            if show_progress and self.progress_label:
-                self.root.after(0, lambda: self.progress_label.config(text=end_msg))
+            reporter.set_text(end_msg)
+        return return_code
 
+    def _run_pip_task(self, work, on_finish=None, show_progress=True, name="pip"):
+        """
+        Führt `work(reporter, python_executable)` mit Fortschrittsanzeige in der
+        Pip-Spur des Schedulers aus.
+
+        Der Interpreter wird beim Einreihen festgelegt und dient zugleich als
+        Schlüssel: Pip-Aufrufe für dieselbe Umgebung laufen nacheinander in der
+        Reihenfolge, in der sie angefordert wurden, auch wenn zwischenzeitlich
+        eine andere Umgebung gewählt wird.
+        """
+        executable = self.selected_python_executable
+
+        def task():
+            reporter = PipProgressReporter()
+            if show_progress:
+                self.ui.post(self.start_progress, key="progress")
+                self.ui.post(lambda: self._poll_pip_progress(reporter))
             try:
-                if on_finish:
-                    self.root.after(100, on_finish)
+                work(reporter, executable)
             finally:
-                if show_progress:
-                    self.root.after(0, self.stop_progress)
-        threading.Thread(target=task, daemon=True).start()
+                reporter.finish()
+                try:
+                    if on_finish:
+                        self.ui.post_later(100, on_finish)
+                finally:
+                    if show_progress:
+                        self.ui.post_later(reporter.interval_ms, self.stop_progress)
+        self.scheduler.submit(task, name, LANE_PIP, key=executable)
 
-    def load_packages(self, on_finish=None):
-        """Lädt installierte und veraltete Pakete und aktualisiert die GUI."""
-        def do_load():
-            self.root.after(0, self.start_progress)
+    def run_pip_command(self, command_list, on_finish=None, show_progress=True):
+        """Führt einen Pip-Befehl in einem separaten Prozess aus."""
+        self._run_pip_task(lambda reporter, executable: self._execute_pip(command_list, reporter,
+                                                                          executable),
+                           on_finish, show_progress, name="pip " + " ".join(command_list))
+
+    def install_via_wheelhouse(self, requirement, pip_options=(), on_finish=None):
+        """
+        Installiert eine exakte Anforderung ('name==version') bevorzugt aus dem Wheelhouse.
+
+        Liegen das Paket und alle noch nicht installierten Abhängigkeiten bereits
+        lokal vor, wird ohne Netzwerk installiert. Andernfalls lädt Pip die Dateien
+        zunächst ins Wheelhouse herunter, von wo aus installiert wird; schlägt
+        auch das fehl, wird normal installiert.
+        """
+        name, _sep, version = requirement.partition("==")
+        pip_options = list(pip_options)
+        offline_cmd = (["install", "--no-index", "--find-links", self.wheelhouse.find_links_path]
+                       + pip_options + [requirement])
+
+        def install_offline(reporter, executable):
+            used_files = []
+
+            def collect_used(line):
+                line = line.strip()
+                if line.startswith("Processing "):
+                    used_files.append(os.path.basename(line.split(maxsplit=1)[1]))
+
+            return_code = self._execute_pip(offline_cmd, reporter, executable, collect_used)
+            if return_code == 0:
+                self.wheelhouse.touch(used_files)
+            return return_code
+
+        def offline_ready(executable):
+            """Prüft vor dem Offline-Versuch, ob alle benötigten Wheels im Speicher liegen."""
+            if not self.wheelhouse.find(name, version):
+                return False
+            if "--no-deps" in pip_options:
+                return True
+            # Versionen und Marker der Zielumgebung, nicht des laufenden Interpreters
             try:
-                self.log_message(self.t("log_loading_packages"))
-                self.root.after(
-                    0, lambda: self.progress_label.config(text=self.t("status_loading_installed")))
-                pm = PackageManager(self.selected_python_executable, self.log_message)
-                packages = pm.get_installed()
-                self.installed_packages_cache = packages
-                self.root.after(0, lambda: self.update_listbox_safely(packages))
-                self.root.after(0, lambda: self.update_status_label(None, show=False))
-
-                self.root.after(100, lambda: self.update_status_label("status_checking_updates"))
-                self.root.after(
-                    100, lambda: self.progress_label.config(text=self.t("status_checking_updates")))
-                self.outdated_packages_cache = pm.get_outdated()
-                self.load_security_packages_check(pm)
-
-                self.root.after(0, self.colorize_outdated_packages)
-                self.root.after(0, lambda: self.update_status_label(None, show=False))
-                self.root.after(0, lambda: self.progress_label.config(text=""))
-                self.log_message(self.t("log_finished_loading"))
-                if on_finish:
-                    self.root.after(100, on_finish)
+                engine = self._selected_engine(executable)
+                installed = engine.installed_versions()
+                environment = engine.marker_environment()
+            except (OSError, subprocess.SubprocessError, ValueError):
+                return True  # Nicht prüfbar: Offline-Versuch wie ohne Prüfung
+            missing = self.wheelhouse.missing_requirements(name, version, installed, environment)
+            if missing:
+                self.log_message(self.t("log_wheelhouse_missing_deps").format(
+                    requirement=requirement, missing=", ".join(sorted(missing))), "DEBUG")
+                return False
+            # None: nur ein sdist im Speicher, Abhängigkeiten unbekannt -> Versuch wagen
+            return True
+
+        def work(reporter, executable):
+            if offline_ready(executable) and install_offline(reporter, executable) == 0:
+                self.log_message(self.t("log_wheelhouse_offline_install").format(requirement))
+                return
+            self.log_message(self.t("log_wheelhouse_fetch").format(requirement))
+            incoming_dir = self.wheelhouse.new_incoming_dir()
+            download_cmd = (["download", "--dest", incoming_dir]
+                            + [o for o in pip_options if o == "--no-deps"] + [requirement])
+            try:
+                if self._execute_pip(download_cmd, reporter, executable) == 0:
+                    self.wheelhouse.import_directory(incoming_dir)
+                    if install_offline(reporter, executable) == 0:
+                        return
+            except OSError as e:
+                self.log_message(self.t("log_wheelhouse_error").format(e=e), "ERROR")
             finally:
-                self.root.after(0, self.stop_progress)
-        threading.Thread(target=do_load, daemon=True).start()
+                shutil.rmtree(incoming_dir, ignore_errors=True)
+            self._execute_pip(["install"] + pip_options + [requirement], reporter, executable)
+
+        self._run_pip_task(work, on_finish, name=f"pip install {requirement}")
+
+    def load_packages(self, on_finish=None):
+        """
+        Lädt installierte, veraltete und unsichere Pakete parallel und
+        aktualisiert die GUI, sobald die jeweilige Stufe fertig ist.
+        """
+        self.ui.post(self.start_progress, key="progress")
+        self.log_message(self.t("log_loading_packages"))
+        # Nach Installationen oder einem Umgebungswechsel werden die betroffenen Records
+        # beim nächsten Zugriff verworfen
+        self.detail_prefetcher.cancel()
+        self.package_details.mark_stale()
+        trace_span = TRACER.start("load_packages")
+        self.ui.configure(self.progress_label, text=self.t("status_loading_installed"))
+
+        def on_installed(packages):
+            self.installed_packages_cache = packages
+            self.ui.post(lambda: self.update_listbox_safely(packages), key="package_list")
+            self.ui.configure(self.progress_label, text=self.t("status_checking_updates"))
+
+        def on_outdated(outdated):
+            self.outdated_packages_cache = outdated
+            self.ui.post(self.colorize_outdated_packages, key="colorize_outdated")
+
+        executable = self.selected_python_executable
+
+        def on_install_times(install_times):
+            if executable != self.selected_python_executable:
+                return  # Zeitpunkte einer inzwischen abgewählten Umgebung
+            self.install_times_cache = install_times
+            if self.package_sort_var.get() != "name" or self.install_filter_days_var.get():
+                self.ui.post(lambda: self.update_listbox_safely(self.installed_packages_cache),
+                             key="package_list")
+
+        def on_missing_deps(packages_with_missing_deps):
+            self.missing_deps_packages_cache = packages_with_missing_deps
+            self.ui.post(self.colorize_outdated_packages, key="colorize_outdated")
+
+        def on_stage_error(stage_name):
+            def handler(error):
+                self.log_message(self.t("log_load_stage_failed").format(
+                    stage=stage_name, e=error), "ERROR")
+            return handler
+
+        def on_pipeline_finished(pipeline):
+            trace_span.end()
+            for stage_name, duration in pipeline.timings.items():
+                self.log_message(self.t("log_load_stage_timing").format(
+                    stage=stage_name, seconds=duration), "DEBUG")
+            self.log_message(self.t("log_load_pipeline_timing").format(
+                seconds=pipeline.total_duration), "DEBUG")
+            self.ui.post(lambda: self.update_status_label(None, show=False), key="status_label")
+            self.log_message(self.t("log_finished_loading"))
+            if on_finish:
+                self.ui.post_later(100, on_finish)
+            self.ui.post(self.stop_progress, key="progress")
+
+        def new_pm():
+            return PackageManager(self.selected_python_executable, self.log_message)
+
+        def traced(stage_name, func):
+            return TRACER.traced(f"load_packages.{stage_name}")(func)
+
+        pipeline = TaskPipeline(
+            submit=lambda job: self.scheduler.submit(job, "load_packages", LANE_INTERACTIVE))
+        pipeline.add_stage("installed", traced("installed",
+                           lambda: self._pip_query("installed", lambda: new_pm().get_installed())),
+                           on_result=on_installed, on_error=on_stage_error("installed"))
+        pipeline.add_stage("outdated", traced("outdated",
+                           lambda: self._pip_query("outdated", lambda: new_pm().get_outdated())),
+                           on_result=on_outdated, on_error=on_stage_error("outdated"))
+        pipeline.add_stage("security",
+                           traced("security", lambda: self.load_security_packages_check(new_pm())),
+                           on_result=lambda _: self.ui.post(self.colorize_security_packages,
+                                                            key="colorize_security"),
+                           on_error=on_stage_error("security"))
+        pipeline.add_stage("install_times",
+                           traced("install_times",
+                                  lambda: self._selected_engine(executable).install_times()),
+                           on_result=on_install_times, on_error=on_stage_error("install_times"))
+        pipeline.add_stage("missing_deps",
+                           traced("missing_deps", self._find_packages_with_missing_deps),
+                           on_result=on_missing_deps, on_error=on_stage_error("missing_deps"))
+        pipeline.run(on_finish=on_pipeline_finished)
+
+    def _pip_query(self, cmd, fallback, python_executable=None):
+        """
+        Beantwortet eine lesende Pip-Abfrage über den warmen Hilfsprozess.
+
+        Schlägt der Hilfsprozess fehl, wird `fallback()` (ein einzelner
+        Pip-Aufruf über den PackageManager) verwendet. Ohne `python_executable`
+        gilt der gewählte Interpreter.
+        """
+        try:
+            return self.pip_helpers.query(python_executable or self.selected_python_executable,
+                                          cmd)
+        except PipHelperError as e:
+            self.log_message(self.t("log_pip_helper_fallback").format(cmd=cmd, e=e), "DEBUG")
+            return fallback()
 
     # --- Aktionen und Event-Handler ---
 
     def refresh_package_list(self, on_finish=None):
         """Leert die Paketliste und startet den Ladevorgang neu."""
-        self.package_listbox.delete(0, tk.END)
+        self.package_list_view.clear()
         self.log_message(self.t("log_refreshing"))
         self.load_packages(on_finish=on_finish)
 
@@ -848,9 +1385,8 @@ class PipPackageManager:
                 """Wird aufgerufen, nachdem die Paketliste neu geladen wurde."""
                 try:
                     try:
-                        items = self.package_listbox.get(0, tk.END)
-                        if pkg_name in items:
-                            idx = items.index(pkg_name)
+                        idx = self.package_list_view.index_of(pkg_name)
+                        if idx is not None:
                             self.package_listbox.selection_clear(0, tk.END)
                             self.package_listbox.selection_set(idx)
                             self.package_listbox.see(idx)
@@ -858,13 +1394,17 @@ class PipPackageManager:
                     except (ValueError, tk.TclError):
                         pass  # Paket nicht gefunden oder Fenster geschlossen
                 finally:
-                    self.root.after(0, self.stop_progress)
+                    self.ui.post(self.stop_progress, key="progress")
 
             if self._handle_conflicts(pkg_name, None, "log_update_cancelled"):
-                self.run_pip_command(["install", "--upgrade", pkg_name],
-                lambda: self.refresh_package_list(on_finish=reselect_after_refresh))
+                on_finish = lambda: self.refresh_package_list(on_finish=reselect_after_refresh)
+                latest = self.outdated_packages_cache.get(pkg_name, {}).get("latest")
+                if latest:
+                    self.install_via_wheelhouse(f"{pkg_name}=={latest}", on_finish=on_finish)
+                else:
+                    self.run_pip_command(["install", "--upgrade", pkg_name], on_finish)
 
-        threading.Thread(target=do_update, daemon=True).start()
+        self.scheduler.submit(do_update, "update_package", LANE_INTERACTIVE)
 
     def reinstall_package(self, pkg_name):
         """Installiert ein Paket neu mit Dependency Resolution."""
@@ -878,9 +1418,9 @@ class PipPackageManager:
 
                 if self._handle_conflicts(
                     pkg_name, current_version, "log_reinstall_cancelled"):
-                    cmd = ["install", "--force-reinstall", "--no-deps",
-                           f"{pkg_name}=={current_version}"]
-                    self.run_pip_command(cmd, self.refresh_package_list)
+                    self.install_via_wheelhouse(
+                        f"{pkg_name}=={current_version}", ["--force-reinstall", "--no-deps"],
+                        self.refresh_package_list)
             except importlib.metadata.PackageNotFoundError:
                 self.log_message(
                     self.t("log_could_not_determine_version").format(pkg_name), "WARNING")
@@ -888,7 +1428,7 @@ class PipPackageManager:
                     ["install", "--force-reinstall",
                      "--no-deps", pkg_name], self.refresh_package_list)
 
-        threading.Thread(target=do_reinstall, daemon=True).start()
+        self.scheduler.submit(do_reinstall, "reinstall_package", LANE_INTERACTIVE)
 
     def get_selected_packages(self):
         """Gibt eine Liste der ausgewählten Pakete zurück."""
@@ -933,6 +1473,7 @@ class PipPackageManager:
             return
 
         def do_install_local():
+            from packaging import utils as packaging_utils
             filename = os.path.basename(file_path)
             pkg_name = None
             version = None
@@ -974,7 +1515,7 @@ class PipPackageManager:
             self.log_message(self.t("log_install_local_file").format(file_path))
             self.run_pip_command(["install", file_path], on_finish=self.refresh_package_list)
 
-        threading.Thread(target=do_install_local, daemon=True).start()
+        self.scheduler.submit(do_install_local, "install_local_package", LANE_INTERACTIVE)
 
     def install_dependencies(self, deps_to_install):
         """Installiert eine Liste von Abhängigkeiten mit Dependency Resolution."""
@@ -1028,7 +1569,7 @@ class PipPackageManager:
                 ["install"] + deps_to_install, on_finish=self.refresh_package_list
             )
 
-        threading.Thread(target=do_install_deps, daemon=True).start()
+        self.scheduler.submit(do_install_deps, "install_dependencies", LANE_INTERACTIVE)
 
     def on_package_selection_changed(self, _event=None):
         """Wird aufgerufen, wenn sich die Paketauswahl ändert."""
@@ -1051,21 +1592,38 @@ class PipPackageManager:
     def show_package_listbox_context_menu(self, event):
         """Zeigt ein Kontextmenü bei Rechtsklick auf die Paket-Listbox."""
         selection = self.package_listbox.curselection()
-        if not selection:
+        if not selection and self.package_listbox.size():
             self.package_listbox.selection_set(self.package_listbox.nearest(event.y))
             selection = self.package_listbox.curselection()
 
-        if not selection:
-            return
-
-        pkg_name = self.package_listbox.get(selection[0])
-
         context_menu = tk.Menu(self.root, tearoff=False)
-        context_menu.add_command(
-            label=self.t("context_copy"), command=lambda: self.copy_package_name(pkg_name))
-        context_menu.add_separator()
-        context_menu.add_command(
-            label=self.t("context_search"), command=lambda: self.search_package(pkg_name))
+        # Sortierung und Filter bleiben auch bei leerer (weggefilterter) Liste erreichbar
+        if selection:
+            pkg_name = self.package_listbox.get(selection[0])
+            context_menu.add_command(
+                label=self.t("context_copy"), command=lambda: self.copy_package_name(pkg_name))
+            context_menu.add_separator()
+            context_menu.add_command(
+                label=self.t("context_search"), command=lambda: self.search_package(pkg_name))
+            context_menu.add_separator()
+
+        sort_menu = tk.Menu(context_menu, tearoff=False)
+        for value, label_key in (("name", "context_sort_name"),
+                                 ("install_date", "context_sort_install_date")):
+            sort_menu.add_radiobutton(label=self.t(label_key), value=value,
+                                      variable=self.package_sort_var,
+                                      command=self.rearrange_package_list)
+        context_menu.add_cascade(label=self.t("context_sort_by"), menu=sort_menu)
+
+        filter_menu = tk.Menu(context_menu, tearoff=False)
+        filter_menu.add_radiobutton(label=self.t("context_filter_all"), value=0,
+                                    variable=self.install_filter_days_var,
+                                    command=self.rearrange_package_list)
+        for days in INSTALL_DATE_FILTER_DAYS:
+            filter_menu.add_radiobutton(label=self.t("context_filter_last_days").format(days=days),
+                                        value=days, variable=self.install_filter_days_var,
+                                        command=self.rearrange_package_list)
+        context_menu.add_cascade(label=self.t("context_filter_installed"), menu=filter_menu)
 
         try:
             context_menu.tk_popup(event.x_root, event.y_root)
@@ -1144,6 +1702,7 @@ class PipPackageManager:
         except tk.TclError:
             self.log_message(self.t("log_clipboard_access_error"), "WARNING")
 
+    @TRACER.traced("show_package_info")
     def show_package_info(self, _event=None):
         """Zeigt Informationen zu einem ausgewählten Paket an."""
         selection = self.package_listbox.curselection()
@@ -1152,256 +1711,148 @@ class PipPackageManager:
         if self.progress_label:
             self.progress_label.config(text="")
         pkg_name = self.package_listbox.get(selection[0])
+        # Jede neue Auswahl verdrängt die vorherige; nur das neueste Ergebnis wird angezeigt
+        token = self._info_requests.begin(pkg_name)
+        if self._info_after_id is not None:
+            self.root.after_cancel(self._info_after_id)
+            self._info_after_id = None
+
+        detail = self.detail_cache.get(pkg_name)
+        if detail is not None and self.package_details.is_current(detail[0]):
+            self._show_package_detail(pkg_name, detail)
+            self._prefetch_package_details(selection[0])
+            return
+
+        self.btn_install_deps.config(state=tk.DISABLED, command=None)
         self.info_text.delete("1.0", tk.END)
-        self.log_message(self.t("log_fetching_info").format(pkg_name))
         self.info_text.insert(tk.END, self.t("loading_info").format(pkg_name) + "\n")
 
+        @TRACER.traced("show_package_info.fetch")
         def fetch_and_show():
-            """
-            Fetches package info and displays it in the GUI.
-
-            Disables the 'Install dependencies' button while fetching the package information.
-            If the package has missing dependencies, it enables the button with a command
-            to install the dependencies.
-            If the package is outdated, updates the progress label with an update message.
-            Finally, calls display_formatted_info with the fetched information to display it
-            in the GUI.
-            """
-            self.root.after(
-                0, lambda: self.btn_install_deps.config(state=tk.DISABLED, command=None))
-            dist = importlib.metadata.distribution(pkg_name)
-            info_string = self.get_package_info_string(pkg_name, dist)
-
-            pypi_data = self.pypi_api.get_package_info(pkg_name)
-            pypi_info = None
-            if pypi_data:
-                pypi_info = {'data': pypi_data.get('info', {})}
-                if dist.version and dist.version in pypi_data.get("releases", {}):
-                    release_data = pypi_data["releases"][dist.version]
-                    if release_data:
-                        pypi_info["yanked"] = release_data[0].get(
-                            "yanked", False
-                        )
-                        pypi_info["yanked_reason"] = release_data[0].get(
-                            "yanked_reason", "N/A"
-                        )
-
-            install_time = self.get_install_time(pkg_name)
-            missing_deps = self.get_missing_deps(dist)
+            """Lädt die Details im Worker-Thread und zeigt sie an, falls die Auswahl noch gilt."""
+            try:
+                loaded = self._load_package_detail(pkg_name, token)
+            except OperationCancelled:
+                return
+            self.detail_cache.put(pkg_name, loaded)
 
-            if missing_deps:
-                def on_install_deps():
-                    self.install_dependencies(missing_deps)
+            def show():
+                if self._info_requests.is_current(token):
+                    self._show_package_detail(pkg_name, loaded)
+            self.ui.post(show)
 
-                self.root.after(0, lambda: self.btn_install_deps.config(
-                    state=tk.NORMAL,
-                    command=on_install_deps
-                ))
+        def start():
+            self._info_after_id = None
+            if token.cancelled:
+                return
+            self.log_message(self.t("log_fetching_info").format(pkg_name))
+            self.scheduler.submit(fetch_and_show, f"show_package_info {pkg_name}",
+                                  LANE_INTERACTIVE, token=token)
+            self._prefetch_package_details(selection[0])
 
-            if pkg_name in self.outdated_packages_cache:
-                update_info = self.outdated_packages_cache[pkg_name]
-                update_text = self.t("update_available").format(
-                    update_info['current'], update_info['latest']
-                )
-                if self.progress_label:
-                    self.root.after(0, lambda: self.progress_label.config(text=update_text))
+        self._info_after_id = self.root.after(INFO_SELECTION_DELAY_MS, start)
 
-            self.root.after(
-                0, lambda: self.display_formatted_info(info_string, pypi_info, install_time, missing_deps, pkg_name)
-            )
-        threading.Thread(target=fetch_and_show, daemon=True).start()
-
-    def get_package_info_string(self, pkg_name, dist):
-        """Erstellt den Info-String für ein Paket."""
-        metadata = dist.metadata
-
-        # --- Robuste Extraktion der Metadaten ---
-        # Homepage: Prüft zuerst Project-URL (Homepage, dann Source), dann Home-page
-        homepage = "N/A"
-        project_urls = metadata.get_all('Project-URL') or []
-
-        for url_entry in project_urls:
-            if url_entry.lower().startswith("homepage,"):
-                homepage = url_entry.split(',')[1].strip()
-                break
-        # Priorität 2 (NEU): Suche nach "Source" oder "Source code" als Fallback
-        if homepage == "N/A":
-            for url_entry in project_urls:
-                if (url_entry.lower().startswith("source,") or
-                        url_entry.lower().startswith("source code,")):
-                    homepage = url_entry.split(',')[1].strip()
-                    break
-        # Priorität 3: Fallback auf das alte "Home-page"-Feld
-        if homepage == "N/A":
-            homepage = metadata.get('Home-page', 'N/A')
-
-        # Author: Prüft zuerst Author-email, dann Author
-        author = metadata.get('Author-email') or metadata.get('Author', 'N/A')
-
-        # KORREKTUR: Mehrstufige, robuste Lizenz-Extraktion
-        license_info = "N/A"
-        # Priorität 1 (NEU): Das präzise 'License-Expression'-Feld.
-        license_expression = metadata.get(
-            'License-Expression'
-        )
-        if license_expression:
-            license_info = license_expression
-        else:
-            # Priorität 2 (NEU): Lese die erste Zeile aus der Lizenzdatei.
-            license_files = getattr(dist, 'license_files', [])
-            if license_files:
-                try:
-                    license_text = dist.read_text(license_files[0])
-                    # Nimm die erste Zeile, aber nur wenn sie nicht Ã¼bermÃ¤Ãig lang ist
-                    # und nicht wie eine URL aussieht.
-                    if license_text and len(
-                        license_text.splitlines()[0]
-                        )< 100 and "http" not in license_text.splitlines()[0]:
-                        license_info = license_text.splitlines()[0].strip()
-                except (FileNotFoundError, OSError, IndexError):
-                    pass  # Wenn das Lesen fehlschlägt, gehen wir zum nächsten Fallback.
-        if license_info == "N/A":
-            # Priorität 3 (Fallback): Das alte 'License'-Feld.
-            license_info = metadata.get('License', 'N/A')
-
-        requires_dist = metadata.get_all('Requires-Dist') or []
-        dependencies_str = ', '.join(requires_dist) if requires_dist else ''
+    def _load_package_detail(self, pkg_name, token=None):
+        """
+        Sammelt alle Angaben für die Detailansicht (Worker-Thread, ohne GUI-Zugriff).
 
+        Returns: (PackageDetail, pypi_info)
+        Raises: OperationCancelled, sobald `token` abgebrochen wurde.
+        """
+        record = self.package_details.get(pkg_name)
+        if token:
+            token.raise_if_cancelled()
+
+        with TRACER.span("pypi.get_package_info", package=pkg_name):
+            pypi_data = self.engine.index.get_package_info(pkg_name)
+        pypi_info = None
+        if pypi_data:
+            # Die lange Projektbeschreibung wird nicht angezeigt und bliebe sonst im Cache
+            pypi_info = {'data': {key: value for key, value in pypi_data.get('info', {}).items()
+                                  if key != "description"}}
+            if record.version and record.version in pypi_data.get("releases", {}):
+                release_data = pypi_data["releases"][record.version]
+                if release_data:
+                    pypi_info["yanked"] = release_data[0].get(
+                        "yanked", False
+                    )
+                    pypi_info["yanked_reason"] = release_data[0].get(
+                        "yanked_reason", "N/A"
+                    )
+        if token:
+            token.raise_if_cancelled()
+        return record, pypi_info
+
+    def _show_package_detail(self, pkg_name, detail):
+        """Zeigt geladene Details an und setzt Abhängigkeits-Button und Update-Hinweis."""
+        record, pypi_info = detail
+        missing_deps = list(record.missing_deps)
+        if missing_deps:
+            self.btn_install_deps.config(
+                state=tk.NORMAL, command=lambda: self.install_dependencies(missing_deps))
+        else:
+            self.btn_install_deps.config(state=tk.DISABLED, command=None)
+
+        if pkg_name in self.outdated_packages_cache and self.progress_label:
+            update_info = self.outdated_packages_cache[pkg_name]
+            self.progress_label.config(text=self.t("update_available").format(
+                update_info['current'], update_info['latest']))
+
+        self.display_formatted_info(self.get_package_info_string(record), pypi_info,
+                                    record.install_time, missing_deps, pkg_name)
+
+    def _prefetch_package_details(self, row):
+        """Lädt die Details der Nachbarzeilen und danach der sichtbaren Zeilen vor."""
+        packages = self.package_list_view.packages
+        first, last = self.package_list_view.visible_range()
+        near = [row + offset for distance in range(1, DETAIL_PREFETCH_RADIUS + 1)
+                for offset in (distance, -distance)]
+        rows = near + [r for r in range(first, last + 1) if r not in near and r != row]
+        self.detail_prefetcher.prefetch(packages[r] for r in rows if 0 <= r < len(packages))
+
+    def get_package_info_string(self, record):
+        """Erstellt den Info-String für ein Paket aus seinem PackageDetail-Record."""
         info_lines = [
-            f"{self.t('info_name')}: {metadata.get('Name', 'N/A')}",
-            f"{self.t('info_version')} (installiert): {metadata.get('Version', 'N/A')}",
-            f"{self.t('info_summary')}: {metadata.get('Summary', 'N/A')}",
-            f"{self.t('info_homepage')}: {homepage}",
-            f"{self.t('info_author')}: {author}",
-            f"{self.t('info_license')}: {license_info}",
-            f"{self.t('info_location')}: {dist.locate_file('')}",
-            f"{self.t('info_dependencies')}: {dependencies_str}",
-            f"{self.t('info_required_by')}: {', '.join(self.get_required_by(pkg_name))}"
+            f"{self.t('info_name')}: {record.name or 'N/A'}",
+            f"{self.t('info_version')} (installiert): {record.version or 'N/A'}",
+            f"{self.t('info_summary')}: {record.summary}",
+            f"{self.t('info_homepage')}: {record.homepage}",
+            f"{self.t('info_author')}: {record.author}",
+            f"{self.t('info_license')}: {record.license}",
+            f"{self.t('info_location')}: {record.location}",
+            f"{self.t('info_dependencies')}: {', '.join(record.requires)}",
+            f"{self.t('info_required_by')}: {', '.join(record.required_by)}"
         ]
         return "\n\n".join(info_lines)
 
     def get_install_time(self, pkg_name):
-        """Liest das Installationsdatum eines Pakets."""
-        try:
-            dist = importlib.metadata.distribution(pkg_name)
-            path = dist.locate_file('')
-            if path and os.path.exists(path):
-                return datetime.datetime.fromtimestamp(os.path.getmtime(path))
-        except (importlib.metadata.PackageNotFoundError, FileNotFoundError, OSError):
-            pass
-        return None
+        """Installationsdatum eines Pakets aus dem beim Laden der Liste erstellten Index."""
+        return self.install_times_cache.get(normalize_name(pkg_name))
 
     def get_missing_deps(self, dist):
         """Prüft auf fehlende Abhängigkeiten für eine Distribution."""
-        missing_deps = []
-        requires_dist = dist.metadata.get_all('Requires-Dist') or []
-        if requires_dist:
-            installed_normalized = {
-                p.lower().replace("_", "-") for p in self.installed_packages_cache}
-            for req in requires_dist:
-                try:
-                    from packaging.requirements import Requirement, InvalidRequirement
-                    parsed = Requirement(req)
-                    req_name = parsed.name
-                    req_spec = req.split(';')[0].strip() if ';' in req else req # pylint: disable=unused-variable
-                except InvalidRequirement:
-                    req_name = req.split(' ')[0].split('[')[0].split(';')[0].split(
-                        '!=')[0].split('<')[0].split('>')[0].split('=')[0].strip()
-                    req_spec = req.split(';')[0].strip() if ';' in req else req
-                if req_name.lower().replace("_", "-") not in installed_normalized:
-                    missing_deps.append(req_spec)
-        return missing_deps
+        return self.engine.get_missing_deps(dist, self.installed_packages_cache)
 
     def get_required_by(self, pkg_name):
         """Findet alle Pakete, die von `pkg_name` abhängen."""
-        requiring_packages = []
-        normalized_pkg_name = pkg_name.replace("_", "-").lower()
-        for dist in importlib.metadata.distributions():
-            requires_dist = dist.metadata.get_all('Requires-Dist') or []
-            if requires_dist:
-                for req in requires_dist:
-                    try:
-                        from packaging.requirements import Requirement, InvalidRequirement
-                        parsed = Requirement(req)
-                        req_name = parsed.name
-                    except InvalidRequirement:
-                        req_name = req.split(' ')[0].split('[')[0].split(';')[0].split(
-                            '!=')[0].split('<')[0].split('>')[0].split('=')[0].strip()
-                    if req_name.replace("_", "-").lower() == normalized_pkg_name:
-                        requiring_packages.append(dist.metadata['name'])
-        return sorted(requiring_packages, key=str.lower)
-
-    def get_all_dependencies(self, pkg_name, visited=None):
-        """Sammelt alle direkten Abhängigkeiten eines Pakets."""
-        if visited is None: # pylint: disable=singleton-comparison
-            visited = set()
-        if pkg_name.lower() in visited:
-            return []
-        visited.add(pkg_name.lower())
+        return self.engine.get_required_by(pkg_name, self.package_details.graph())
 
-        dependencies = []
-        try:
-            dist = importlib.metadata.distribution(pkg_name)
-            requires_dist = dist.metadata.get_all('Requires-Dist') or []
-            for req in requires_dist:
-                try:
-                    from packaging.requirements import Requirement, InvalidRequirement
-                    parsed = Requirement(req)
-                    req_name = parsed.name
-                except InvalidRequirement:
-                    req_name = req.split(' ')[0].split('[')[0].split(';')[0].split(
-                        '!=')[0].split('<')[0].split('>')[0].split('=')[0].strip()
-                dependencies.append(req_name)
-        except importlib.metadata.PackageNotFoundError:
-            pass
-        return dependencies
+    def get_all_dependencies(self, pkg_name):
+        """Sammelt alle direkten Abhängigkeiten eines Pakets."""
+        return self.engine.get_all_dependencies(pkg_name, self.package_details.graph())
 
     def find_removable_packages(self, pkg_name):
         """Findet Abhängigkeiten, die nur von pkg_name benötigt werden."""
-        dependencies = self.get_all_dependencies(pkg_name)
-        if not dependencies:
-            return []
-
-        removable = []
-        for dep in dependencies:
-            required_by = self.get_required_by(dep)
-            if required_by == [pkg_name]:
-                removable.append(dep)
-
-        return removable
-
-    def _should_apply_requirement(self, marker_part):
-        """Prüft, ob ein Requirement-Marker auf das aktuelle System zutrifft."""
-        if not marker_part:
-            return True
-
-        # Vereinfachte Prüfung für die häufigsten Fälle
-        if 'sys_platform' in marker_part:
-            is_windows = sys.platform.startswith('win')
-            if "'win32'" in marker_part and not is_windows:
-                return False
-            if "'linux'" in marker_part and is_windows:
-                return False
-            if "'darwin'" in marker_part and not sys.platform.startswith('darwin'):
-                return False
-        return True
+        return self.engine.find_removable_packages(pkg_name, self.package_details.graph())
 
     def autoremove_packages(self):
         """Entfernt Abhängigkeiten, die von keinem anderen Paket mehr benötigt werden."""
         all_packages = self.installed_packages_cache.copy() if self.installed_packages_cache else []
-        packages_to_remove = []
-
-        for pkg in all_packages:
-            required_by = self.get_required_by(pkg)
-            if not required_by:
-                dependencies_of = []
-                for other_pkg in all_packages:
-                    if other_pkg.lower() != pkg.lower():
-                        if pkg in self.get_all_dependencies(other_pkg):
-                            dependencies_of.append(other_pkg)
-
-                if not dependencies_of and pkg not in ['pip', 'setuptools', 'wheel']:
-                    packages_to_remove.append(pkg)
+        # Die Liste zeigt die gewählte Umgebung; die Engine kann nach einem Wechsel noch
+        # die vorherige sein
+        executable = self.selected_python_executable
+        engine = self._selected_engine(executable)
+        packages_to_remove = engine.autoremove_candidates(all_packages)
 
         if packages_to_remove:
             msg = self.t(
@@ -1417,39 +1868,10 @@ class PipPackageManager:
                     msg + "\n\n" + self.t("autoremove_confirm_question")):
                 def uninstall_packages():
                     """Deinstalliert alle markierten Pakete synchron und fängt Fehler ab."""
-                    self.root.after(0, self.start_progress)
-                    successful_removals = []
-                    failed_removals = []
-
-                    for pkg in packages_to_remove:
-                        try:
-                            result = subprocess.run(
-                                [sys.executable, "-m", "pip", "uninstall", "-y", pkg],
-                                capture_output=True,
-                                text=True,
-                                check=False,
-                                timeout=60
-                            )
-                            if result.returncode == 0:
-                                successful_removals.append(pkg)
-                                self.log_message(self.t("log_autoremove_success").format(pkg=pkg))
-                            else:
-                                error_text = result.stderr if result.stderr else result.stdout
-                                failed_removals.append((pkg, error_text))
-                                self.log_message(
-                                    self.t(
-                                        "log_autoremove_error").format(pkg=pkg, error=error_text),
-                                        "ERROR")
-                        except subprocess.TimeoutExpired:
-                            error_text = self.t("log_autoremove_timeout").format(pkg=pkg)
-                            failed_removals.append((pkg, error_text))
-                            self.log_message(error_text, "ERROR")
-                        except subprocess.SubprocessError as e:
-                            failed_removals.append((pkg, str(e)))
-                            self.log_message(
-                                self.t("log_autoremove_error").format(pkg=pkg, error=e), "ERROR")
-
-                    self.root.after(0, self.refresh_package_list)
+                    self.ui.post(self.start_progress, key="progress")
+                    successful_removals, failed_removals = engine.uninstall(packages_to_remove)
+
+                    self.ui.post(self.refresh_package_list)
 
                     def show_result():
                         if failed_removals:
@@ -1473,132 +1895,20 @@ class PipPackageManager:
                                     count=len(successful_removals))
                             )
 
-                    self.root.after(3500, show_result)
+                    self.ui.post_later(3500, show_result)
 
-                threading.Thread(target=uninstall_packages, daemon=True).start()
+                self.scheduler.submit(uninstall_packages, "autoremove", LANE_PIP, key=executable)
         else:
             messagebox.showinfo(self.t("autoremove_dialog_title"),
                 self.t("autoremove_no_packages_found"))
 
-    def check_cross_package_conflicts(self, target_dep_name, target_specifier):
-        """Prüft, ob andere installierte Pakete
-        eine inkompatible Version einer Abhängigkeit benötigen.
-
-        Returns: List of (package_name, their_requirement_string) tuples that conflict
-        """
-        from packaging.requirements import Requirement, InvalidRequirement
-        from packaging.specifiers import SpecifierSet
-
-        conflicting_packages = []
-
-        try:
-            target_spec = SpecifierSet(target_specifier) if target_specifier else None
-
-            for dist in importlib.metadata.distributions():
-                requires_dist = dist.metadata.get_all('Requires-Dist') or []
-                pkg_dist_name = dist.metadata['name']
-
-                for req in requires_dist:
-                    try:
-                        req_clean = req.split(';')[0].strip()
-                        marker_part = req.split(';')[1].strip() if ';' in req else None
-                        if not self._should_apply_requirement(marker_part):
-                            continue
-
-                        parsed = Requirement(req_clean)
-                        if parsed.name.lower().replace("_", "-") == target_dep_name.lower().replace("_", "-"):
-                            other_spec = str(parsed.specifier) if parsed.specifier else ""
-
-                            if target_spec and other_spec:
-                                other_spec_obj = SpecifierSet(other_spec)
-                                if not target_spec & other_spec_obj:
-                                    self.log_message(
-                                        self.t("log_cross_package_conflict").format(
-                                            pkg_dist_name=pkg_dist_name, req_clean=req_clean,
-                                            target_dep_name=target_dep_name,
-                                            target_specifier=target_specifier),
-                                        "DEBUG"
-                                    )
-                    except InvalidRequirement: # pylint: disable=broad-except
-                        pass
-        except (ValueError, KeyError) as e:
-            self.log_message(self.t("log_cross_package_conflict_error").format(e), "DEBUG")
-
-        return conflicting_packages
-
-    def _get_package_requirements(self, pkg_name, version=None):
-        """Holt die Liste der Abhängigkeiten für ein Paket, entweder lokal oder von PyPI."""
-        try:
-            dist_name = f"{pkg_name}=={version}" if version else pkg_name
-            dist = importlib.metadata.distribution(dist_name)
-            self.log_message(self.t("log_using_local_metadata").format(pkg_name), "DEBUG")
-            return dist.metadata.get_all('Requires-Dist') or []
-        except importlib.metadata.PackageNotFoundError:
-            self.log_message(self.t("log_local_metadata_unavailable"), "DEBUG")
-            data = self.pypi_api.get_package_info(pkg_name)
-            if data:
-                return data.get('info', {}).get('requires_dist') or []
-            return []
-
-    def _process_single_requirement(self, req, required_packages, conflicts, cross_conflicts):
-        """Verarbeitet eine einzelne Anforderung, prüft Marker und findet Konflikte."""
-        from packaging.requirements import InvalidRequirement, Requirement
-        from packaging.specifiers import SpecifierSet
-
-        try:
-            req_clean = req.split(';')[0].strip()
-            if not req_clean:
-                return
-
-            marker_part = req.split(';')[1].strip() if ';' in req else None
-            if not self._should_apply_requirement(marker_part):
-                return
-
-            parsed_req = Requirement(req_clean)
-            req_name = parsed_req.name
-            specifier = str(parsed_req.specifier) if parsed_req.specifier else ""
-
-            if req_name.lower().replace(
-                "_", "-") not in {p.lower().replace(
-                    "_", "-") for p in ['pip', 'setuptools', 'wheel']}:
-                required_packages.append((req_name, specifier))
-
-                try:
-                    current_version = importlib.metadata.version(req_name)
-                    if specifier and current_version not in SpecifierSet(specifier):
-                        conflicts.append((req_name, current_version, specifier))
-                        self.log_message(
-                            self.t("log_dependency_conflict").format(
-                                req_name, current_version, specifier), "DEBUG")
-                except importlib.metadata.PackageNotFoundError:
-                    self.log_message(
-                        self.t("log_dependency_not_installed").format(req_name), "DEBUG")
-
-                cross_pkg_conflicts = self.check_cross_package_conflicts(req_name, specifier)
-                if cross_pkg_conflicts:
-                    cross_conflicts[req_name] = cross_pkg_conflicts
-
-        except InvalidRequirement as e:
-            self.log_message(self.t("log_parse_requirement_error").format(req, e), "DEBUG")
-
+    @TRACER.traced("resolve_dependencies")
     def resolve_dependencies(self, pkg_name, version=None):
         """Resolves dependencies for a package and detects conflicts.
 
-        Returns: (can_install, required_packages, conflicts)
+        Returns: (can_install, required_packages, conflicts, cross_conflicts)
         """
-        required_packages = []
-        conflicts = []
-        cross_conflicts = {}
-
-        try:
-            requires_dist = self._get_package_requirements(pkg_name, version)
-            for req in requires_dist:
-                self._process_single_requirement(req, required_packages, conflicts, cross_conflicts)
-        except (packaging.specifiers.InvalidSpecifier, requests.RequestException) as e:
-            self.log_message(self.t("log_dependency_resolution_error").format(e), "WARNING")
-
-        return (len(conflicts) == 0 and len(cross_conflicts) == 0,
-                required_packages, conflicts, cross_conflicts)
+        return self.engine.resolve_dependencies(pkg_name, version, self.package_details.graph())
 
     def _build_conflict_message(self, conflicts, cross_conflicts):
         """Erstellt die formatierte Textnachricht für den Konfliktdialog."""
@@ -1874,8 +2184,8 @@ class PipPackageManager:
                     self.t("log_python_launcher_not_found")]
             except FileNotFoundError:
                 lines = [self.t("log_python_launcher_not_found")]
-            self.root.after(0, lambda: self.update_python_version_display(lines))
-        threading.Thread(target=do_load, daemon=True).start()
+            self.ui.post(lambda: self.update_python_version_display(lines), key="python_versions")
+        self.scheduler.submit(do_load, "load_python_versions", LANE_BACKGROUND)
 
     def update_python_version_display(self, lines):
         """Aktualisiert die Anzeige der Python-Versionen."""
@@ -1991,11 +2301,11 @@ class PipPackageManager:
                     winreg.CloseKey(key)
                     winreg.DeleteKey(winreg.HKEY_CURRENT_USER, reg_path)
 
-                self.root.after(3000, self._verify_registry_deletion)
+                self.ui.post_later(3000, self._verify_registry_deletion)
             except (OSError, ImportError) as e:
                 self.log_message(self.t("log_registry_delete_error").format(e=e), "ERROR")
 
-        threading.Thread(target=do_delete, daemon=True).start()
+        self.scheduler.submit(do_delete, "delete_registry_entry", LANE_BACKGROUND)
 
     def _verify_registry_deletion(self):
         """Prüft nach 3 Sekunden, ob die Registry gelöscht wurde."""
@@ -2032,7 +2342,7 @@ class PipPackageManager:
         """Löscht den PyPI Index."""
         def do_delete():
             try:
-                cache_path = self._get_cache_path()
+                cache_path = self.engine.index_cache_path
                 if os.path.exists(cache_path):
                     os.remove(cache_path)
                     self.log_message(self.t("log_pypi_index_deleted_path").format(path=cache_path))
@@ -2043,7 +2353,7 @@ class PipPackageManager:
             except (IOError, OSError) as e:
                 self.log_message(self.t("log_pypi_index_delete_error").format(e=e), "ERROR")
 
-        threading.Thread(target=do_delete, daemon=True).start()
+        self.scheduler.submit(do_delete, "delete_pypi_index", LANE_BACKGROUND)
 
     def _get_config_file_path(self):
         """Gibt den Pfad zur Konfigurationsdatei zurück."""
@@ -2159,34 +2469,50 @@ class PipPackageManager:
         try:
             if not self.root.winfo_exists():
                 return
-            self.package_listbox.delete(0, tk.END)
-            for pkg in packages:
-                self.package_listbox.insert(tk.END, pkg)
-            self.status_label.config(text=self.t("status_loaded").format(len(packages)))
+            shown = self._arrange_packages(packages)
+            self.package_list_view.set_packages(shown)
+            self._apply_package_status()
+            if len(shown) == len(packages):
+                self.status_label.config(text=self.t("status_loaded").format(len(packages)))
+            else:
+                self.status_label.config(text=self.t("status_loaded_filtered").format(
+                    shown=len(shown), total=len(packages)))
         except (tk.TclError, RuntimeError):
             pass
 
+    def _arrange_packages(self, packages):
+        """Wendet Installationsdatum-Filter und Sortierung an (nur über den Zeitpunkt-Index)."""
+        days = self.install_filter_days_var.get()
+        if days:
+            packages = installed_since(packages, self.install_times_cache, days)
+        if self.package_sort_var.get() == "install_date":
+            packages = sort_by_install_time(packages, self.install_times_cache)
+        return packages
+
+    def rearrange_package_list(self):
+        """Zeigt die geladene Paketliste mit der aktuellen Sortierung und Filterung neu an."""
+        self.update_listbox_safely(self.installed_packages_cache)
+
+    def _apply_package_status(self):
+        """Überträgt die Status-Caches an die Paketliste (färbt nur sichtbare Zeilen)."""
+        if not self.package_list_view:
+            return
+        self.package_list_view.set_status(
+            outdated=self.outdated_packages_cache,
+            vulnerable=self.security_packages_cache,
+            missing_deps=self.missing_deps_packages_cache)
+
     def colorize_outdated_packages(self):
         """Färbt veraltete Pakete in der Liste ein."""
-        for i in range(self.package_listbox.size()):
-            pkg_name = self.package_listbox.get(i)
-            if pkg_name in self.security_packages_cache:
-                self.package_listbox.itemconfig(i, {'bg': '#FF7F7F'})
-            elif pkg_name in self.outdated_packages_cache:
-                self.package_listbox.itemconfig(i, {'bg': '#B6F0A5'})
-            else:
-                self.package_listbox.itemconfig(i, {'bg': ''})
+        self._apply_package_status()
 
     def colorize_security_packages(self):
         """Färbt Pakete mit Sicherheitslücken rot ein."""
-        for i in range(self.package_listbox.size()):
-            pkg_name = self.package_listbox.get(i)
-            if pkg_name in self.security_packages_cache:
-                self.package_listbox.itemconfig(i, {'bg': '#FF7F7F'})
-            elif pkg_name in self.outdated_packages_cache:
-                self.package_listbox.itemconfig(i, {'bg': '#B6F0A5'})
-            else:
-                self.package_listbox.itemconfig(i, {'bg': ''})
+        self._apply_package_status()
+
+    def _find_packages_with_missing_deps(self):
+        """Ermittelt in einem Durchlauf alle Pakete mit fehlenden Abhängigkeiten."""
+        return self.engine.packages_with_missing_deps()
 
     # --- Methoden für Tab 2 (Suche) ---
 
@@ -2204,29 +2530,13 @@ class PipPackageManager:
             self.load_pypi_index()
             return
         self.log_message(self.t("log_filtering_index").format(query))
-        filtered_packages = [pkg for pkg in self.pypi_index_cache if query.lower() in pkg.lower()]
-        self.root.after(0, lambda: self.update_search_results(filtered_packages, query))
-
-    def _read_pypi_cache_from_disk(self):
-        """Liest den PyPI-Index-Cache von der Festplatte."""
-        if os.path.exists(self.pypi_cache_path):
-            try:
-                with open(self.pypi_cache_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                self.log_message(self.t("log_cache_read_error").format(e), "WARNING")
-        return None
-
-    def _write_pypi_cache_to_disk(self, data):
-        """Schreibt den PyPI-Index-Cache auf die Festplatte."""
-        try:
-            with open(self.pypi_cache_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f)
-        except IOError as e:
-            self.log_message(self.t("log_cache_write_error").format(e), "ERROR")
+        filtered_packages = self.engine.search(self.pypi_index_cache, query)
+        self.ui.post(lambda: self.update_search_results(filtered_packages, query),
+                     key="search_results")
 
     def load_pypi_index(self): # NEU: Umbenannt von get_pypi_info
         """Lädt den PyPI-Paketindex vom lokalen Cache und aktualisiert ihn mit Delta-Updates."""
+        @TRACER.traced("load_pypi_index")
         def do_load():
             """
             Loads the PyPI package index from the local cache and updates it with delta updates.
@@ -2236,46 +2546,22 @@ class PipPackageManager:
             Der Cache wird nur aktualisiert, wenn die geladene Daten neuere sind als die im Cache.
             """
 
-            self.root.after(0, self.start_progress)
-            cache_data = self._read_pypi_cache_from_disk()
+            self.ui.post(self.start_progress, key="progress")
+            cache_data = self.engine.read_index_cache()
             last_serial = 0
             if cache_data:
                 self.pypi_index_cache = cache_data.get('packages', [])
                 last_serial = cache_data.get('last_serial', 0)
                 self.log_message(self.t("log_loaded_from_cache").format(len(self.pypi_index_cache)))
-            elif not last_serial:
-                self.root.after(0, lambda: self.update_status_label("status_loading_index"))
-
-            if last_serial:
-                self.log_message(self.t("log_checking_updates_since").format(last_serial))
-
-            data = self.pypi_api.update_package_index(last_serial)
-
-            if data:
-                new_serial = data.get('meta', {}).get('_last-serial', last_serial)
-                new_packages = [p['name'] for p in data.get('projects', [])]
+            else:
+                self.ui.post(lambda: self.update_status_label("status_loading_index"), key="status_label")
 
-                if new_packages:
-                    if last_serial == 0:  # Full load
-                        self.pypi_index_cache = sorted(new_packages, key=str.lower)
-                        self.log_message(
-                            self.t("log_full_index_loaded").format(len(self.pypi_index_cache)))
-                    else:  # Delta update
-                        existing_packages_set = set(self.pypi_index_cache)
-                        added_packages = [
-                            pkg for pkg in new_packages if pkg not in existing_packages_set]
-                        if added_packages:
-                            self.pypi_index_cache.extend(added_packages)
-                            self.pypi_index_cache.sort(key=str.lower)
-                            self.log_message(f"Applied {len(added_packages)} updates. Total: {len(self.pypi_index_cache)}.")
-
-                if new_serial > last_serial:
-                    self._write_pypi_cache_to_disk(
-                        {'last_serial': new_serial, 'packages': self.pypi_index_cache})
+            self.pypi_index_cache, _serial = self.engine.update_index(
+                self.pypi_index_cache, last_serial)
 
             if self.progress_frame_tab1.winfo_ismapped() or self.progress_frame_tab2.winfo_ismapped():
-                self.root.after(0, self.stop_progress)
-        threading.Thread(target=do_load, daemon=True).start()
+                self.ui.post(self.stop_progress, key="progress")
+        self.scheduler.submit(do_load, "load_pypi_index", LANE_BACKGROUND)
 
     def update_search_results(self, packages, query):
         """Aktualisiert die Suchergebnis-Listbox."""
@@ -2298,15 +2584,16 @@ class PipPackageManager:
         self.search_info_text.delete("1.0", tk.END)
         self.search_info_text.insert(tk.END, self.t("loading_info").format(pkg_name))
         self.search_info_text.config(state=tk.DISABLED)
-        threading.Thread(
-            target=self._fetch_and_display_versions, args=(pkg_name,), daemon=True).start()
+        self.scheduler.submit(lambda: self._fetch_and_display_versions(pkg_name),
+                              f"show_package_versions {pkg_name}", LANE_INTERACTIVE)
 
     def _fetch_and_display_versions(self, pkg_name):
         """Hintergrund-Task zum Abrufen und Anzeigen von Versionen."""
+        import packaging.version
         self.current_package_version_details_cache.clear()
         pypi_data = self.fetch_pypi_package_releases(pkg_name)
         if not pypi_data:
-            self.root.after(0, self._update_search_info_text, self.t("no_info"))
+            self.ui.post(lambda: self._update_search_info_text(self.t("no_info")))
             return
         releases = pypi_data.get('releases', {})
         compatible_versions_info = []
@@ -2320,15 +2607,17 @@ class PipPackageManager:
                         (packaging.version.parse(version_str), filename, dist_data))
                     self.current_package_version_details_cache[filename] = dist_data
         compatible_versions_info.sort(key=lambda x: x[0], reverse=True)
-        self.root.after(0, self._update_version_listbox, compatible_versions_info)
+        self.ui.post(lambda: self._update_version_listbox(compatible_versions_info))
 
     def _is_compatible(self, filename, packagetype):
         """Prüft, ob ein Release-File mit dem System kompatibel ist."""
+        import packaging.utils
+        import packaging.version
         if packagetype == 'sdist':
             return True
         if packagetype == 'bdist_wheel':
             try:
-                _name, _version, _build, wheel_tags = packaging_utils.parse_wheel_filename(filename)
+                _name, _version, _build, wheel_tags = packaging.utils.parse_wheel_filename(filename)
                 return not self.current_system_tags.isdisjoint(wheel_tags)
             except (packaging.utils.InvalidWheelFilename,
                     packaging.version.InvalidVersion, ValueError):
@@ -2357,7 +2646,7 @@ class PipPackageManager:
         """Ruft Release-Daten von PyPI ab und speichert sie im Cache."""
         if pkg_name in self.pypi_package_releases_cache:
             return self.pypi_package_releases_cache[pkg_name]
-        data = self.pypi_api.get_package_info(pkg_name)
+        data = self.engine.index.get_package_info(pkg_name)
         if data:
             self.pypi_package_releases_cache[pkg_name] = data
         return data
@@ -2446,9 +2735,10 @@ class PipPackageManager:
             messagebox.showerror(self.t("error_title"), self.t("select_package_version_first_msg"))
             return
 
+        import packaging.utils
         version_to_install = self.t("selected_version_fallback")
         try:
-            _name, parsed_version, _build, _tags = packaging_utils.parse_wheel_filename(
+            _name, parsed_version, _build, _tags = packaging.utils.parse_wheel_filename(
                 selected_filename)
             version_to_install = str(parsed_version)
         except packaging.utils.InvalidWheelFilename:
@@ -2486,54 +2776,62 @@ class PipPackageManager:
                                     self.t("log_upgrade_package").format(pkg_name_conflict))
                                 self.run_pip_command(["install", "--upgrade", pkg_name_conflict])
 
-                self.run_pip_command(
-                    ["install", f"{pkg_name}=={version_to_install}"],
-                    on_finish=self.refresh_package_list)
-
-            threading.Thread(target=do_install, daemon=True).start()
-
-    def _schedule_periodic_update(self, update_function, interval_ms):
-        """Plant eine Funktion zur periodischen Ausführung."""
-        def wrapper():
-            try: # pylint: disable=unused-variable
-                if self.root.winfo_exists():
-                    update_function()
-                    self._options_paths_after_id = self.root.after(interval_ms, wrapper)
-            except (tk.TclError, RuntimeError):
-                # Fenster wurde möglicherweise geschlossen
-                pass
-        # Starten Sie die erste Ausführung
-        self._options_paths_after_id = self.root.after(interval_ms, wrapper)
+                self.install_via_wheelhouse(
+                    f"{pkg_name}=={version_to_install}", on_finish=self.refresh_package_list)
 
-    def _get_pip_cache_dir(self):
-        """Ermittelt das Pip-Cache-Verzeichnis."""
-        try:
-            # Führen Sie den Befehl aus, um das Cache-Verzeichnis zu erhalten
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "cache", "dir"],
-                capture_output=True, text=True, check=True, encoding='utf-8'
-            )
-            return result.stdout.strip()
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return None
+            self.scheduler.submit(do_install, "install_selected_version", LANE_INTERACTIVE)
 
-    def _update_paths_listbox(self):
-        """Aktualisiert die Listbox mit den wichtigen Pfaden."""
-        new_entries = [] # pylint: disable=unused-variable
+    def _get_pip_cache_dir(self, python_executable=None):
+        """Ermittelt das Pip-Cache-Verzeichnis (Standard: des gewählten Interpreters)."""
+        python_executable = python_executable or self.selected_python_executable
 
-        # 1. Pip Cache Pfad
-        pip_cache_path = self._get_pip_cache_dir()
+        def run_pip_cache_dir():
+            try:
+                # Führen Sie den Befehl aus, um das Cache-Verzeichnis zu erhalten
+                result = subprocess.run(
+                    [python_executable, "-m", "pip", "cache", "dir"],
+                    capture_output=True, text=True, check=True, encoding='utf-8'
+                )
+                return result.stdout.strip()
+            except (subprocess.CalledProcessError, FileNotFoundError):
+                return None
+        return self._pip_query("cache_dir", run_pip_cache_dir, python_executable)
+
+    def _compute_paths(self, python_executable):
+        """Ermittelt die wichtigen Pfade für einen Interpreter (Hintergrund-Thread)."""
+        paths = []
+        pip_cache_path = self._get_pip_cache_dir(python_executable)
         if pip_cache_path:
-            label = self.t('options_paths_pypi_index') # pylint: disable=unused-variable
-            entry = f"{label}: {pip_cache_path}" # pylint: disable=unused-variable
-            new_entries.append(entry)
-
-        # 2. Konfigurationsdatei-Pfad
+            paths.append(('options_paths_pypi_index', pip_cache_path))
         config_path = self.config_manager.config_path
         if os.path.exists(config_path):
-            entry = (f"{self.t('options_paths_config_file')}: " +
-                     config_path)
-            new_entries.append(entry)
+            paths.append(('options_paths_config_file', config_path))
+        return paths
+
+    def _update_paths_listbox(self):
+        """
+        Aktualisiert die Listbox mit den wichtigen Pfaden.
+
+        Die Pfade werden einmal pro Interpreter ermittelt und zwischengespeichert;
+        eine Neuberechnung erfolgt nur nach einem venv-Wechsel oder einer
+        Änderung der Einstellungen (dort wird der Cache geleert).
+        """
+        executable = self.selected_python_executable
+        if executable in self._paths_cache:
+            self._render_paths_listbox(self._paths_cache[executable])
+            return
+
+        def compute():
+            paths = self._compute_paths(executable)
+            self._paths_cache[executable] = paths
+            if executable == self.selected_python_executable:
+                self.ui.post(lambda: self._render_paths_listbox(paths), key="paths_listbox")
+
+        self.scheduler.submit(compute, "update_paths", LANE_INTERACTIVE)
+
+    def _render_paths_listbox(self, paths):
+        """Zeigt die zwischengespeicherten Pfade in der aktuellen Sprache an."""
+        new_entries = [f"{self.t(label_key)}: {path}" for label_key, path in paths]
 
         # Nur aktualisieren, wenn sich etwas geändert hat
         if new_entries != self._options_path_entries:
@@ -2554,13 +2852,67 @@ class PipPackageManager:
             return f".../{'/'.join(parts[-3:])}"
         return path
 
+    @staticmethod
+    def _format_size(num_bytes):
+        """Formatiert eine Byte-Anzahl menschenlesbar."""
+        size = float(num_bytes)
+        for unit in ("B", "KB", "MB", "GB"):
+            if size < 1024 or unit == "GB":
+                return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+            size /= 1024
+        return f"{size:.1f} GB"
+
+    def _venv_display_label(self, path):
+        """Erstellt den Dropdown-Eintrag einer venv inkl. Inventur-Informationen."""
+        label = self._format_venv_path(path)
+        info = self.venv_info_cache.get(path)
+        if info is None:
+            return label
+        if not info.alive:
+            return f"{label} ({self.t('venv_inventory_unreachable')})"
+        details = self.t("venv_inventory_details").format(
+            info.python_version or "?", info.package_count, self._format_size(info.disk_size))
+        return f"{label} ({details})"
+
+    def _start_venv_inventory(self, force=False):
+        """Untersucht alle gespeicherten venvs im Hintergrund."""
+        if not self.venv_paths:
+            return
+
+        def on_result(info):
+            self.venv_info_cache[info.path] = info
+            self.log_message(
+                f"venv inventory: {info.path} -> python={info.python_version}, "
+                f"tag={info.platform_tag}, packages={info.package_count}, "
+                f"size={info.disk_size}, alive={info.alive}", "DEBUG")
+            self._schedule_venv_combobox_refresh()
+
+        self.venv_inventory.probe_all(
+            list(self.venv_paths), on_result, force=force,
+            submit=lambda job: self.scheduler.submit(job, "venv_inventory", LANE_BACKGROUND))
+
+    def _schedule_venv_combobox_refresh(self):
+        """
+        Fasst mehrere Inventur-Ergebnisse zu einer Dropdown-Aktualisierung zusammen
+        (wird aus Worker-Threads aufgerufen).
+        """
+        if self._venv_combobox_refresh_pending:
+            return
+        self._venv_combobox_refresh_pending = True
+
+        def refresh():
+            self._venv_combobox_refresh_pending = False
+            self._update_venv_combobox_values()
+
+        self.ui.post_later(100, refresh)
+
     def _update_venv_combobox_values(self):
         """Aktualisiert die Einträge im venv-Dropdown-Menü."""
         if not self.venv_combobox:
             return
 
-        display_paths = [self.t(
-            "global_environment_label")] + [self._format_venv_path(p) for p in self.venv_paths]
+        self._venv_display_to_path = {self._venv_display_label(p): p for p in self.venv_paths}
+        display_paths = [self.t("global_environment_label")] + list(self._venv_display_to_path)
         self.venv_combobox['values'] = display_paths
 
         # Aktuelle Auswahl wiederherstellen oder auf Global setzen
@@ -2568,18 +2920,19 @@ class PipPackageManager:
             self.venv_var.set(self.t("global_environment_label"))
         else:
             from pathlib import Path
-            # Finde den passenden Anzeigepfad für den ausgewählten Executable-Pfad
-            selected_venv_path = str(Path(self.selected_python_executable).parent.parent)
-            formatted_selected = self._format_venv_path(selected_venv_path)
-            if formatted_selected in display_paths:
-                self.venv_var.set(formatted_selected)
+            # Finde den passenden Anzeigeeintrag für den ausgewählten Interpreter
+            selected_venv_path = os.path.normcase(
+                os.path.normpath(str(Path(self.selected_python_executable).parent.parent)))
+            for display, path in self._venv_display_to_path.items():
+                if os.path.normcase(os.path.normpath(path)) == selected_venv_path:
+                    self.venv_var.set(display)
+                    break
             else:
                 self.venv_var.set(self.t("global_environment_label"))
 
     def on_venv_selected(self, event=None):
         """Wird aufgerufen, wenn eine venv im Dropdown ausgewählt wird.""" # pylint: disable=unused-argument
         selected_display_path = self.venv_var.get()
-        from pathlib import Path
 
         self.log_message(f"--- VENV SELECTION DIAGNOSTICS ---", "DEBUG")
         self.log_message(f"Selected display path: '{selected_display_path}'", "DEBUG")
@@ -2588,95 +2941,127 @@ class PipPackageManager:
             self.selected_python_executable = sys.executable
             self.log_message(f"Switched to global environment: {self.selected_python_executable}", "DEBUG")
         else:
-            found_match = False
-            # Finde den vollständigen Pfad basierend auf dem angezeigten Pfad
-            for full_path in self.venv_paths:
-                formatted_path = self._format_venv_path(full_path)
-                self.log_message(f"Comparing with stored path: '{full_path}' (formatted: '{formatted_path}')", "DEBUG")
-                if formatted_path == selected_display_path:
-                    # Normalisiere den Pfad, um gemischte Slashes zu korrigieren
-                    full_path = os.path.normpath(full_path)
-                    self.log_message(f"MATCH FOUND! Using normalized full path: {full_path}", "DEBUG")
-
-                    scripts_path = Path(full_path) / 'Scripts'
-                    # Suche flexibel nach python.exe oder pythonw.exe
-                    if (scripts_path / 'python.exe').exists():
-                        self.selected_python_executable = str(scripts_path / 'python.exe')
-                    elif (scripts_path / 'pythonw.exe').exists():
-                        self.selected_python_executable = str(scripts_path / 'pythonw.exe')
-                    else:
-                        # Fallback, falls keine der beiden gefunden wird
-                        self.selected_python_executable = str(scripts_path / 'python.exe')
-                    found_match = True
-                    break
-            if not found_match:
+            full_path = self._venv_display_to_path.get(selected_display_path)
+            if full_path is None:
                 self.log_message(f"NO MATCH FOUND for '{selected_display_path}'. Keeping previous executable.", "ERROR")
+            else:
+                # Normalisiere den Pfad, um gemischte Slashes zu korrigieren
+                full_path = os.path.normpath(full_path)
+                self.log_message(f"MATCH FOUND! Using normalized full path: {full_path}", "DEBUG")
+                python_executable = find_venv_python(full_path)
+                if python_executable is None:
+                    # Fallback, falls kein Interpreter gefunden wird
+                    python_executable = (os.path.join(full_path, 'Scripts', 'python.exe')
+                                         if sys.platform == "win32"
+                                         else os.path.join(full_path, 'bin', 'python'))
+                self.selected_python_executable = python_executable
+
+        self._update_paths_listbox()
+        self._retarget_engine(self.selected_python_executable)
+
+    def _retarget_engine(self, python_executable):
+        """
+        Richtet die Engine im Hintergrund auf die gewählte Umgebung aus und lädt
+        danach die Paketliste neu.
 
+        Bis dahin bleibt die bisherige Engine aktiv. Schnelle Wechsel laufen
+        nacheinander; übernommen wird nur die Engine der zuletzt gewählten Umgebung.
+        """
+        def work():
+            try:
+                engine = self.engine.for_environment(python_executable)
+            except (OSError, subprocess.SubprocessError, ValueError) as e:
+                # Interpreter antwortet nicht: site-packages der venv direkt lesen
+                self.log_message(self.t("log_engine_retarget_failed").format(
+                    python=python_executable, e=e), "WARNING")
+                venv_path = os.path.dirname(os.path.dirname(python_executable))
+                engine = self.engine.for_environment(
+                    python_executable, site_paths=find_site_packages(venv_path))
+            self.ui.post(lambda: self._apply_engine(engine), key="engine")
+
+        self.scheduler.submit(work, "retarget_engine", LANE_BACKGROUND, key="engine")
+
+    def _apply_engine(self, engine):
+        """Übernimmt die Engine der gewählten Umgebung und verwirft umgebungsbezogene Caches."""
+        if engine.python_executable != self.selected_python_executable:
+            return  # Inzwischen wurde eine andere Umgebung gewählt
+        self.engine = engine
+        self.detail_prefetcher.cancel()
+        self.detail_cache.clear()
+        self.package_details = PackageDetailStore(engine)
+        self.install_times_cache = {}
         self.refresh_package_list()
 
-    def find_venvs_in_path(self, search_path, progress_callback=None):
-        """Durchsucht einen Pfad rekursiv nach venv-Ordnern."""
-        found_venvs = []
-        for root, dirs, files in os.walk(search_path):
-            # Ignoriere häufige, große Ordner, um die Suche zu beschleunigen
-            if progress_callback: # pylint: disable=unused-variable
-                # Kürze den Pfad für eine bessere Anzeige
-                display_path = root if len(root) < 70 else "..." + root[-67:] # pylint: disable=unused-variable
-                progress_callback(display_path, len(found_venvs))
-            dirs[:] = [d for d in dirs if d not in ['$RECYCLE.BIN',
-                                                    'System Volume Information',
-                                                    'node_modules', '.git']]
-
-            if 'pyvenv.cfg' in files:
-                # Wir haben einen venv-Ordner gefunden!
-                # Der Pfad 'root' ist der Pfad zum venv-Ordner.
-                found_venvs.append(root)
-
-                # Nicht weiter in diesem Ordner suchen, um Zeit zu sparen
-                dirs[:] = []
-
-        return found_venvs
+    def find_venvs_in_path(self, search_path, progress_callback=None, cancel_event=None):
+        """Durchsucht einen Pfad parallel und inkrementell nach venv-Ordnern."""
+        scanner = VenvScanner(
+            os.path.join(os.path.dirname(self.pypi_cache_path), 'venv_scan_index.json'),
+            prune=self.venv_scan_prune)
+
+        def report(path, count):
+            # Kürze den Pfad für eine bessere Anzeige
+            display_path = path if len(path) < 70 else "..." + path[-67:]
+            progress_callback(display_path, count)
+
+        return scanner.scan(search_path,
+                            progress_callback=report if progress_callback else None,
+                            cancel_event=cancel_event)
 
     def start_venv_search(self):
-        """Startet die Suche nach venvs in einem Hintergrundthread."""
+        """Startet die Suche nach venvs im Hintergrund bzw. bricht eine laufende ab."""
+        if self._venv_search_cancel is not None:
+            self._venv_search_cancel.set()
+            return
+
         search_directory = filedialog.askdirectory(title=self.t("find_venvs_title"))
         if not search_directory:
             return
 
-        def update_progress_label(path, count): # pylint: disable=unused-variable
+        cancel_event = threading.Event()
+        self._venv_search_cancel = cancel_event
+        if self.tab3_find_venvs_btn:
+            self.tab3_find_venvs_btn.config(text=self.t("btn_cancel"))
+
+        def update_progress_label(path, count):
             """Sicheres Aktualisieren des GUI-Labels aus einem Thread."""
             status_text = (
                 f"{self.t('venv_search_found_label').format(count)} | "
                 f"{self.t('venv_search_path_label').format(path)}")
             if self.tab3_venv_search_status_label:
-                self.root.after(
-                    0, lambda: self.tab3_venv_search_status_label.config(text=status_text))
+                self.ui.configure(self.tab3_venv_search_status_label, text=status_text)
 
         def search_task():
-            self.root.after(0, self.start_progress)
+            self.ui.post(self.start_progress, key="progress")
             self.log_message(self.t("log_searching_venvs").format(search_directory))
 
             try:
                 venvs = self.find_venvs_in_path(
-                    search_directory, progress_callback=update_progress_label)
+                    search_directory, progress_callback=update_progress_label,
+                    cancel_event=cancel_event)
                 self.found_venvs_cache = venvs
+                if cancel_event.is_set():
+                    self.log_message(self.t("log_venv_search_cancelled"))
                 # Füge neue, einzigartige venvs zur Hauptliste hinzu und speichere
                 newly_found = [v for v in venvs if v not in self.venv_paths]
                 if newly_found:
                     self.venv_paths.extend(newly_found)
                     self.venv_paths.sort()
-                    self._update_venv_combobox_values() # <-- HIER WIEDER EINGEFÜGT
+                    self.ui.post(self._update_venv_combobox_values, key="venv_combobox")
                     self._save_venvs_to_config()
-                self.root.after(0, lambda: self.show_found_venvs(venvs))
+                    self._start_venv_inventory()
+                self.ui.post(lambda: self.show_found_venvs(venvs))
             finally:
-                self.root.after(0, self.stop_progress)
+                self._venv_search_cancel = None
+                self.ui.post(self.stop_progress, key="progress")
+                if self.tab3_find_venvs_btn:
+                    self.ui.configure(self.tab3_find_venvs_btn, text=self.t("btn_find_venvs"))
                 # Labels nach der Suche zurücksetzen
                 if self.tab3_venv_search_status_label:
-                    self.root.after(
+                    self.ui.post_later(
                         1000, lambda: self.tab3_venv_search_status_label.config(text=""))
                 self.log_message(self.t("log_venvs_found").format(len(self.found_venvs_cache)))
 
-        threading.Thread(target=search_task, daemon=True).start()
+        self.scheduler.submit(search_task, "venv_search", LANE_BACKGROUND)
 
     def show_found_venvs(self, venvs):
         """Zeigt die gefundenen venvs in einer Messagebox an."""
@@ -2719,80 +3104,212 @@ class PipPackageManager:
         if not save_path:
             return
 
-        def progress_handler(progress_percentage):
-            self.log_message(self.t("log_download_progress").format(progress_percentage))
+        filename = os.path.basename(save_path)
+        sha256 = file_data.get('digests', {}).get('sha256')
 
-        def do_download():
-            try:
-                self.log_message(self.t("log_download_url").format(download_url))
-                self.pypi_api.download_package(download_url, save_path, progress_handler)
-                self.log_message(self.t("log_download_success").format(save_path))
-                messagebox.showinfo(self.t("install_frame_title"),
-                                    self.t("download_success_message").format(save_path=save_path))
-            except (requests.RequestException, OSError, IOError) as e:
-                error_msg = self.t("download_failed").format(e=e)
-                self.log_message(error_msg, "ERROR")
-                messagebox.showerror(self.t("error_title"), error_msg)
-
-        threading.Thread(target=do_download, daemon=True).start()
+        def finish(path, error, verified):
+            self.ui.post(lambda: self._finish_download(filename, path, error, verified))
+
+        cached_path = self.wheelhouse.path_for(sha256)
+        if cached_path:
+            # Datei liegt bereits im Wheelhouse: nur kopieren, kein Netzwerk
+            def copy_from_wheelhouse():
+                try:
+                    shutil.copyfile(cached_path, save_path)
+                    self.wheelhouse.touch([selected_filename])
+                    self.log_message(self.t("log_wheelhouse_hit").format(selected_filename))
+                    finish(save_path, None, False)
+                except OSError as e:
+                    finish(None, e, False)
+            self.scheduler.submit(copy_from_wheelhouse, f"copy {filename}", LANE_BACKGROUND)
+            return
+
+        self._active_downloads[filename] = 0
+
+        def progress_handler(done, total):
+            percentage = int(done * 100 / total) if total else 0
+            self.ui.post(lambda: self._set_download_progress(filename, percentage),
+                         key=("download_progress", filename))
+
+        def on_done(path, error):
+            if error is None:
+                # Jeder Download landet im Wheelhouse und wird von dort kopiert
+                try:
+                    stored_path = self.wheelhouse.add_file(path, sha256, move=True)
+                    shutil.copyfile(stored_path, save_path)
+                    path = save_path
+                except OSError as e:
+                    error = e
+            finish(path, error, bool(sha256))
+
+        self.log_message(self.t("log_download_url").format(download_url))
+        self.download_engine.submit(
+            download_url, self.wheelhouse.incoming_path(selected_filename),
+            sha256=sha256,
+            size=file_data.get('size'),
+            on_progress=progress_handler, on_done=on_done)
+        self._render_download_progress()
+
+    def _set_download_progress(self, filename, percentage):
+        """Merkt sich den Fortschritt eines laufenden Downloads (GUI-Thread)."""
+        if filename in self._active_downloads:
+            self._active_downloads[filename] = percentage
+            self._render_download_progress()
+
+    def _render_download_progress(self):
+        """Zeigt den Fortschritt aller laufenden Downloads im Status-Label an."""
+        if not self.progress_label:
+            return
+        text = " | ".join(self.t("log_download_progress").format(f"{name} {pct}")
+                          for name, pct in self._active_downloads.items())
+        self.progress_label.config(text=text)
+
+    def _finish_download(self, filename, path, error, verified=False):
+        """Schließt einen Download ab und meldet das Ergebnis (GUI-Thread)."""
+        self._active_downloads.pop(filename, None)
+        self._render_download_progress()
+        if error is None:
+            if verified:
+                self.log_message(self.t("log_download_verified").format(filename))
+            self.log_message(self.t("log_download_success").format(path))
+            messagebox.showinfo(self.t("install_frame_title"),
+                                self.t("download_success_message").format(save_path=path))
+        else:
+            error_msg = self.t("download_failed").format(e=error)
+            self.log_message(error_msg, "ERROR")
+            messagebox.showerror(self.t("error_title"), error_msg)
 
     # --- Sicherheitsprüfung ---
 
-    def load_security_packages_check(self, pm=None):
-        """Prüft Pakete auf Sicherheitslücken (silent check ohne Messageboxen)."""
-        if not pm:
+    def _run_security_scan(self, pm=None):
+        """
+        Führt die Sicherheitsprüfung aus und aktualisiert die Caches.
+
+        Ist eine lokale Schwachstellen-Datenbank vorhanden, wird offline gegen
+        diese geprüft, ansonsten wird auf `PackageManager.check_security()`
+        zurückgegriffen. Geprüft wird in beiden Fällen die gewählte Umgebung.
+
+        Returns: Anzahl der gefundenen Probleme.
+        """
+        if not self.vulnerability_db.is_available and not pm:
             pm = PackageManager(self.selected_python_executable, self.log_message)
+        # Die Engine liefert fertige Ergebnisse, sodass parallel laufende
+        # GUI-Aktualisierungen nie einen halb gefüllten Cache sehen.
+        result = self._selected_engine().audit(self.vulnerability_db, pm)
+        self.security_packages_cache = result.packages
+        self.security_issues_cache = result.issues
+        self.security_vulnerabilities_cache = result.vulnerabilities
+        return result.issue_count
+
+    def _selected_engine(self, python_executable=None):
+        """
+        Engine der gewählten Umgebung (bzw. von `python_executable`).
 
-        issues_str = pm.check_security()
-        if issues_str:
-            issues = issues_str.split("\n")
-            self.security_packages_cache = []
-            self.security_issues_cache = {}
-            for issue in issues:
-                if issue.strip():
-                    parts = issue.split()
-                    if parts:
-                        pkg_name = parts[0]
-                        if pkg_name not in self.security_packages_cache:
-                            self.security_packages_cache.append(pkg_name)
-                            self.security_issues_cache[pkg_name] = issue.strip()
-        else:
-            self.security_packages_cache = []
-            self.security_issues_cache = {}
+        Solange nach einem venv-Wechsel die neue Engine noch nicht übernommen
+        wurde, wird eine eigene für den Interpreter erzeugt.
+        """
+        python_executable = python_executable or self.selected_python_executable
+        engine = self.engine
+        if engine.python_executable == python_executable:
+            return engine
+        return engine.for_environment(python_executable)
+
+    def load_security_packages_check(self, pm=None):
+        """Prüft Pakete auf Sicherheitslücken (silent check ohne Messageboxen)."""
+        self._run_security_scan(pm)
 
     def check_security_vulnerabilities(self):
         """Prüft installierte Pakete auf bekannte Sicherheitslücken."""
         self.log_message(self.t("security_check_message"))
-        pm = PackageManager(self.selected_python_executable, self.log_message)
-        issues_str = pm.check_security()
-
-        if issues_str:
-            issues = issues_str.split("\n")
-            self.security_packages_cache = []
-            self.security_issues_cache = {}
-            for issue in issues:
-                if issue.strip():
-                    parts = issue.split()
-                    if parts:
-                        pkg_name = parts[0]
-                        if pkg_name not in self.security_packages_cache:
-                            self.security_packages_cache.append(pkg_name)
-                            self.security_issues_cache[pkg_name] = issue.strip()
-            msg = self.t("security_vulnerabilities_count").format(len(issues),
+        issue_count = self._run_security_scan()
+
+        if issue_count:
+            msg = self.t("security_vulnerabilities_count").format(issue_count,
                                                                   len(self.security_packages_cache))
             self.log_message(msg, "WARNING")
             messagebox.showwarning(self.t("security_check_title"), msg)
             self.colorize_security_packages()
             return False
 
-        self.security_packages_cache = []
-        self.security_issues_cache = {}
         msg = self.t("security_no_vulnerabilities")
         self.log_message(msg)
         messagebox.showinfo(self.t("security_check_title"), msg)
         self.colorize_security_packages()
         return True
 
+    def check_yanked_packages(self):
+        """
+        Prüft alle installierten Versionen auf vom Index zurückgezogene Releases.
+
+        Die Abfragen laufen gebündelt in der asyncio-Schleife; Fortschritt und
+        Ergebnis werden im GUI-Thread angezeigt.
+        """
+        from logic.async_pypi import AsyncIndexClient
+        installed = self.engine.installed_versions()
+        total = len(installed)
+        self.btn_check_yanked.config(state=tk.DISABLED)
+        self.log_message(self.t("log_yanked_check_started").format(count=total))
+        done = [0]
+
+        def progress():
+            done[0] += 1
+            if done[0] % 50 == 0 or done[0] == total:
+                self.log_message(self.t("log_yanked_check_progress").format(done=done[0],
+                                                                             total=total), "DEBUG")
+
+        def on_result(name, _data, error):
+            if error:
+                self.log_message(f"{name}: {error}", "DEBUG")
+            self.ui.post(progress)
+
+        async def sweep():
+            async with AsyncIndexClient(self.engine.index) as client:
+                return await client.yanked_releases(installed, on_result)
+
+        def finished(yanked, error):
+            self.btn_check_yanked.config(state=tk.NORMAL)
+            if error:
+                self.log_message(self.t("log_yanked_check_failed").format(error=error), "ERROR")
+                return
+            if not yanked:
+                msg = self.t("yanked_none_found")
+                self.log_message(msg)
+                messagebox.showinfo(self.t("btn_check_yanked"), msg)
+                return
+            lines = [f"{name} {version}" + (f": {reason}" if reason else "")
+                     for name, (version, reason) in sorted(yanked.items(),
+                                                           key=lambda item: item[0].lower())]
+            msg = self.t("yanked_found").format(count=len(yanked)) + "\n\n" + "\n".join(lines)
+            self.log_message(msg, "WARNING")
+            messagebox.showwarning(self.t("btn_check_yanked"), msg)
+
+        self.async_bridge.submit(sweep(), finished)
+
+    def import_vulnerability_db(self):
+        """Importiert einen OSV-Dump als lokale Schwachstellen-Datenbank."""
+        dump_path = filedialog.askopenfilename(
+            title=self.t("import_vulnerability_db_title"),
+            filetypes=[("OSV", "*.zip *.json *.jsonl"), ("Alle Dateien", "*.*")]
+        )
+        if not dump_path:
+            return
+
+        def do_import():
+            self.ui.post(self.start_progress, key="progress")
+            try:
+                count = self.vulnerability_db.import_osv_dump(dump_path)
+                self.log_message(self.t("log_vulnerability_db_imported").format(
+                    count=count, path=dump_path))
+                self.load_security_packages_check()
+                self.ui.post(self.colorize_security_packages, key="colorize_security")
+            except (OSError, ValueError, KeyError) as e:
+                self.log_message(
+                    self.t("log_vulnerability_db_import_error").format(e=e), "ERROR")
+            finally:
+                self.ui.post(self.stop_progress, key="progress")
+
+        self.scheduler.submit(do_import, "import_vulnerability_db", LANE_BACKGROUND)
+
     # --- Update-Funktionalität ---
 
     def check_for_updates(self):
@@ -2804,10 +3321,10 @@ class PipPackageManager:
                     self.t("log_new_version_found").format(self.version, remote_version))
                 self.remote_version = remote_version
                 self.new_script_content = new_content
-                self.root.after(0, self._show_update_dialog)
+                self.ui.post(self._show_update_dialog)
             elif remote_version is None: # Nur loggen, wenn kein Update gefunden wurde
                 self.log_message(self.t("log_app_up_to_date"))
-        threading.Thread(target=do_check, daemon=True).start()
+        self.scheduler.submit(do_check, "check_for_updates", LANE_BACKGROUND)
 
     def _show_update_dialog(self):
         """Zeigt einen benutzerdefinierten Dialog für das Update an."""
@@ -2882,6 +3399,16 @@ class PipPackageManager:
         os.execv(sys.executable, [sys.executable] + sys.argv)
 
     def _on_closing(self):
+        self.pip_helpers.shutdown()
+        if self._download_engine is not None:
+            self.download_engine.shutdown()
+        if self._async_bridge is not None:
+            self.async_bridge.shutdown()
+        self.scheduler.shutdown()
+        self.ui.stop()
+        if "logic.http_session" in sys.modules:
+            from logic.http_session import close_shared_session
+            close_shared_session()
         if self.update_on_exit:
             try:
                 self.log_message(self.t("log_applying_on_exit"))
@@ -2922,13 +3449,14 @@ def select_python_version():
     if not versions or len(versions) <= 1:
         return
 
+    TRANSLATIONS.set_language("de")
     root_temp = tk.Tk()
-    root_temp.title(LANG_TEXTS["de"]["select_python_title"])
+    root_temp.title(TRANSLATIONS.get("select_python_title"))
     root_temp.geometry("350x200")
     root_temp.resizable(False, False)
 
     label = tk.Label(
-        root_temp, text=LANG_TEXTS["de"]["label_select_python"],
+        root_temp, text=TRANSLATIONS.get("label_select_python"),
         font=("Arial", 10, "bold"))
     label.pack(pady=10)
 
@@ -2963,11 +3491,11 @@ def select_python_version():
         root_temp.destroy()
         sys.exit(0)
 
-    ok_btn = tk.Button(button_frame, text=LANG_TEXTS["de"]["btn_ok"], width=10, command=on_ok)
+    ok_btn = tk.Button(button_frame, text=TRANSLATIONS.get("btn_ok"), width=10, command=on_ok)
     ok_btn.pack(side=tk.LEFT, padx=5)
 
     cancel_btn = tk.Button(
-        button_frame, text=LANG_TEXTS["de"]["btn_cancel"],
+        button_frame, text=TRANSLATIONS.get("btn_cancel"),
         width=10, command=on_cancel)
     cancel_btn.pack(side=tk.LEFT, padx=5)
 
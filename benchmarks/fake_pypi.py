@@ -0,0 +1,182 @@
+"""
+Lokaler HTTP-Ersatz für PyPI mit synthetischen Projekten.
+
+Bereitgestellt werden:
+  - '/simple/' als PEP-691-JSON (bzw. HTML, falls kein JSON angefragt wird)
+  - '/simple/<name>/' mit den Dateien eines Projekts
+  - '/pypi/<name>/json' und '/pypi/<name>/<version>/json'
+  - '/changelog?since=<serial>' als JSON-Liste sowie die XML-RPC-Methode
+    'changelog_since_serial' unter '/pypi'
+
+Die Projektliste wird einmal beim Start vorberechnet, sodass der Server die
+Index-Antwort (bei 700.000 Namen einige MB) ohne Rechenaufwand ausliefert.
+"""
+import hashlib
+import json
+import threading
+import xmlrpc.client
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+DEFAULT_PROJECTS = 700000
+SIMPLE_JSON = "application/vnd.pypi.simple.v1+json"
+
+
+def project_name(index):
+    """Name des synthetischen PyPI-Projekts mit der Nummer `index`."""
+    return f"fake-project-{index:06d}"
+
+
+class FakePyPI:
+    """Startet den Ersatzserver in einem Hintergrund-Thread (auch als Kontextmanager)."""
+
+    def __init__(self, num_projects=DEFAULT_PROJECTS, changes=1000, host="127.0.0.1", port=0):
+        """
+        Initialisiert den Server (er wird erst mit `start()` gestartet).
+
+        Parameters
+        ----------
+        num_projects : int
+            Anzahl der Projekte im Index.
+        changes : int
+            Anzahl der Projekte, die im Changelog als zuletzt hinzugefügt erscheinen.
+        """
+        self.num_projects = num_projects
+        self.changes = min(changes, num_projects)
+        self.host = host
+        self.port = port
+        # Jedes Projekt hat eine Seriennummer; die letzten `changes` sind "neu"
+        self.last_serial = num_projects
+        self.request_count = 0
+        self._server = None
+        self._thread = None
+        self._simple_json = None
+        self._simple_html = None
+
+    @property
+    def url(self):
+        """Basis-URL des laufenden Servers."""
+        return f"http://{self.host}:{self.port}"
+
+    def _build_index(self):
+        names = [project_name(i) for i in range(self.num_projects)]
+        self._simple_json = json.dumps({
+            "meta": {"api-version": "1.1", "_last-serial": self.last_serial},
+            "projects": [{"name": name, "_last-serial": i + 1} for i, name in enumerate(names)],
+        }).encode("utf-8")
+        self._simple_html = ("<!DOCTYPE html><html><body>\n" + "\n".join(
+            f'<a href="/simple/{name}/">{name}</a>' for name in names) +
+            "\n</body></html>\n").encode("utf-8")
+
+    def changelog_since(self, serial):
+        """Änderungen nach `serial` als Liste (name, version, zeit, aktion, serial)."""
+        first = max(serial, self.last_serial - self.changes)
+        return [[project_name(s - 1), "1.0.0", 1700000000 + s, "new release", s]
+                for s in range(first + 1, self.last_serial + 1)]
+
+    @staticmethod
+    def project_json(name, version=None):
+        """JSON-Daten eines Projekts im Format der PyPI-JSON-API."""
+        versions = ["0.9.0", "1.0.0", "1.1.0"]
+        releases = {}
+        for ver in versions:
+            filename = f"{name.replace('-', '_')}-{ver}-py3-none-any.whl"
+            releases[ver] = [{
+                "filename": filename, "packagetype": "bdist_wheel", "size": 1024,
+                "url": f"/files/{filename}", "requires_python": ">=3.8", "yanked": False,
+                "digests": {"sha256": hashlib.sha256(filename.encode()).hexdigest()},
+            }]
+        version = version or versions[-1]
+        return {"info": {"name": name, "version": version, "summary": f"Fake project {name}",
+                         "requires_dist": ["fake-project-000000>=1.0"],
+                         "requires_python": ">=3.8"},
+                "releases": releases, "urls": releases.get(version, [])}
+
+    def start(self):
+        """Baut den Index und startet den Server."""
+        if self._simple_json is None:
+            self._build_index()
+        self._server = ThreadingHTTPServer((self.host, self.port), _make_handler(self))
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name="fake-pypi", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Beendet den Server."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *_exc):
+        self.stop()
+        return False
+
+
+def _make_handler(fake):
+    class Handler(BaseHTTPRequestHandler):
+        """Beantwortet die Anfragen für einen FakePyPI-Server."""
+
+        protocol_version = "HTTP/1.1"
+        # Sonst bremst verzögertes ACK jede Keep-Alive-Antwort um ~40 ms
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+            pass
+
+        def _send(self, body, content_type, status=200):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _send_json(self, data, content_type="application/json"):
+            self._send(json.dumps(data).encode("utf-8"), content_type)
+
+        def do_GET(self):  # pylint: disable=invalid-name
+            """GET-Anfragen für Simple-, JSON- und Changelog-Endpunkte."""
+            fake.request_count += 1
+            url = urlsplit(self.path)
+            parts = [p for p in url.path.split("/") if p]
+            if parts == ["simple"]:
+                if SIMPLE_JSON in self.headers.get("Accept", ""):
+                    self._send(fake._simple_json, SIMPLE_JSON)  # pylint: disable=protected-access
+                else:
+                    self._send(fake._simple_html, "text/html")  # pylint: disable=protected-access
+            elif len(parts) == 2 and parts[0] == "simple":
+                data = fake.project_json(parts[1])
+                self._send_json({
+                    "meta": {"api-version": "1.1"}, "name": parts[1],
+                    "files": [dict(f, hashes=f["digests"]) for files in data["releases"].values()
+                              for f in files]}, SIMPLE_JSON)
+            elif len(parts) in (3, 4) and parts[0] == "pypi" and parts[-1] == "json":
+                self._send_json(fake.project_json(parts[1], parts[2] if len(parts) == 4 else None))
+            elif parts == ["changelog"]:
+                since = int(parse_qs(url.query).get("since", ["0"])[0])
+                self._send_json({"last_serial": fake.last_serial,
+                                 "changes": fake.changelog_since(since)})
+            else:
+                self._send(b"not found", "text/plain", 404)
+
+        def do_POST(self):  # pylint: disable=invalid-name
+            """XML-RPC für 'changelog_since_serial' (wie pypi.org/pypi)."""
+            fake.request_count += 1
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            params, method = xmlrpc.client.loads(body)
+            if method == "changelog_since_serial":
+                response = xmlrpc.client.dumps(
+                    ([tuple(c) for c in fake.changelog_since(int(params[0]))],),
+                    methodresponse=True)
+            else:
+                response = xmlrpc.client.dumps(
+                    xmlrpc.client.Fault(1, f"unknown method {method}"), methodresponse=True)
+            self._send(response.encode("utf-8"), "text/xml")
+
+    return Handler
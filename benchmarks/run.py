@@ -0,0 +1,157 @@
+"""
+Benchmarks der Hot Paths mit Laufzeit und Spitzenspeicher.
+
+Aufruf aus dem Projektverzeichnis:
+    python -m benchmarks.run
+    python -m benchmarks.run --packages 5000 --projects 700000 --output bench-1.5.json
+    python -m benchmarks.run --compare bench-1.4.json --only search autoremove
+
+Jeder Benchmark wird `--repeat`-mal ohne Speichermessung ausgeführt (beste
+und mittlere Zeit) und einmal zusätzlich unter `tracemalloc` für den
+Spitzenspeicher, damit die Speichermessung die Zeiten nicht verfälscht.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_pypi import FakePyPI  # pylint: disable=wrong-import-position
+from benchmarks.synthetic_env import (  # pylint: disable=wrong-import-position
+    generate_site_packages, package_name, package_version
+)
+from logic.engine import PackageEngine  # pylint: disable=wrong-import-position
+from logic.index_client import IndexClient  # pylint: disable=wrong-import-position
+
+RESULT_FORMAT_VERSION = 1
+
+
+def measure(func, repeat):
+    """Misst `func` und gibt ein Dictionary mit Zeiten (ms) und Spitzenspeicher (KiB) zurück."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    tracemalloc.start()
+    try:
+        func()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"best_ms": round(min(timings), 3), "mean_ms": round(statistics.mean(timings), 3),
+            "peak_kib": round(peak / 1024, 1)}
+
+
+def build_benchmarks(engine, fake, num_packages):
+    """Gibt die Benchmarks als Liste von (name, funktion, vorbereitung) zurück."""
+    core_package = package_name(0)        # wird von den meisten Paketen benötigt
+    leaf_package = package_name(num_packages - 1)
+    state = {}
+
+    def index_full():
+        state["index"], state["serial"] = engine.update_index([], 0)
+
+    def ensure_index():
+        if "index" not in state:
+            index_full()
+
+    def index_delta():
+        base = state["index"][:-fake.changes] if fake.changes else state["index"]
+        engine.update_index(list(base), state["serial"] - fake.changes)
+
+    def search():
+        engine.search(state["index"], "project-01234")
+
+    return [
+        ("get_required_by", lambda: engine.get_required_by(core_package), None),
+        ("find_removable_packages", lambda: engine.find_removable_packages(leaf_package), None),
+        ("autoremove_candidates", engine.autoremove_candidates, None),
+        ("packages_with_missing_deps", engine.packages_with_missing_deps, None),
+        ("environment_conflicts", engine.environment_conflicts, None),
+        ("resolve_dependencies",
+         lambda: engine.resolve_dependencies(leaf_package, package_version(num_packages - 1)),
+         None),
+        ("load_pypi_index.full", index_full, None),
+        ("load_pypi_index.delta", index_delta, ensure_index),
+        ("perform_search", search, ensure_index),
+    ]
+
+
+def format_table(results, baseline=None):
+    """Formatiert die Ergebnisse als Textzeilen (optional mit Veränderung zur Basis)."""
+    header = f"{'benchmark':<28} {'best ms':>10} {'mean ms':>10} {'peak KiB':>11}"
+    if baseline:
+        header += f" {'Δ best':>9} {'Δ peak':>9}"
+    lines = [header]
+    for name, result in results.items():
+        line = (f"{name:<28} {result['best_ms']:>10.1f} {result['mean_ms']:>10.1f} "
+                f"{result['peak_kib']:>11.1f}")
+        base = (baseline or {}).get(name)
+        if base:
+            def change(key):
+                return f"{(result[key] / base[key] - 1) * 100:+8.1f}%" if base[key] else "      n/a"
+            line += f" {change('best_ms')} {change('peak_kib')}"
+        lines.append(line)
+    return lines
+
+
+def main(argv=None):
+    """Einstiegspunkt; gibt den Exit-Code zurück."""
+    parser = argparse.ArgumentParser(description="Benchmarks der Hot Paths")
+    parser.add_argument("--packages", type=int, default=2000,
+                        help="Anzahl synthetischer installierter Pakete")
+    parser.add_argument("--projects", type=int, default=700000,
+                        help="Anzahl synthetischer PyPI-Projekte")
+    parser.add_argument("--changes", type=int, default=1000,
+                        help="Anzahl der Projekte im Changelog (Delta-Update)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--only", nargs="*", help="Nur Benchmarks mit diesen Namen(steilen)")
+    parser.add_argument("--output", help="Ergebnisse als JSON speichern")
+    parser.add_argument("--compare", help="Frühere Ergebnisdatei zum Vergleich")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f).get("results")
+
+    with tempfile.TemporaryDirectory(prefix="pip-manager-bench-") as tmp_dir:
+        site_dir = os.path.join(tmp_dir, "site-packages")
+        start = time.perf_counter()
+        generate_site_packages(site_dir, args.packages, seed=args.seed)
+        print(f"Generated {args.packages} packages in {time.perf_counter() - start:.1f}s",
+              file=sys.stderr)
+
+        with FakePyPI(args.projects, changes=args.changes) as fake:
+            index_client = IndexClient(f"{fake.url}/simple/", changelog_url=f"{fake.url}/pypi")
+            engine = PackageEngine(site_paths=[site_dir], index_client=index_client,
+                                   index_cache_path=os.path.join(tmp_dir, "index.json"))
+            results = {}
+            for name, func, setup in build_benchmarks(engine, fake, args.packages):
+                if args.only and not any(part in name for part in args.only):
+                    continue
+                if setup:
+                    setup()
+                results[name] = measure(func, args.repeat)
+                print(format_table({name: results[name]}, baseline)[1], file=sys.stderr)
+
+    print("\n".join(format_table(results, baseline)))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"format": RESULT_FORMAT_VERSION, "python": platform.python_version(),
+                       "platform": platform.platform(), "packages": args.packages,
+                       "projects": args.projects, "repeat": args.repeat,
+                       "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+Erzeugt synthetische site-packages-Verzeichnisse für Benchmarks.
+
+Jedes Paket besteht nur aus einem '*.dist-info'-Verzeichnis mit METADATA,
+INSTALLER und RECORD. Die Abhängigkeiten bilden einen azyklischen Graphen,
+in dem wenige Basispakete von sehr vielen anderen benötigt werden (wie
+'requests', 'typing-extensions' oder 'packaging' in echten Umgebungen).
+Ein Teil der Anforderungen trägt Versionsbereiche, Marker und Extras;
+einige verweisen auf nicht installierte Pakete.
+"""
+import os
+import random
+
+PROTECTED = (("pip", "24.0"), ("setuptools", "69.0.0"), ("wheel", "0.43.0"))
+
+
+def package_name(index):
+    """Name des synthetischen Pakets mit der Nummer `index` (gemischte Schreibweisen)."""
+    if index % 7 == 0:
+        return f"Synth_Pkg_{index:05d}"
+    return f"synth-pkg-{index:05d}"
+
+
+def package_version(index):
+    """Version des synthetischen Pakets mit der Nummer `index`."""
+    return f"{1 + index % 5}.{index % 11}.{index % 3}"
+
+
+def _requirement(rng, dep_index):
+    """Bildet eine 'Requires-Dist'-Zeile für eine Abhängigkeit."""
+    name = package_name(dep_index)
+    major = 1 + dep_index % 5
+    roll = rng.random()
+    if roll < 0.35:
+        req = name
+    elif roll < 0.75:
+        req = f"{name}>={major}.0"
+    elif roll < 0.9:
+        req = f"{name}>={major}.0,<{major + 1}"
+    else:
+        # Absichtlich unerfüllbar: erzeugt Versionskonflikte
+        req = f"{name}>={major + 1}.0"
+    marker_roll = rng.random()
+    if marker_roll < 0.05:
+        req += ' ; sys_platform == "win32"'
+    elif marker_roll < 0.15:
+        req += ' ; extra == "dev"'
+    return req
+
+
+def generate_site_packages(root_dir, num_packages, avg_deps=4, missing_ratio=0.01, seed=42):
+    """
+    Erzeugt `num_packages` Distributionen in `root_dir`.
+
+    Parameters
+    ----------
+    root_dir : str
+        Zielverzeichnis (wird angelegt).
+    num_packages : int
+        Anzahl der synthetischen Pakete (zusätzlich pip, setuptools, wheel).
+    avg_deps : int
+        Mittlere Anzahl direkter Abhängigkeiten pro Paket.
+    missing_ratio : float
+        Anteil der Pakete mit einer Abhängigkeit auf ein nicht installiertes Paket.
+    seed : int
+        Startwert des Zufallsgenerators, damit Läufe vergleichbar bleiben.
+
+    Returns: Liste der erzeugten Paketnamen.
+    """
+    rng = random.Random(seed)
+    os.makedirs(root_dir, exist_ok=True)
+    names = []
+    for index in range(num_packages):
+        requires = []
+        if index:
+            count = min(index, max(0, int(rng.expovariate(1 / avg_deps))))
+            deps = set()
+            for _ in range(count):
+                # Niedrige Nummern (Basispakete) werden bevorzugt gewählt
+                deps.add(min(index - 1, int(index * rng.random() ** 3)))
+            requires = [_requirement(rng, dep) for dep in sorted(deps)]
+        if rng.random() < missing_ratio:
+            requires.append(f"not-installed-{index:05d}>=1.0")
+        name = package_name(index)
+        _write_distribution(root_dir, name, package_version(index), requires)
+        names.append(name)
+    for name, version in PROTECTED:
+        _write_distribution(root_dir, name, version, [])
+    return names
+
+
+def _write_distribution(root_dir, name, version, requires):
+    """Schreibt ein einzelnes '*.dist-info'-Verzeichnis."""
+    dist_info = os.path.join(root_dir, f"{name.replace('-', '_')}-{version}.dist-info")
+    os.makedirs(dist_info, exist_ok=True)
+    lines = ["Metadata-Version: 2.1", f"Name: {name}", f"Version: {version}",
+             f"Summary: Synthetic benchmark package {name}", "License: MIT"]
+    lines += [f"Requires-Dist: {req}" for req in requires]
+    with open(os.path.join(dist_info, "METADATA"), 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+    with open(os.path.join(dist_info, "INSTALLER"), 'w', encoding='utf-8') as f:
+        f.write("pip\n")
+    with open(os.path.join(dist_info, "RECORD"), 'w', encoding='utf-8') as f:
+        base = os.path.basename(dist_info)
+        f.write(f"{base}/METADATA,,\n{base}/INSTALLER,,\n{base}/RECORD,,\n")
@@ -0,0 +1,122 @@
+"""
+Virtualisierte Darstellung der Paketliste.
+
+Die Einträge werden mit einem einzigen Tcl-Aufruf in die Listbox übernommen.
+Der Paketstatus (veraltet, unsicher, fehlende Abhängigkeiten) wird vorab in
+eine Zuordnung Paket -> Farbe übersetzt und nur auf die gerade sichtbaren
+Zeilen angewendet; beim Scrollen werden die neu sichtbaren Zeilen nachgefärbt.
+"""
+import tkinter as tk
+
+STATUS_COLORS = {
+    "vulnerable": "#FF7F7F",
+    "outdated": "#B6F0A5",
+    "missing_deps": "#FFE08A",
+}
+
+# Reihenfolge, in der sich Zustände gegenseitig überdecken (höchste Priorität zuerst).
+STATUS_PRIORITY = ("vulnerable", "outdated", "missing_deps")
+
+
+class PackageListView:
+    """Verwaltet Inhalt und Einfärbung einer bestehenden tk.Listbox."""
+
+    def __init__(self, listbox):
+        """
+        Initialisiert die Ansicht.
+
+        Parameters
+        ----------
+        listbox : tkinter.Listbox
+            Die Listbox, deren Inhalt und Farben verwaltet werden.
+        """
+        self.listbox = listbox
+        self.packages = []
+        self._row_index = {}
+        self._colors = {}
+        self._painted = {}
+        self._refresh_pending = False
+        self._scroll_command = None
+
+        self._wrap_yscrollcommand()
+        self.listbox.bind("<Configure>", lambda e: self.schedule_refresh(), add="+")
+
+    def _wrap_yscrollcommand(self):
+        """Hängt sich an das Scroll-Callback, um neu sichtbare Zeilen zu färben."""
+        self._scroll_command = self.listbox.tk.splitlist(self.listbox.cget("yscrollcommand"))
+
+        def on_scroll(first, last):
+            if self._scroll_command:
+                self.listbox.tk.call(*self._scroll_command, first, last)
+            self.schedule_refresh()
+
+        self.listbox.config(yscrollcommand=on_scroll)
+
+    def set_packages(self, packages):
+        """Ersetzt den kompletten Inhalt der Liste."""
+        self.packages = list(packages)
+        self._row_index = {name: i for i, name in enumerate(self.packages)}
+        self._painted = {}
+        self.listbox.delete(0, tk.END)
+        if self.packages:
+            self.listbox.insert(tk.END, *self.packages)
+        self.schedule_refresh()
+
+    def clear(self):
+        """Leert die Liste."""
+        self.set_packages([])
+
+    def index_of(self, pkg_name):
+        """Gibt die Zeile eines Pakets zurück oder None."""
+        return self._row_index.get(pkg_name)
+
+    def set_status(self, outdated=(), vulnerable=(), missing_deps=()):
+        """
+        Übernimmt die Statusmengen und färbt die sichtbaren Zeilen neu.
+
+        Alle Argumente sind Container mit Paketnamen (idealerweise Sets oder
+        Dicts), sodass die Zuordnung in O(Anzahl markierter Pakete) entsteht.
+        """
+        status_sets = {"vulnerable": vulnerable, "outdated": outdated,
+                       "missing_deps": missing_deps}
+        colors = {}
+        for status in reversed(STATUS_PRIORITY):
+            color = STATUS_COLORS[status]
+            for pkg_name in status_sets[status]:
+                colors[pkg_name] = color
+        self._colors = colors
+        self.schedule_refresh()
+
+    def schedule_refresh(self):
+        """Fasst mehrere Auslöser zu einer Neufärbung im nächsten Idle-Zyklus zusammen."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        try:
+            self.listbox.after_idle(self.refresh_visible)
+        except (tk.TclError, RuntimeError):
+            self._refresh_pending = False
+
+    def visible_range(self):
+        """Gibt (erste, letzte) sichtbare Zeile zurück, bei leerer Liste (0, -1)."""
+        size = len(self.packages)
+        if not size:
+            return 0, -1
+        first = self.listbox.nearest(0)
+        last = self.listbox.nearest(max(self.listbox.winfo_height(), 1))
+        return max(first, 0), min(last, size - 1)
+
+    def refresh_visible(self):
+        """Färbt nur die sichtbaren Zeilen, deren Farbe sich geändert hat."""
+        self._refresh_pending = False
+        try:
+            if not self.listbox.winfo_exists():
+                return
+            first, last = self.visible_range()
+            for row in range(first, last + 1):
+                color = self._colors.get(self.packages[row], "")
+                if self._painted.get(row) != color:
+                    self.listbox.itemconfig(row, {'bg': color})
+                    self._painted[row] = color
+        except (tk.TclError, RuntimeError):
+            pass
@@ -0,0 +1,246 @@
+"""
+Asynchroner Client für Massenabfragen am Paketindex.
+
+Für Operationen mit hunderten Anfragen (alle installierten Pakete prüfen,
+Abhängigkeitsbäume vorladen, Yanked-Status prüfen) werden die Abrufe in
+einer asyncio-Ereignisschleife gebündelt:
+  - ein Semaphor begrenzt die gleichzeitigen Anfragen
+  - gleichzeitige Anfragen für dasselbe Projekt teilen sich einen Abruf
+  - fehlgeschlagene Abrufe werden mit exponentiell wachsender, zufällig
+    gestreuter Wartezeit wiederholt (nicht bei 4xx außer 429)
+
+Ist `aiohttp` installiert, werden JSON-API-Abrufe nativ asynchron
+ausgeführt; sonst laufen sie über die gemeinsame, gepoolte requests-Session
+in einem Thread-Pool. `AsyncBridge` betreibt die Schleife in einem eigenen
+Thread und liefert Ergebnisse über eine Dispatch-Funktion (z.B.
+`root.after`) an den Tk-Hauptthread.
+"""
+import asyncio
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+
+from logic.index_client import IndexClientError
+
+try:
+    import aiohttp
+except ImportError:  # optional
+    aiohttp = None
+
+DEFAULT_CONCURRENCY = 32
+DEFAULT_RETRIES = 3
+
+
+class AsyncIndexClient:
+    """Asynchrone Fassade über einem IndexClient."""
+
+    def __init__(self, index_client, max_concurrency=DEFAULT_CONCURRENCY,
+                 retries=DEFAULT_RETRIES, backoff=0.25, max_backoff=4.0, timeout=30):
+        """
+        Initialisiert den Client (Ressourcen entstehen erst in der Ereignisschleife).
+
+        Parameters
+        ----------
+        index_client : IndexClient
+            Synchroner Client für URLs, Parsing und den Thread-Pool-Betrieb.
+        max_concurrency : int
+            Maximale Anzahl gleichzeitiger Anfragen.
+        retries : int
+            Anzahl der Wiederholungen pro Projekt.
+        backoff, max_backoff : float
+            Basis und Obergrenze der Wartezeit zwischen Wiederholungen in Sekunden.
+        """
+        self.index_client = index_client
+        self.max_concurrency = max_concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self._semaphore = None
+        self._in_flight = {}
+        self._http = None
+        self._executor = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc):
+        await self.close()
+
+    async def close(self):
+        """Schließt die HTTP-Verbindungen und den Thread-Pool."""
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _ensure_resources(self):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        if aiohttp is not None and self.index_client.json_url \
+                and not self.index_client.is_local and self._http is None:
+            self._http = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+                headers={"Accept": "application/json"})
+        if self._http is None and self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                                thread_name_prefix="async-index")
+
+    # --- Einzelabruf ---
+
+    async def _fetch_once(self, pkg_name):
+        if self._http is not None:
+            url = urljoin(self.index_client.json_url, f"{pkg_name}/json")
+            try:
+                async with self._http.get(url) as response:
+                    if response.status >= 400:
+                        raise IndexClientError(f"{url}: HTTP {response.status}", response.status)
+                    return await response.json(content_type=None)
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                raise IndexClientError(f"{url}: {e}") from e
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.index_client.fetch_package_info,
+                                          pkg_name)
+
+    def _should_retry(self, error, attempt):
+        if attempt >= self.retries:
+            return False
+        status = getattr(error, "status", None)
+        return status is None or status == 429 or status >= 500
+
+    async def _fetch_with_retry(self, pkg_name):
+        attempt = 0
+        while True:
+            try:
+                async with self._semaphore:
+                    return await self._fetch_once(pkg_name)
+            except IndexClientError as e:
+                if not self._should_retry(e, attempt):
+                    raise
+                # "Full jitter": verhindert, dass alle Wiederholungen gleichzeitig starten
+                delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    async def get_package_info(self, pkg_name):
+        """
+        Gibt die Projektdaten zurück; parallele Anfragen für dasselbe Projekt teilen sich
+        einen Abruf.
+
+        Raises: IndexClientError nach erfolglosen Wiederholungen.
+        """
+        self._ensure_resources()
+        key = pkg_name.lower()
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_with_retry(pkg_name))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _t: self._in_flight.pop(key, None))
+        return await asyncio.shield(task)
+
+    # --- Massenabfragen ---
+
+    async def get_many(self, pkg_names, on_result=None):
+        """
+        Ruft die Projektdaten vieler Pakete gleichzeitig ab.
+
+        `on_result(name, daten, fehler)` wird für jedes Paket aufgerufen, sobald
+        es fertig ist.
+
+        Returns: {name: daten} für alle erfolgreich abgerufenen Pakete.
+        """
+        results = {}
+
+        async def one(name):
+            try:
+                data = await self.get_package_info(name)
+            except IndexClientError as e:
+                if on_result:
+                    on_result(name, None, e)
+                return
+            results[name] = data
+            if on_result:
+                on_result(name, data, None)
+
+        await asyncio.gather(*(one(name) for name in dict.fromkeys(pkg_names)))
+        return results
+
+    async def yanked_releases(self, installed_versions, on_result=None):
+        """
+        Prüft, welche installierten Versionen auf dem Index zurückgezogen wurden.
+
+        Returns: {name: (version, grund)} der zurückgezogenen Versionen.
+        """
+        data = await self.get_many(installed_versions, on_result)
+        yanked = {}
+        for name, info in data.items():
+            version = installed_versions[name]
+            files = (info or {}).get("releases", {}).get(version) or []
+            if files and all(f.get("yanked") for f in files):
+                yanked[name] = (version, files[0].get("yanked_reason"))
+        return yanked
+
+    async def latest_versions(self, pkg_names, on_result=None):
+        """Returns: {name: neueste Version laut Index}."""
+        data = await self.get_many(pkg_names, on_result)
+        return {name: info.get("info", {}).get("version") for name, info in data.items() if info}
+
+
+class AsyncBridge:
+    """Betreibt eine asyncio-Schleife in einem Hintergrundthread für die GUI."""
+
+    def __init__(self, dispatch):
+        """
+        Parameters
+        ----------
+        dispatch : callable
+            Funktion `(callback)`, die `callback()` im GUI-Thread ausführt,
+            z.B. `lambda cb: root.after(0, cb)`.
+        """
+        self.dispatch = dispatch
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever,
+                                                name="asyncio-bridge", daemon=True)
+                self._thread.start()
+        return self._loop
+
+    def submit(self, coroutine, on_done=None):
+        """
+        Führt eine Coroutine in der Hintergrundschleife aus.
+
+        `on_done(ergebnis, fehler)` wird über `dispatch` im GUI-Thread aufgerufen.
+
+        Returns: concurrent.futures.Future
+        """
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._ensure_loop())
+        if on_done:
+            def done(fut):
+                if fut.cancelled():
+                    return
+                error = fut.exception()
+                result = None if error else fut.result()
+                self.dispatch(lambda: on_done(result, error))
+            future.add_done_callback(done)
+        return future
+
+    def call_soon(self, callback):
+        """Leitet einen Zwischenstand (z.B. aus `on_result`) an den GUI-Thread weiter."""
+        self.dispatch(callback)
+
+    def shutdown(self):
+        """Beendet die Hintergrundschleife."""
+        with self._lock:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop = None
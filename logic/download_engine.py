@@ -0,0 +1,375 @@
+"""
+Download-Engine für Paketdateien.
+
+Große Dateien werden über HTTP-Range-Anfragen in mehreren Teilen parallel
+geladen. Der Zwischenstand liegt in einer '.part'-Datei mit einer JSON-Datei
+daneben, sodass ein abgebrochener Download später fortgesetzt werden kann.
+Ist eine SHA256-Prüfsumme bekannt, wird die Datei vor dem Umbenennen
+geprüft. Fortschrittsmeldungen werden gedrosselt; mehrere Downloads können
+gleichzeitig in der Warteschlange laufen. 'file://'-URLs (lokale Spiegel)
+werden direkt kopiert.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from urllib.request import url2pathname
+
+import requests
+
+from logic.http_session import shared_session
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+DEFAULT_PARALLEL_THRESHOLD = 16 * 1024 * 1024
+READ_BLOCK_SIZE = 256 * 1024
+REQUEST_TIMEOUT = 30
+
+
+class DownloadError(RuntimeError):
+    """Wird ausgelöst, wenn ein Download nicht abgeschlossen werden kann."""
+
+
+class HashMismatchError(DownloadError):
+    """Die heruntergeladene Datei stimmt nicht mit der erwarteten Prüfsumme überein."""
+
+
+class DownloadCancelled(DownloadError):
+    """Der Download wurde abgebrochen; der Zwischenstand bleibt erhalten."""
+
+
+class _RangeNotHonoured(DownloadError):
+    """Der Server beantwortet Range-Anfragen mit der vollständigen Datei."""
+
+
+class _ProgressThrottle:
+    """Leitet Fortschrittsmeldungen höchstens im angegebenen Takt weiter."""
+
+    def __init__(self, callback, interval):
+        self.callback = callback
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._done = 0
+        self._last = 0.0
+
+    def add(self, num_bytes, total):
+        with self._lock:
+            self._done += num_bytes
+            now = time.monotonic()
+            if not self.callback or now - self._last < self.interval:
+                return
+            self._last = now
+            done = self._done
+        self.callback(done, total)
+
+    def set(self, done):
+        with self._lock:
+            self._done = done
+
+    def flush(self, total):
+        if self.callback:
+            with self._lock:
+                done = self._done
+            self.callback(done, total)
+
+
+def file_sha256(path, start_hash=None):
+    """Berechnet die SHA256-Prüfsumme einer Datei blockweise."""
+    digest = start_hash or hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(READ_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class DownloadEngine:
+    """Lädt Dateien parallel, fortsetzbar und mit Prüfsummenkontrolle herunter."""
+
+    def __init__(self, session=None, max_concurrent=3, max_connections=4,
+                 chunk_size=DEFAULT_CHUNK_SIZE, parallel_threshold=DEFAULT_PARALLEL_THRESHOLD,
+                 progress_interval=0.25, log_callback=None):
+        """
+        Initialisiert die Engine.
+
+        Parameters
+        ----------
+        session : requests.Session, optional
+            Zu verwendende HTTP-Session; Standard ist `shared_session()`.
+        max_concurrent : int
+            Anzahl gleichzeitig laufender Downloads aus der Warteschlange.
+        max_connections : int
+            Maximale Anzahl paralleler Range-Anfragen pro Datei.
+        chunk_size : int
+            Größe eines Teilstücks beim parallelen Download.
+        parallel_threshold : int
+            Ab dieser Dateigröße wird parallel geladen.
+        progress_interval : float
+            Mindestabstand in Sekunden zwischen zwei Fortschrittsmeldungen.
+        log_callback : callable, optional
+            Funktion `(message, level)` für Diagnosemeldungen.
+        """
+        self.session = session or shared_session()
+        self.max_connections = max(1, max_connections)
+        self.chunk_size = chunk_size
+        self.parallel_threshold = parallel_threshold
+        self.progress_interval = progress_interval
+        self.log_callback = log_callback
+        self._queue = ThreadPoolExecutor(max_workers=max(1, max_concurrent),
+                                         thread_name_prefix="download")
+
+    def _log(self, message, level="DEBUG"):
+        if self.log_callback:
+            self.log_callback(message, level)
+
+    def submit(self, url, dest_path, sha256=None, size=None, on_progress=None, on_done=None,
+               cancel_event=None):
+        """
+        Reiht einen Download in die Warteschlange ein.
+
+        `on_progress(erledigt, gesamt)` wird gedrosselt, `on_done(pfad, fehler)`
+        einmal am Ende aus dem Worker-Thread aufgerufen.
+
+        Returns: concurrent.futures.Future mit dem Zielpfad.
+        """
+        def run():
+            try:
+                path = self.download(url, dest_path, sha256, size, on_progress, cancel_event)
+            except (DownloadError, requests.RequestException, OSError) as e:
+                if on_done:
+                    on_done(None, e)
+                raise
+            if on_done:
+                on_done(path, None)
+            return path
+
+        return self._queue.submit(run)
+
+    def shutdown(self):
+        """Beendet die Warteschlange, ohne auf laufende Downloads zu warten."""
+        self._queue.shutdown(wait=False, cancel_futures=True)
+
+    # --- Zwischenstand ---
+
+    @staticmethod
+    def _state_path(part_path):
+        return part_path + ".json"
+
+    def _load_state(self, part_path, url, sha256):
+        """Lädt den gespeicherten Zwischenstand, sofern er zum Download passt."""
+        try:
+            with open(self._state_path(part_path), 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if state.get("url") != url or state.get("sha256") != sha256:
+            return None
+        if not os.path.exists(part_path):
+            return None
+        return state
+
+    def _save_state(self, part_path, state):
+        tmp_path = self._state_path(part_path) + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self._state_path(part_path))
+
+    def _discard(self, part_path):
+        for path in (part_path, self._state_path(part_path)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    # --- Download ---
+
+    def _probe(self, url):
+        """Ermittelt Größe, Range-Unterstützung und ETag der Datei."""
+        try:
+            response = self.session.head(url, allow_redirects=True, timeout=REQUEST_TIMEOUT,
+                                         headers={"Accept-Encoding": "identity"})
+            response.raise_for_status()
+        except requests.RequestException:
+            return None, False, None
+        size = response.headers.get("Content-Length")
+        ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+        return (int(size) if size and size.isdigit() else None), ranges, \
+            response.headers.get("ETag")
+
+    def download(self, url, dest_path, sha256=None, size=None, on_progress=None,
+                 cancel_event=None):
+        """
+        Lädt eine Datei blockierend herunter.
+
+        Returns: `dest_path` nach erfolgreicher Prüfung.
+        Raises: DownloadError, HashMismatchError, DownloadCancelled
+        """
+        sha256 = sha256.lower() if sha256 else None
+        part_path = dest_path + ".part"
+        if urlsplit(url).scheme == "file":
+            return self._copy_local(url, dest_path, part_path, sha256, on_progress, cancel_event)
+        remote_size, ranges, etag = self._probe(url)
+        total = remote_size or size
+
+        state = self._load_state(part_path, url, sha256)
+        if state and (state.get("size") != total or state.get("etag") != etag):
+            self._log(f"Discarding stale partial download for {url}")
+            self._discard(part_path)
+            state = None
+
+        throttle = _ProgressThrottle(on_progress, self.progress_interval)
+        parallel = ranges and total and total >= self.parallel_threshold
+        if parallel:
+            try:
+                self._download_parallel(url, part_path, total, etag, sha256, state, throttle,
+                                        cancel_event)
+                actual = file_sha256(part_path) if sha256 else None
+            except _RangeNotHonoured:
+                # HEAD meldet Range-Unterstützung, GET liefert aber 200: in einem Stück laden
+                self._log(f"Range requests not honoured, falling back to one stream: {url}")
+                self._discard(part_path)
+                parallel = False
+                ranges = False
+                state = None
+        if not parallel:
+            actual = self._download_sequential(url, part_path, total, etag, sha256,
+                                               state if ranges else None, throttle,
+                                               cancel_event)
+
+        if sha256 and actual != sha256:
+            self._discard(part_path)
+            raise HashMismatchError(
+                f"SHA256 mismatch for {os.path.basename(dest_path)}: "
+                f"expected {sha256}, got {actual}")
+
+        os.replace(part_path, dest_path)
+        try:
+            os.remove(self._state_path(part_path))
+        except OSError:
+            pass
+        throttle.flush(total or os.path.getsize(dest_path))
+        return dest_path
+
+    def _copy_local(self, url, dest_path, part_path, sha256, on_progress, cancel_event):
+        """Kopiert eine Datei aus einem lokalen Spiegel mit Prüfsummenkontrolle."""
+        parts = urlsplit(url)
+        source = url2pathname(parts.path if not parts.netloc else f"//{parts.netloc}{parts.path}")
+        try:
+            total = os.path.getsize(source)
+        except OSError as e:
+            raise DownloadError(f"Local file not available: {source} ({e})") from e
+        throttle = _ProgressThrottle(on_progress, self.progress_interval)
+        digest = hashlib.sha256()
+        with open(source, 'rb') as src, open(part_path, 'wb') as dst:
+            for block in iter(lambda: src.read(READ_BLOCK_SIZE), b""):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise DownloadCancelled(f"Download cancelled: {url}")
+                dst.write(block)
+                digest.update(block)
+                throttle.add(len(block), total)
+        if sha256 and digest.hexdigest() != sha256:
+            self._discard(part_path)
+            raise HashMismatchError(
+                f"SHA256 mismatch for {os.path.basename(dest_path)}: "
+                f"expected {sha256}, got {digest.hexdigest()}")
+        os.replace(part_path, dest_path)
+        throttle.flush(total)
+        return dest_path
+
+    def _download_sequential(self, url, part_path, total, etag, sha256, state, throttle,
+                             cancel_event):
+        """Lädt in einem Stück und berechnet die Prüfsumme beim Schreiben."""
+        digest = hashlib.sha256()
+        offset = 0
+        if state and state.get("mode") == "sequential":
+            offset = os.path.getsize(part_path)
+            if total and offset > total:
+                offset = 0
+        if offset:
+            # Bereits vorhandenen Anfang in die Prüfsumme aufnehmen
+            with open(part_path, 'rb') as f:
+                for block in iter(lambda: f.read(READ_BLOCK_SIZE), b""):
+                    digest.update(block)
+            if total and offset == total:
+                # Bereits vollständig: ohne Anfrage direkt zur Prüfsummenkontrolle
+                throttle.set(offset)
+                return digest.hexdigest()
+            self._log(f"Resuming {url} at {offset} bytes")
+
+        # Ohne Transfer-Kompression stimmen Byte-Offsets und Content-Length überein
+        headers = {"Accept-Encoding": "identity"}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        with self.session.get(url, headers=headers, stream=True,
+                              timeout=REQUEST_TIMEOUT) as response:
+            if offset and response.status_code == 416:
+                # Nichts mehr ab `offset` (Größe war unbekannt): Datei ist vollständig
+                throttle.set(offset)
+                return digest.hexdigest()
+            response.raise_for_status()
+            if offset and response.status_code != 206:
+                # Server ignoriert die Range-Anfrage: von vorne beginnen
+                offset = 0
+                digest = hashlib.sha256()
+            self._save_state(part_path, {"url": url, "sha256": sha256, "size": total,
+                                         "etag": etag, "mode": "sequential"})
+            throttle.set(offset)
+            with open(part_path, 'ab' if offset else 'wb') as f:
+                for block in response.iter_content(READ_BLOCK_SIZE):
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise DownloadCancelled(f"Download cancelled: {url}")
+                    f.write(block)
+                    digest.update(block)
+                    throttle.add(len(block), total)
+        return digest.hexdigest()
+
+    def _download_parallel(self, url, part_path, total, etag, sha256, state, throttle,
+                           cancel_event):
+        """Lädt die Datei in Teilstücken über mehrere Range-Anfragen."""
+        if state and state.get("mode") == "parallel":
+            chunks = state["chunks"]
+            self._log(f"Resuming {url} with {sum(c[2] for c in chunks)} bytes present")
+        else:
+            chunks = [[start, min(start + self.chunk_size, total) - 1, 0]
+                      for start in range(0, total, self.chunk_size)]
+            with open(part_path, 'wb') as f:
+                f.truncate(total)
+        state = {"url": url, "sha256": sha256, "size": total, "etag": etag,
+                 "mode": "parallel", "chunks": chunks}
+        state_lock = threading.Lock()
+        range_refused = threading.Event()
+        self._save_state(part_path, state)
+        throttle.set(sum(c[2] for c in chunks))
+
+        def fetch(chunk):
+            start, end, done = chunk
+            if start + done > end or range_refused.is_set():
+                return
+            headers = {"Range": f"bytes={start + done}-{end}", "Accept-Encoding": "identity"}
+            with self.session.get(url, headers=headers, stream=True,
+                                  timeout=REQUEST_TIMEOUT) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    # Die übrigen Teilstücke nicht mehr anfragen (jede Antwort wäre die ganze Datei)
+                    range_refused.set()
+                    raise _RangeNotHonoured(f"Server does not honour range requests: {url}")
+                with open(part_path, 'r+b') as f:
+                    f.seek(start + done)
+                    for block in response.iter_content(READ_BLOCK_SIZE):
+                        if cancel_event is not None and cancel_event.is_set():
+                            raise DownloadCancelled(f"Download cancelled: {url}")
+                        f.write(block)
+                        with state_lock:
+                            chunk[2] += len(block)
+                        throttle.add(len(block), total)
+            with state_lock:
+                self._save_state(part_path, state)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_connections) as executor:
+                for future in [executor.submit(fetch, c) for c in chunks]:
+                    future.result()
+        finally:
+            with state_lock:
+                self._save_state(part_path, state)
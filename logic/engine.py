@@ -0,0 +1,710 @@
+"""
+GUI-freie Kernlogik des Pip Paket-Managers.
+
+Die Engine kapselt Suche, Abhängigkeitsanalyse, Konfliktprüfung,
+Autoremove-Ermittlung und Sicherheitsprüfung ohne Abhängigkeit zu Tkinter.
+Sie wird von der GUI als dünner Client verwendet und von der
+Kommandozeile ('Pip_Paket_Manager_cli.py') direkt angesprochen, sodass
+die Hot Paths auch ohne Display skriptbar und messbar sind.
+
+Metadaten werden pro Operation genau einmal gelesen und zu einem
+Abhängigkeitsgraphen zusammengefasst, statt für jedes Paket erneut über
+alle installierten Distributionen zu iterieren.
+"""
+import importlib.metadata
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import namedtuple
+
+from utils.tracing import TRACER
+
+PROTECTED_PACKAGES = ('pip', 'setuptools', 'wheel')
+
+# Ermittelt die PEP-508-Markerumgebung eines Interpreters nur mit der Standardbibliothek
+# (wie packaging.markers.default_environment; packaging muss dort nicht installiert sein).
+_MARKER_ENVIRONMENT_SCRIPT = """
+import json, os, platform, sys
+def fmt(info):
+    version = "%d.%d.%d" % (info.major, info.minor, info.micro)
+    if info.releaselevel != "final":
+        version += info.releaselevel[0] + str(info.serial)
+    return version
+print(json.dumps({
+    "implementation_name": sys.implementation.name,
+    "implementation_version": fmt(sys.implementation.version),
+    "os_name": os.name,
+    "platform_machine": platform.machine(),
+    "platform_release": platform.release(),
+    "platform_system": platform.system(),
+    "platform_version": platform.version(),
+    "python_full_version": platform.python_version(),
+    "platform_python_implementation": platform.python_implementation(),
+    "python_version": ".".join(platform.python_version_tuple()[:2]),
+    "sys_platform": sys.platform,
+}))
+"""
+
+AuditResult = namedtuple(
+    "AuditResult", ["issue_count", "packages", "issues", "vulnerabilities", "source", "elapsed_ms"]
+)
+
+
+def normalize_name(name):
+    """Normalisiert einen Paketnamen für Vergleiche ('Foo_Bar' -> 'foo-bar')."""
+    return name.replace("_", "-").lower()
+
+
+def interpreter_site_paths(python_executable):
+    """
+    Suchpfade (`sys.path`) eines Interpreters, in denen seine Distributionen liegen.
+
+    Returns: list of str, bzw. None für den laufenden Interpreter.
+    Raises: OSError, subprocess.SubprocessError oder ValueError, falls der Interpreter
+    nicht ausführbar ist oder keine gültige Antwort liefert.
+    """
+    if os.path.normcase(os.path.abspath(python_executable)) == \
+            os.path.normcase(os.path.abspath(sys.executable)):
+        return None
+    result = subprocess.run(
+        [python_executable, "-c", "import json, sys; print(json.dumps(sys.path))"],
+        capture_output=True, text=True, check=True, timeout=60)
+    return [p for p in json.loads(result.stdout) if p]
+
+
+def requirement_name(req):
+    """Gibt den Paketnamen einer 'Requires-Dist'-Zeile zurück (auch bei ungültiger Syntax)."""
+    from packaging.requirements import InvalidRequirement, Requirement
+    try:
+        return Requirement(req).name
+    except InvalidRequirement:
+        return req.split(' ')[0].split('[')[0].split(';')[0].split(
+            '!=')[0].split('<')[0].split('>')[0].split('=')[0].strip()
+
+
+def should_apply_requirement(marker_part):
+    """Prüft, ob ein Requirement-Marker auf das aktuelle System zutrifft."""
+    if not marker_part:
+        return True
+
+    # Abhängigkeiten optionaler Extras werden ohne das Extra nicht installiert
+    if 'extra' in marker_part:
+        return False
+
+    # Vereinfachte Prüfung für die häufigsten Fälle
+    if 'sys_platform' in marker_part:
+        is_windows = sys.platform.startswith('win')
+        if "'win32'" in marker_part and not is_windows:
+            return False
+        if "'linux'" in marker_part and is_windows:
+            return False
+        if "'darwin'" in marker_part and not sys.platform.startswith('darwin'):
+            return False
+    return True
+
+
+class DependencyGraph:
+    """Momentaufnahme der installierten Distributionen und ihrer Abhängigkeiten."""
+
+    def __init__(self, distributions):
+        self.names = {}          # normalisiert -> Anzeigename
+        self.versions = {}       # Anzeigename -> Version
+        self.requires = {}       # Anzeigename -> Liste der Requires-Dist-Zeilen
+        self.dependencies = {}   # Anzeigename -> Liste der Abhängigkeitsnamen
+        self.required_by = {}    # normalisierter Abhängigkeitsname -> Liste der Anzeigenamen
+        for dist in distributions:
+            name = dist.metadata['name']
+            if not name:
+                continue
+            requires = dist.metadata.get_all('Requires-Dist') or []
+            self.names.setdefault(normalize_name(name), name)
+            self.versions[name] = dist.version
+            self.requires[name] = requires
+            dep_names = [requirement_name(req) for req in requires]
+            self.dependencies[name] = dep_names
+            for dep_name in dep_names:
+                self.required_by.setdefault(normalize_name(dep_name), []).append(name)
+
+    def get_required_by(self, pkg_name):
+        """Alle Pakete, die `pkg_name` in ihren Abhängigkeiten führen."""
+        return sorted(self.required_by.get(normalize_name(pkg_name), []), key=str.lower)
+
+    def get_all_dependencies(self, pkg_name):
+        """Alle direkten Abhängigkeiten eines Pakets."""
+        name = self.names.get(normalize_name(pkg_name))
+        return list(self.dependencies.get(name, [])) if name else []
+
+    def version_of(self, pkg_name):
+        """Installierte Version eines Pakets oder None."""
+        name = self.names.get(normalize_name(pkg_name))
+        return self.versions.get(name) if name else None
+
+
+class PackageEngine:
+    """Kernoperationen auf einer Python-Umgebung, unabhängig von der Oberfläche."""
+
+    def __init__(self, python_executable=None, site_paths=None, log_callback=None,
+                 translate=None, index_client=None, index_cache_path=None, index_url=None,
+                 index_json_url=None):
+        """
+        Initialisiert die Engine.
+
+        Parameters
+        ----------
+        python_executable : str, optional
+            Interpreter der Zielumgebung (für Pip-Aufrufe); Standard ist der laufende.
+        site_paths : list of str, optional
+            Pfade, in denen Distributionen gesucht werden; Standard ist `sys.path`.
+        log_callback : callable, optional
+            Funktion `(message, level)` für Meldungen.
+        translate : callable, optional
+            Funktion `key -> text` für Meldungstexte.
+        index_client : IndexClient, optional
+            Client für den Paketindex; wird sonst beim ersten Zugriff erzeugt.
+        index_cache_path : str, optional
+            JSON-Datei des lokalen PyPI-Index-Caches.
+        index_url, index_json_url : str, optional
+            Alternativer Paketindex (Spiegel oder 'file://'); siehe `configure_index`.
+        """
+        self.python_executable = python_executable or sys.executable
+        self.site_paths = site_paths
+        self.log_callback = log_callback
+        self.translate = translate
+        self.index_cache_path = index_cache_path
+        self._lock = threading.Lock()
+        self.index_url = None
+        self.index_json_url = None
+        self._index_client = index_client
+        self._install_time_index = None
+        self._marker_environment = None
+        if index_url:
+            self.configure_index(index_url, index_json_url)
+
+    @classmethod
+    def for_interpreter(cls, python_executable, **kwargs):
+        """Erstellt eine Engine, die die Metadaten eines anderen Interpreters liest."""
+        return cls(python_executable, site_paths=interpreter_site_paths(python_executable),
+                   **kwargs)
+
+    def for_environment(self, python_executable, site_paths=None):
+        """
+        Erstellt eine Engine für eine andere Umgebung mit denselben Einstellungen.
+
+        Index-Konfiguration, Index-Client und der (pro Umgebung geführte)
+        Installationszeit-Index werden übernommen. Ohne `site_paths` werden die
+        Suchpfade beim Interpreter erfragt (siehe `interpreter_site_paths`).
+        """
+        if site_paths is None:
+            site_paths = interpreter_site_paths(python_executable)
+        engine = PackageEngine(python_executable, site_paths=site_paths,
+                               log_callback=self.log_callback, translate=self.translate,
+                               index_client=self._index_client,
+                               index_cache_path=self.index_cache_path)
+        engine.index_url = self.index_url
+        engine.index_json_url = self.index_json_url
+        engine._install_time_index = self._time_index()  # pylint: disable=protected-access
+        return engine
+
+    def t(self, key): # pylint: disable=invalid-name
+        """Gibt den Meldungstext für einen Schlüssel zurück."""
+        return self.translate(key) if self.translate else key
+
+    def _log(self, message, level="INFO"):
+        if self.log_callback:
+            self.log_callback(message, level)
+
+    def configure_index(self, index_url, json_url=None):
+        """
+        Verwendet für Index, Projektdaten und Downloads einen anderen Paketindex.
+
+        Ohne `index_url` wird wieder pypi.org verwendet. Der Index-Cache
+        liegt pro Index in einer eigenen Datei neben dem Standard-Cache.
+        """
+        from logic.index_client import index_cache_path, normalize_index_url
+        if self.index_cache_path:
+            self.index_cache_path = index_cache_path(
+                os.path.dirname(self.index_cache_path), index_url)
+        with self._lock:
+            self.index_url = normalize_index_url(index_url) if index_url else None
+            self.index_json_url = json_url if index_url else None
+            self._index_client = None
+
+    @property
+    def index(self):
+        """Client für Projektliste und Projektdaten (konfigurierter Index oder pypi.org)."""
+        if self._index_client is None:
+            with self._lock:
+                if self._index_client is None:
+                    from logic.http_session import shared_session
+                    from logic.index_client import PYPI_INDEX_URL, IndexClient
+                    self._index_client = IndexClient(
+                        self.index_url or PYPI_INDEX_URL, self.index_json_url,
+                        session=shared_session(), log_callback=self._log)
+        return self._index_client
+
+    # --- Installierte Distributionen ---
+
+    def distributions(self):
+        """Alle installierten Distributionen der Zielumgebung."""
+        if self.site_paths is None:
+            return list(importlib.metadata.distributions())
+        return list(importlib.metadata.distributions(path=self.site_paths))
+
+    def distribution(self, name):
+        """Eine installierte Distribution; wirft PackageNotFoundError, falls sie fehlt."""
+        if self.site_paths is None:
+            return importlib.metadata.distribution(name)
+        for dist in importlib.metadata.distributions(name=name, path=self.site_paths):
+            return dist
+        raise importlib.metadata.PackageNotFoundError(name)
+
+    def _time_index(self):
+        if self._install_time_index is None:
+            with self._lock:
+                if self._install_time_index is None:
+                    from logic.install_times import InstallTimeIndex
+                    self._install_time_index = InstallTimeIndex()
+        return self._install_time_index
+
+    def install_times(self):
+        """
+        Installationszeitpunkte aller Distributionen der Zielumgebung.
+
+        Returns: dict normalisierter Name -> datetime.datetime (pro Umgebung zwischengespeichert)
+        """
+        return self._time_index().times(self.python_executable, self.site_paths)
+
+    def dependency_graph(self):
+        """Liest alle Metadaten einmal und gibt den Abhängigkeitsgraphen zurück."""
+        return DependencyGraph(self.distributions())
+
+    def marker_environment(self):
+        """
+        PEP-508-Markerumgebung der Zielumgebung (für 'Requires-Dist'-Marker).
+
+        Für einen anderen Interpreter wird sie einmal per Unterprozess ermittelt.
+        Raises: OSError, subprocess.SubprocessError oder ValueError, falls er nicht antwortet.
+        """
+        if self._marker_environment is None:
+            if os.path.normcase(os.path.abspath(self.python_executable)) == \
+                    os.path.normcase(os.path.abspath(sys.executable)):
+                from packaging.markers import default_environment
+                environment = dict(default_environment())
+            else:
+                result = subprocess.run([self.python_executable, "-c", _MARKER_ENVIRONMENT_SCRIPT],
+                                        capture_output=True, text=True, check=True, timeout=60)
+                environment = json.loads(result.stdout)
+            self._marker_environment = environment
+        return dict(self._marker_environment)
+
+    def installed_versions(self):
+        """Zuordnung Paketname -> installierte Version."""
+        return dict(self.dependency_graph().versions)
+
+    def outdated(self):
+        """Veraltete Pakete als {name: {'current': ..., 'latest': ...}} (über Pip)."""
+        from logic.package_manager import PackageManager
+        return PackageManager(self.python_executable, self._log).get_outdated()
+
+    # --- Abhängigkeiten ---
+
+    def get_required_by(self, pkg_name, graph=None):
+        """Findet alle Pakete, die von `pkg_name` abhängen."""
+        return (graph or self.dependency_graph()).get_required_by(pkg_name)
+
+    def get_all_dependencies(self, pkg_name, graph=None):
+        """Sammelt alle direkten Abhängigkeiten eines Pakets."""
+        return (graph or self.dependency_graph()).get_all_dependencies(pkg_name)
+
+    def find_removable_packages(self, pkg_name, graph=None):
+        """Findet Abhängigkeiten, die nur von pkg_name benötigt werden."""
+        graph = graph or self.dependency_graph()
+        return [dep for dep in graph.get_all_dependencies(pkg_name)
+                if graph.get_required_by(dep) == [pkg_name]]
+
+    def autoremove_candidates(self, installed_packages=None, graph=None):
+        """
+        Ermittelt Pakete, die von keinem anderen installierten Paket benötigt werden.
+
+        Parameters
+        ----------
+        installed_packages : list of str, optional
+            Zu prüfende Paketnamen; Standard sind alle installierten.
+        """
+        graph = graph or self.dependency_graph()
+        if installed_packages is None:
+            installed_packages = sorted(graph.versions, key=str.lower)
+        return [pkg for pkg in installed_packages
+                if not graph.get_required_by(pkg) and pkg not in PROTECTED_PACKAGES]
+
+    def get_missing_deps(self, dist, installed_packages):
+        """Prüft auf fehlende Abhängigkeiten für eine Distribution."""
+        missing_deps = []
+        requires_dist = dist.metadata.get_all('Requires-Dist') or []
+        if requires_dist:
+            installed_normalized = {normalize_name(p) for p in installed_packages}
+            for req in requires_dist:
+                req_spec = req.split(';')[0].strip() if ';' in req else req
+                if normalize_name(requirement_name(req)) not in installed_normalized:
+                    missing_deps.append(req_spec)
+        return missing_deps
+
+    def packages_with_missing_deps(self):
+        """Ermittelt in einem Durchlauf alle Pakete mit fehlenden Abhängigkeiten."""
+        from packaging.requirements import InvalidRequirement, Requirement
+        from packaging.utils import canonicalize_name
+
+        dists = self.distributions()
+        installed = {canonicalize_name(d.metadata['name']) for d in dists if d.metadata['name']}
+        result = set()
+        for dist in dists:
+            for req in dist.metadata.get_all('Requires-Dist') or []:
+                try:
+                    parsed = Requirement(req)
+                except InvalidRequirement:
+                    continue
+                # Optionale Extras und Marker anderer Plattformen zählen nicht.
+                if parsed.marker and not parsed.marker.evaluate({"extra": ""}):
+                    continue
+                if canonicalize_name(parsed.name) not in installed:
+                    result.add(dist.metadata['name'])
+                    break
+        return result
+
+    # --- Konflikte ---
+
+    def check_cross_package_conflicts(self, target_dep_name, target_specifier, graph=None):
+        """Prüft, ob andere installierte Pakete
+        eine inkompatible Version einer Abhängigkeit benötigen.
+
+        Returns: List of (package_name, their_requirement_string) tuples that conflict
+        """
+        from packaging.requirements import InvalidRequirement, Requirement
+        from packaging.specifiers import SpecifierSet
+
+        graph = graph or self.dependency_graph()
+        conflicting_packages = []
+        try:
+            target_spec = SpecifierSet(target_specifier) if target_specifier else None
+            if not target_spec:
+                return conflicting_packages
+            target_normalized = normalize_name(target_dep_name)
+            for pkg_dist_name in graph.required_by.get(target_normalized, []):
+                for req in graph.requires.get(pkg_dist_name, []):
+                    try:
+                        req_clean = req.split(';')[0].strip()
+                        marker_part = req.split(';')[1].strip() if ';' in req else None
+                        if not should_apply_requirement(marker_part):
+                            continue
+
+                        parsed = Requirement(req_clean)
+                        if normalize_name(parsed.name) != target_normalized or not parsed.specifier:
+                            continue
+                        # Schnittmenge prüfen: gibt es eine Version, die beide erfüllen?
+                        if not self._specifiers_overlap(target_spec, parsed.specifier):
+                            conflicting_packages.append((pkg_dist_name, req_clean))
+                            self._log(
+                                self.t("log_cross_package_conflict").format(
+                                    pkg_dist_name=pkg_dist_name, req_clean=req_clean,
+                                    target_dep_name=target_dep_name,
+                                    target_specifier=target_specifier),
+                                "DEBUG"
+                            )
+                    except InvalidRequirement:
+                        pass
+        except (ValueError, KeyError) as e:
+            self._log(self.t("log_cross_package_conflict_error").format(e), "DEBUG")
+
+        return conflicting_packages
+
+    @staticmethod
+    def _specifiers_overlap(first, second):
+        """Grobe Prüfung, ob zwei Versionsbereiche eine gemeinsame Version zulassen."""
+        from packaging.version import InvalidVersion, Version
+
+        # Kandidaten sind die Grenzen selbst und je eine Version knapp darüber
+        candidates = set()
+        for spec in list(first) + list(second):
+            bound = spec.version.rstrip(".*")
+            try:
+                candidates.update((Version(bound), Version(bound + ".1")))
+            except InvalidVersion:
+                return True
+        combined = first & second
+        return not candidates or any(combined.contains(v, prereleases=True) for v in candidates)
+
+    def get_package_requirements(self, pkg_name, version=None, graph=None):
+        """Holt die Liste der Abhängigkeiten für ein Paket, entweder lokal oder von PyPI."""
+        if graph is not None:
+            installed = graph.version_of(pkg_name)
+            if installed is not None and (not version or installed == version):
+                self._log(self.t("log_using_local_metadata").format(pkg_name), "DEBUG")
+                return list(graph.requires[graph.names[normalize_name(pkg_name)]])
+        try:
+            dist = self.distribution(pkg_name)
+            if version and dist.version != version:
+                raise importlib.metadata.PackageNotFoundError(pkg_name)
+            self._log(self.t("log_using_local_metadata").format(pkg_name), "DEBUG")
+            return dist.metadata.get_all('Requires-Dist') or []
+        except importlib.metadata.PackageNotFoundError:
+            self._log(self.t("log_local_metadata_unavailable"), "DEBUG")
+            data = self.index.get_package_info(pkg_name)
+            if data:
+                return data.get('info', {}).get('requires_dist') or []
+            return []
+
+    def _process_single_requirement(self, req, graph, required_packages, conflicts,
+                                    cross_conflicts):
+        """Verarbeitet eine einzelne Anforderung, prüft Marker und findet Konflikte."""
+        from packaging.requirements import InvalidRequirement, Requirement
+        from packaging.specifiers import SpecifierSet
+
+        try:
+            req_clean = req.split(';')[0].strip()
+            if not req_clean:
+                return
+
+            marker_part = req.split(';')[1].strip() if ';' in req else None
+            if not should_apply_requirement(marker_part):
+                return
+
+            parsed_req = Requirement(req_clean)
+            req_name = parsed_req.name
+            specifier = str(parsed_req.specifier) if parsed_req.specifier else ""
+
+            if normalize_name(req_name) in PROTECTED_PACKAGES:
+                return
+            required_packages.append((req_name, specifier))
+
+            current_version = graph.version_of(req_name)
+            if current_version is None:
+                self._log(self.t("log_dependency_not_installed").format(req_name), "DEBUG")
+            elif specifier and current_version not in SpecifierSet(specifier):
+                conflicts.append((req_name, current_version, specifier))
+                self._log(self.t("log_dependency_conflict").format(
+                    req_name, current_version, specifier), "DEBUG")
+
+            cross_pkg_conflicts = self.check_cross_package_conflicts(req_name, specifier, graph)
+            if cross_pkg_conflicts:
+                cross_conflicts[req_name] = cross_pkg_conflicts
+
+        except InvalidRequirement as e:
+            self._log(self.t("log_parse_requirement_error").format(req, e), "DEBUG")
+
+    def resolve_dependencies(self, pkg_name, version=None, graph=None):
+        """Resolves dependencies for a package and detects conflicts.
+
+        An existing `graph` snapshot is reused instead of re-reading all metadata.
+
+        Returns: (can_install, required_packages, conflicts, cross_conflicts)
+        """
+        import requests
+        from packaging.specifiers import InvalidSpecifier
+
+        required_packages = []
+        conflicts = []
+        cross_conflicts = {}
+
+        try:
+            graph = graph or self.dependency_graph()
+            for req in self.get_package_requirements(pkg_name, version, graph):
+                self._process_single_requirement(req, graph, required_packages, conflicts,
+                                                 cross_conflicts)
+        except (InvalidSpecifier, requests.RequestException) as e:
+            self._log(self.t("log_dependency_resolution_error").format(e), "WARNING")
+
+        return (len(conflicts) == 0 and len(cross_conflicts) == 0,
+                required_packages, conflicts, cross_conflicts)
+
+    def environment_conflicts(self):
+        """
+        Prüft alle installierten Pakete auf nicht erfüllte Versionsanforderungen.
+
+        Returns: Liste von Dictionaries mit 'package', 'requirement', 'dependency',
+        'installed' und 'required'.
+        """
+        from packaging.requirements import InvalidRequirement, Requirement
+
+        graph = self.dependency_graph()
+        result = []
+        for pkg_name, requires in sorted(graph.requires.items(), key=lambda i: i[0].lower()):
+            for req in requires:
+                try:
+                    parsed = Requirement(req)
+                except InvalidRequirement:
+                    continue
+                if parsed.marker and not parsed.marker.evaluate({"extra": ""}):
+                    continue
+                installed = graph.version_of(parsed.name)
+                if installed is None or not parsed.specifier:
+                    continue
+                if not parsed.specifier.contains(installed, prereleases=True):
+                    result.append({"package": pkg_name, "requirement": str(parsed),
+                                   "dependency": parsed.name, "installed": installed,
+                                   "required": str(parsed.specifier)})
+        return result
+
+    # --- Suche und PyPI-Index ---
+
+    @staticmethod
+    def search(index, query, limit=None):
+        """Filtert den Paketindex nach einer Teilzeichenkette (ohne Groß-/Kleinschreibung)."""
+        query = query.lower()
+        result = [pkg for pkg in index if query in pkg.lower()]
+        return result[:limit] if limit else result
+
+    def read_index_cache(self):
+        """Liest den PyPI-Index-Cache von der Festplatte."""
+        if self.index_cache_path and os.path.exists(self.index_cache_path):
+            try:
+                with open(self.index_cache_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, IOError) as e:
+                self._log(self.t("log_cache_read_error").format(e), "WARNING")
+        return None
+
+    def write_index_cache(self, data):
+        """Schreibt den PyPI-Index-Cache auf die Festplatte."""
+        try:
+            with open(self.index_cache_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+        except IOError as e:
+            self._log(self.t("log_cache_write_error").format(e), "ERROR")
+
+    def update_index(self, packages, last_serial):
+        """
+        Aktualisiert einen Paketindex per Delta-Update (bei `last_serial` 0 vollständig).
+
+        Returns: (packages, new_serial); der Cache wird bei neuer Seriennummer geschrieben.
+        """
+        if last_serial:
+            self._log(self.t("log_checking_updates_since").format(last_serial))
+
+        with TRACER.span("pypi.update_package_index", last_serial=last_serial):
+            data = self.index.update_package_index(last_serial)
+        new_serial = last_serial
+        if data:
+            meta = data.get('meta', {})
+            new_serial = meta.get('_last-serial', last_serial)
+            new_packages = [p['name'] for p in data.get('projects', [])]
+
+            if new_packages:
+                # Vollständige Liste ersetzt den Cache, damit entfernte Projekte verschwinden
+                if last_serial == 0 or meta.get('full'):  # Full load
+                    packages = sorted(new_packages, key=str.lower)
+                    self._log(self.t("log_full_index_loaded").format(len(packages)))
+                else:  # Delta update
+                    existing_packages_set = set(packages)
+                    added_packages = [
+                        pkg for pkg in new_packages if pkg not in existing_packages_set]
+                    if added_packages:
+                        packages = sorted(packages + added_packages, key=str.lower)
+                        self._log(f"Applied {len(added_packages)} updates. Total: {len(packages)}.")
+
+            if new_serial > last_serial:
+                self.write_index_cache({'last_serial': new_serial, 'packages': packages})
+        return packages, new_serial
+
+    def load_index(self, update=True):
+        """Lädt den Paketindex aus dem Cache und aktualisiert ihn optional."""
+        cache_data = self.read_index_cache() or {}
+        packages = cache_data.get('packages', [])
+        last_serial = cache_data.get('last_serial', 0)
+        if packages:
+            self._log(self.t("log_loaded_from_cache").format(len(packages)))
+        if update:
+            packages, last_serial = self.update_index(packages, last_serial)
+        return packages
+
+    # --- Sicherheit ---
+
+    def audit(self, vulnerability_db=None, package_manager=None):
+        """
+        Prüft installierte Pakete auf bekannte Sicherheitslücken.
+
+        Mit verfügbarer lokaler Schwachstellen-Datenbank wird offline geprüft,
+        sonst über `PackageManager.check_security()`.
+
+        Returns: AuditResult
+        """
+        security_packages = set()
+        security_issues = {}
+        security_vulnerabilities = {}
+        start = time.perf_counter()
+
+        if vulnerability_db is not None and vulnerability_db.is_available:
+            vulnerabilities = vulnerability_db.scan(self.installed_versions())
+            for vuln in vulnerabilities:
+                if vuln.package not in security_vulnerabilities:
+                    security_packages.add(vuln.package)
+                    security_vulnerabilities[vuln.package] = []
+                security_vulnerabilities[vuln.package].append(vuln)
+            for pkg_name, vulns in security_vulnerabilities.items():
+                security_issues[pkg_name] = "\n".join(
+                    self.t("security_issue_entry").format(
+                        vuln_id=v.vuln_id, affected_range=v.affected_range,
+                        fixed_version=v.fixed_version or "N/A") for v in vulns)
+            issue_count = len(vulnerabilities)
+            source = "osv"
+            self._log(self.t("log_vulnerability_scan_finished").format(
+                count=issue_count, ms=(time.perf_counter() - start) * 1000), "DEBUG")
+        else:
+            if package_manager is None:
+                from logic.package_manager import PackageManager
+                package_manager = PackageManager(self.python_executable, self._log)
+            issues_str = package_manager.check_security()
+            issue_count = 0
+            if issues_str:
+                for issue in issues_str.split("\n"):
+                    if issue.strip():
+                        issue_count += 1
+                        parts = issue.split()
+                        if parts:
+                            pkg_name = parts[0]
+                            if pkg_name not in security_issues:
+                                security_packages.add(pkg_name)
+                                security_issues[pkg_name] = issue.strip()
+            source = "pip"
+
+        return AuditResult(issue_count, security_packages, security_issues,
+                           security_vulnerabilities, source,
+                           (time.perf_counter() - start) * 1000)
+
+    # --- Aktionen ---
+
+    def uninstall(self, packages, timeout=60):
+        """
+        Deinstalliert Pakete nacheinander und fängt Fehler einzeln ab.
+
+        Returns: (erfolgreich, [(paket, fehlertext), ...])
+        """
+        successful_removals = []
+        failed_removals = []
+        for pkg in packages:
+            try:
+                result = subprocess.run(
+                    [self.python_executable, "-m", "pip", "uninstall", "-y", pkg],
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                    timeout=timeout
+                )
+                if result.returncode == 0:
+                    successful_removals.append(pkg)
+                    self._log(self.t("log_autoremove_success").format(pkg=pkg))
+                else:
+                    error_text = result.stderr if result.stderr else result.stdout
+                    failed_removals.append((pkg, error_text))
+                    self._log(self.t("log_autoremove_error").format(pkg=pkg, error=error_text),
+                              "ERROR")
+            except subprocess.TimeoutExpired:
+                error_text = self.t("log_autoremove_timeout").format(pkg=pkg)
+                failed_removals.append((pkg, error_text))
+                self._log(error_text, "ERROR")
+            except (OSError, subprocess.SubprocessError) as e:
+                failed_removals.append((pkg, str(e)))
+                self._log(self.t("log_autoremove_error").format(pkg=pkg, error=e), "ERROR")
+        return successful_removals, failed_removals
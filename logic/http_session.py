@@ -0,0 +1,141 @@
+"""
+Gemeinsame HTTP-Session mit Verbindungspool.
+
+Alle Netzwerkzugriffe (Index, Projektdaten, Downloads) teilen sich eine
+Session, damit TCP- und TLS-Verbindungen über Keep-Alive wiederverwendet
+werden, statt bei jeder Auswahl neu aufgebaut zu werden. Die Anzahl
+gleichzeitiger Anfragen pro Host ist begrenzt; komprimierte Antworten
+(gzip, deflate und – falls installiert – brotli/zstd) werden ausgehandelt.
+"""
+import threading
+import weakref
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+DEFAULT_POOL_CONNECTIONS = 8
+DEFAULT_POOL_MAXSIZE = 16
+DEFAULT_MAX_PER_HOST = 8
+USER_AGENT = "Pip-Paket-Manager"
+
+
+class HostLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter, der gleichzeitige Anfragen pro Host begrenzt."""
+
+    def __init__(self, max_per_host=DEFAULT_MAX_PER_HOST, **kwargs):
+        self.max_per_host = max_per_host
+        self._host_slots = {}
+        self._slots_lock = threading.Lock()
+        super().__init__(**kwargs)
+
+    def _slot(self, url):
+        host = urlsplit(url).netloc
+        with self._slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.max_per_host)
+                self._host_slots[host] = slot
+        return slot
+
+    def send(self, request, *args, **kwargs): # pylint: disable=signature-differs
+        """
+        Wartet auf einen freien Platz für den Host und sendet die Anfrage.
+
+        Der Platz bleibt belegt, bis der Antwortkörper gelesen oder die Antwort
+        geschlossen ist; so zählen auch laufende Streaming-Downloads zum Limit.
+        """
+        slot = self._slot(request.url)
+        slot.acquire()
+        try:
+            response = super().send(request, *args, **kwargs)
+        except BaseException:
+            slot.release()
+            raise
+        _release_slot_with(response, slot)
+        return response
+
+
+def _release_slot_with(response, slot):
+    """Gibt `slot` genau einmal frei, sobald die Verbindung der Antwort zurückgegeben wird."""
+    released = []
+    lock = threading.Lock()
+
+    def release():
+        with lock:
+            if released:
+                return
+            released.append(True)
+        slot.release()
+
+    raw = response.raw
+
+    def hook(method):
+        def wrapper(*args, **kwargs):
+            try:
+                return method(*args, **kwargs)
+            finally:
+                release()
+        return wrapper
+
+    # release_conn: Körper vollständig gelesen; close: Antwort vorzeitig geschlossen
+    if raw is not None:
+        raw.release_conn = hook(raw.release_conn)
+        raw.close = hook(raw.close)
+    response.close = hook(response.close)
+    # Nie geschlossene Antworten geben den Platz spätestens bei der Freigabe des Objekts zurück
+    weakref.finalize(response, release)
+
+
+def create_session(pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                   max_per_host=DEFAULT_MAX_PER_HOST, retries=2):
+    """
+    Erstellt eine Session mit Verbindungspool, Wiederholungen und Host-Limit.
+
+    Parameters
+    ----------
+    pool_connections : int
+        Anzahl der Hosts, deren Verbindungspools vorgehalten werden.
+    pool_maxsize : int
+        Maximale Anzahl offener Verbindungen pro Host.
+    max_per_host : int
+        Maximale Anzahl gleichzeitiger Anfragen pro Host.
+    retries : int
+        Wiederholungen bei Verbindungsfehlern und 502/503/504 (nur GET/HEAD).
+    """
+    session = requests.Session()
+    retry = Retry(total=retries, connect=retries, read=retries, backoff_factor=0.3,
+                  status_forcelist=(502, 503, 504), allowed_methods=("GET", "HEAD"),
+                  raise_on_status=False)
+    adapter = HostLimitedAdapter(max_per_host=max_per_host, pool_connections=pool_connections,
+                                 pool_maxsize=max(pool_maxsize, max_per_host), max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    # urllib3 nennt hier alle Kodierungen, die es entpacken kann (br/zstd nur, wenn installiert)
+    session.headers.update({"Accept-Encoding": ACCEPT_ENCODING, "User-Agent": USER_AGENT})
+    return session
+
+
+_shared_session = None
+_shared_lock = threading.Lock()
+
+
+def shared_session():
+    """Gibt die prozessweit gemeinsame Session zurück (wird beim ersten Zugriff erzeugt)."""
+    global _shared_session # pylint: disable=global-statement
+    if _shared_session is None:
+        with _shared_lock:
+            if _shared_session is None:
+                _shared_session = create_session()
+    return _shared_session
+
+
+def close_shared_session():
+    """Schließt alle Verbindungen der gemeinsamen Session."""
+    global _shared_session # pylint: disable=global-statement
+    with _shared_lock:
+        if _shared_session is not None:
+            _shared_session.close()
+            _shared_session = None
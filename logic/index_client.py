@@ -0,0 +1,405 @@
+"""
+Client für konfigurierbare Paketindizes.
+
+Neben pypi.org werden interne Spiegel und lokale Verzeichnisse unterstützt:
+  - HTTP(S)-Simple-Repositories (PEP 503 HTML oder PEP 691 JSON), z.B.
+    devpi, Nexus, Artifactory oder ein per Webserver freigegebener
+    bandersnatch-Spiegel
+  - 'file://'-Verzeichnisse im Simple-Layout ('<root>/<projekt>/index.html')
+  - optional eine JSON-API im Format von pypi.org ('<json_url>/<projekt>/json')
+
+Die Antworten haben dieselbe Form wie die von `PyPiAPI`, sodass Suche,
+Versionsliste und Downloads unverändert funktionieren. Delta-Updates laufen
+über 'changelog_since_serial' (sofern vorhanden), bedingte HTTP-Anfragen
+oder die Änderungszeit der lokalen Indexdatei.
+"""
+import email.parser
+import hashlib
+import html
+import json
+import os
+import re
+import time
+import xmlrpc.client
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlsplit
+from urllib.request import url2pathname
+
+PYPI_INDEX_URL = "https://pypi.org/simple/"
+PYPI_JSON_URL = "https://pypi.org/pypi/"
+PYPI_CHANGELOG_URL = "https://pypi.org/pypi"
+SIMPLE_JSON = "application/vnd.pypi.simple.v1+json"
+ACCEPT_SIMPLE = f"{SIMPLE_JSON}, text/html;q=0.1"
+REQUEST_TIMEOUT = 30
+_HASH_FRAGMENT = re.compile(r"(sha256|sha384|sha512|md5)=([0-9a-fA-F]+)")
+
+
+class IndexClientError(RuntimeError):
+    """Wird ausgelöst, wenn der Index nicht gelesen werden kann."""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+def index_cache_path(cache_dir, index_url):
+    """Pfad des lokalen Index-Caches; jeder Index (außer pypi.org) erhält eine eigene Datei."""
+    if not index_url or normalize_index_url(index_url) == PYPI_INDEX_URL:
+        return os.path.join(cache_dir, 'pypi_index_cache.json')
+    digest = hashlib.sha1(normalize_index_url(index_url).encode("utf-8")).hexdigest()[:12]
+    return os.path.join(cache_dir, f'pypi_index_cache-{digest}.json')
+
+
+def normalize_index_url(url):
+    """Ergänzt den abschließenden Schrägstrich und wandelt lokale Pfade in 'file://'-URLs."""
+    if url and "://" not in url:
+        from pathlib import Path
+        url = Path(url).resolve().as_uri()
+    return url.rstrip("/") + "/" if url else url
+
+
+def apply_pip_environment(index_url, environ=None):
+    """
+    Setzt den Index für alle von hier gestarteten Pip-Prozesse (PIP_INDEX_URL).
+
+    Für unverschlüsselte HTTP-Spiegel wird der Host zusätzlich als
+    vertrauenswürdig eingetragen, da Pip ihn sonst ablehnt.
+    """
+    environ = os.environ if environ is None else environ
+    if not index_url:
+        return
+    environ["PIP_INDEX_URL"] = index_url
+    parts = urlsplit(index_url)
+    if parts.scheme == "http" and parts.hostname:
+        hosts = environ.get("PIP_TRUSTED_HOST", "").split()
+        if parts.hostname not in hosts:
+            environ["PIP_TRUSTED_HOST"] = " ".join(hosts + [parts.hostname])
+
+
+class _LinkParser(HTMLParser):
+    """Sammelt die Links einer Simple-Seite (PEP 503) samt 'data-*'-Attributen."""
+
+    def __init__(self):
+        super().__init__()
+        self.links = []
+        self._current = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "a":
+            self._current = (dict(attrs), [])
+
+    def handle_data(self, data):
+        if self._current is not None:
+            self._current[1].append(data)
+
+    def handle_endtag(self, tag):
+        if tag == "a" and self._current is not None:
+            attrs, text = self._current
+            self.links.append((attrs, "".join(text).strip()))
+            self._current = None
+
+
+class IndexClient:
+    """Liest Projektliste und Projektdaten aus einem konfigurierbaren Index."""
+
+    def __init__(self, index_url=PYPI_INDEX_URL, json_url=None, changelog_url=None,
+                 session=None, log_callback=None, timeout=REQUEST_TIMEOUT):
+        """
+        Initialisiert den Client.
+
+        Parameters
+        ----------
+        index_url : str
+            Basis-URL des Simple-Index ('https://…/simple/', 'file:///…' oder ein Pfad).
+        json_url : str, optional
+            Basis der JSON-API ('<json_url>/<projekt>/json'); ohne werden die
+            Projektdaten aus den Simple-Seiten zusammengesetzt.
+        changelog_url : str, optional
+            XML-RPC-Endpunkt mit 'changelog_since_serial' für Delta-Updates.
+        session : requests.Session, optional
+            Zu verwendende HTTP-Session; Standard ist `shared_session()`.
+        log_callback : callable, optional
+            Funktion `(message, level)` für Diagnosemeldungen.
+        """
+        self.index_url = normalize_index_url(index_url)
+        self.json_url = normalize_index_url(json_url) if json_url else None
+        self.changelog_url = changelog_url
+        self.log_callback = log_callback
+        self.timeout = timeout
+        self._session = session
+        self._validators = {}
+        if self.index_url == PYPI_INDEX_URL:
+            self.json_url = self.json_url or PYPI_JSON_URL
+            self.changelog_url = self.changelog_url or PYPI_CHANGELOG_URL
+
+    def _log(self, message, level="DEBUG"):
+        if self.log_callback:
+            self.log_callback(message, level)
+
+    @property
+    def is_local(self):
+        """True, wenn der Index ein lokales Verzeichnis ist."""
+        return urlsplit(self.index_url).scheme == "file"
+
+    @property
+    def session(self):
+        """HTTP-Session (standardmäßig die gemeinsame Session mit Verbindungspool)."""
+        if self._session is None:
+            from logic.http_session import shared_session
+            self._session = shared_session()
+        return self._session
+
+    # --- Lesen ---
+
+    @staticmethod
+    def _local_path(url):
+        parts = urlsplit(url)
+        return url2pathname(parts.path if not parts.netloc else f"//{parts.netloc}{parts.path}")
+
+    def _read(self, url, accept="application/json", conditional=False):
+        """
+        Liest eine URL (HTTP oder 'file://').
+
+        Returns: (inhalt, content_type, serial) oder None, falls unverändert seit
+        dem letzten bedingten Abruf.
+        """
+        if urlsplit(url).scheme == "file":
+            return self._read_local(url)
+
+        import requests
+        headers = {"Accept": accept}
+        cached = self._validators.get(url) if conditional else None
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            if response.status_code == 304:
+                return None
+            response.raise_for_status()
+        except requests.RequestException as e:
+            status = e.response.status_code if e.response is not None else None
+            raise IndexClientError(f"{url}: {e}", status) from e
+        serial = response.headers.get("X-PyPI-Last-Serial")
+        if url == self.index_url:
+            self._validators[url] = {"etag": response.headers.get("ETag"),
+                                     "last_modified": response.headers.get("Last-Modified")}
+        return (response.content, response.headers.get("Content-Type", ""),
+                int(serial) if serial and serial.isdigit() else None)
+
+    def _read_local(self, url):
+        """Liest eine Datei; bei Verzeichnissen die enthaltene 'index.json' oder 'index.html'."""
+        path = self._local_path(url)
+        if os.path.isdir(path):
+            for name in ("index.json", "index.html"):
+                if os.path.isfile(os.path.join(path, name)):
+                    path = os.path.join(path, name)
+                    break
+            else:
+                # Verzeichnis ohne Indexdatei: Unterverzeichnisse sind die Projekte
+                names = sorted(entry.name for entry in os.scandir(path) if entry.is_dir())
+                body = "".join(f'<a href="{html.escape(n)}/">{html.escape(n)}</a>\n'
+                               for n in names)
+                return body.encode("utf-8"), "text/html", os.stat(path).st_mtime_ns // 1000000
+        content_type = "text/html" if path.endswith((".html", ".htm")) else "application/json"
+        try:
+            with open(path, 'rb') as f:
+                body = f.read()
+            serial = os.stat(path).st_mtime_ns // 1000000
+        except OSError as e:
+            raise IndexClientError(f"{url}: {e}") from e
+        return body, content_type, serial
+
+    @staticmethod
+    def _is_json(body, content_type):
+        return "json" in content_type or body.lstrip()[:1] == b"{"
+
+    # --- Projektliste ---
+
+    def _changelog_since(self, last_serial):
+        """Projektnamen, die sich seit `last_serial` geändert haben (XML-RPC)."""
+        import requests
+        payload = xmlrpc.client.dumps((last_serial,), "changelog_since_serial")
+        try:
+            response = self.session.post(self.changelog_url, data=payload.encode("utf-8"),
+                                         headers={"Content-Type": "text/xml"},
+                                         timeout=self.timeout)
+            response.raise_for_status()
+            (changes,), _method = xmlrpc.client.loads(response.content)
+        except (requests.RequestException, xmlrpc.client.Error, ValueError) as e:
+            raise IndexClientError(f"{self.changelog_url}: {e}") from e
+        names = list(dict.fromkeys(change[0] for change in changes))
+        serial = max((change[4] for change in changes), default=last_serial)
+        return names, serial
+
+    def update_package_index(self, last_serial=0):
+        """
+        Gibt die Projektliste im Format der Simple-JSON-API zurück.
+
+        Bei `last_serial` > 0 werden nach Möglichkeit nur die Änderungen
+        geliefert; ist der Index unverändert, ist die Projektliste leer. Ohne
+        Changelog (lokale Spiegel, reine Simple-Indizes) wird bei Änderungen die
+        vollständige Liste geliefert und mit `meta["full"] = True` markiert.
+        """
+        if last_serial and self.changelog_url and not self.is_local:
+            try:
+                names, serial = self._changelog_since(last_serial)
+                return {"meta": {"_last-serial": serial},
+                        "projects": [{"name": name} for name in names]}
+            except IndexClientError as e:
+                self._log(f"Changelog unavailable, falling back to full index: {e}")
+
+        try:
+            result = self._read(self.index_url, ACCEPT_SIMPLE, conditional=bool(last_serial))
+        except IndexClientError as e:
+            self._log(f"Index unavailable: {e}", "WARNING")
+            return None
+        if result is None:
+            return {"meta": {"_last-serial": last_serial}, "projects": []}
+
+        body, content_type, serial = result
+        if self._is_json(body, content_type):
+            data = json.loads(body)
+            names = [p["name"] for p in data.get("projects", [])]
+            serial = data.get("meta", {}).get("_last-serial") or serial
+        else:
+            parser = _LinkParser()
+            parser.feed(body.decode("utf-8", "replace"))
+            names = [text for _attrs, text in parser.links if text]
+        serial = serial or int(time.time())
+        if last_serial and serial <= last_serial:
+            return {"meta": {"_last-serial": last_serial}, "projects": []}
+        return {"meta": {"_last-serial": serial, "full": True},
+                "projects": [{"name": n} for n in names]}
+
+    # --- Projektdaten ---
+
+    def get_package_info(self, pkg_name):
+        """Gibt die Projektdaten im Format der PyPI-JSON-API zurück (oder None)."""
+        try:
+            return self.fetch_package_info(pkg_name)
+        except IndexClientError as e:
+            self._log(f"Could not read project data for {pkg_name}: {e}", "WARNING")
+            return None
+
+    def fetch_package_info(self, pkg_name):
+        """
+        Wie `get_package_info`, meldet Fehler aber als IndexClientError.
+
+        Raises: IndexClientError (mit `status`, falls der Server geantwortet hat)
+        """
+        if self.json_url:
+            try:
+                body, _content_type, _serial = self._read(urljoin(self.json_url,
+                                                                  f"{pkg_name}/json"))
+                return json.loads(body)
+            except (IndexClientError, ValueError) as e:
+                self._log(f"JSON API unavailable for {pkg_name}: {e}")
+        try:
+            return self._package_info_from_simple(pkg_name)
+        except ValueError as e:
+            raise IndexClientError(f"{pkg_name}: {e}") from e
+
+    def _package_info_from_simple(self, pkg_name):
+        """Setzt die Projektdaten aus der Simple-Seite eines Projekts zusammen."""
+        from packaging.utils import canonicalize_name
+        from packaging.version import InvalidVersion, Version
+        from logic.wheelhouse import parse_distribution_filename
+
+        project_url = urljoin(self.index_url, canonicalize_name(pkg_name) + "/")
+        body, content_type, _serial = self._read(project_url, ACCEPT_SIMPLE)
+        if self._is_json(body, content_type):
+            files = self._files_from_json(json.loads(body), project_url)
+        else:
+            files = self._files_from_html(body.decode("utf-8", "replace"), project_url)
+
+        releases = {}
+        for file_data in files:
+            parsed = parse_distribution_filename(file_data["filename"])
+            if parsed:
+                releases.setdefault(parsed[1], []).append(file_data)
+        if not releases:
+            return None
+
+        def sort_key(version):
+            try:
+                return (1, Version(version))
+            except InvalidVersion:
+                return (0, version)
+
+        versions = sorted(releases, key=sort_key)
+        stable = [v for v in versions if sort_key(v)[0] and not Version(v).is_prerelease
+                  and not all(f.get("yanked") for f in releases[v])]
+        latest = stable[-1] if stable else versions[-1]
+        info = {"name": pkg_name, "version": latest, "summary": None, "requires_dist": None,
+                "requires_python": releases[latest][0].get("requires_python"),
+                "project_urls": None, "home_page": None}
+        info.update(self._core_metadata(releases[latest]))
+        return {"info": info, "releases": releases, "urls": releases[latest]}
+
+    def _core_metadata(self, files):
+        """Liest Zusammenfassung und Abhängigkeiten aus den Kern-Metadaten (PEP 658)."""
+        for file_data in files:
+            metadata_url = file_data.get("core_metadata_url")
+            if not metadata_url:
+                continue
+            try:
+                body, _content_type, _serial = self._read(metadata_url, "*/*")
+            except IndexClientError as e:
+                self._log(f"Core metadata unavailable: {e}")
+                continue
+            message = email.parser.BytesParser().parsebytes(body, headersonly=True)
+            return {"summary": message.get("Summary"),
+                    "requires_dist": message.get_all("Requires-Dist"),
+                    "home_page": message.get("Home-page")}
+        return {}
+
+    @staticmethod
+    def _file_entry(filename, url, hashes, requires_python, yanked, size=None,
+                    upload_time=None, has_metadata=False):
+        """Bildet einen Dateieintrag im Format der PyPI-JSON-API."""
+        yanked_reason = yanked if isinstance(yanked, str) and yanked else None
+        if filename.endswith(".whl"):
+            packagetype = "bdist_wheel"
+            python_version = filename[:-4].split("-")[-3]
+        else:
+            packagetype, python_version = "sdist", "source"
+        return {
+            "filename": filename, "url": url, "digests": hashes,
+            "md5_digest": hashes.get("md5"), "packagetype": packagetype,
+            "python_version": python_version, "requires_python": requires_python,
+            "size": size, "upload_time_iso_8601": upload_time,
+            "yanked": bool(yanked), "yanked_reason": yanked_reason,
+            "core_metadata_url": url.split("#", 1)[0] + ".metadata" if has_metadata else None,
+        }
+
+    def _files_from_html(self, page, base_url):
+        parser = _LinkParser()
+        parser.feed(page)
+        files = []
+        for attrs, text in parser.links:
+            href = attrs.get("href")
+            if not href:
+                continue
+            url = urljoin(base_url, href)
+            filename = text or os.path.basename(urlsplit(url).path)
+            fragment = urlsplit(url).fragment
+            hashes = dict(_HASH_FRAGMENT.findall(fragment)) if fragment else {}
+            has_metadata = attrs.get("data-core-metadata", attrs.get("data-dist-info-metadata"))
+            files.append(self._file_entry(
+                filename, url.split("#", 1)[0], hashes, attrs.get("data-requires-python"),
+                (attrs["data-yanked"] or True) if "data-yanked" in attrs else False,
+                has_metadata=has_metadata not in (None, "false")))
+        return files
+
+    def _files_from_json(self, data, base_url):
+        files = []
+        for entry in data.get("files", []):
+            metadata = entry.get("core-metadata", entry.get("dist-info-metadata"))
+            files.append(self._file_entry(
+                entry["filename"], urljoin(base_url, entry["url"]), entry.get("hashes", {}),
+                entry.get("requires-python"), entry.get("yanked", False), entry.get("size"),
+                entry.get("upload-time"), has_metadata=bool(metadata)))
+        return files
@@ -0,0 +1,170 @@
+"""
+Installationszeitpunkte installierter Distributionen.
+
+Maßgeblich ist das Metadatenverzeichnis der Distribution (`*.dist-info` bzw.
+`*.egg-info`): Pip schreibt dort INSTALLER und RECORD als letzte Dateien einer
+Installation. Das Verzeichnis site-packages selbst eignet sich nicht, da es
+für alle Pakete dieselbe Änderungszeit hat.
+
+`InstallTimeIndex` liest die Zeitpunkte aller Distributionen einer Umgebung in
+einem Durchlauf und hält sie pro Umgebung vor. Solange sich die Änderungszeiten
+der durchsuchten Verzeichnisse nicht ändern, wird nicht erneut gelesen;
+Sortieren und Filtern der Paketliste greifen danach nicht mehr auf die Platte zu.
+"""
+import datetime
+import os
+import sys
+import threading
+
+from logic.engine import normalize_name
+
+METADATA_SUFFIXES = (".dist-info", ".egg-info")
+# Dateien, die Pip am Ende einer Installation schreibt (in absteigender Aussagekraft)
+INSTALL_MARKERS = ("INSTALLER", "RECORD")
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def metadata_install_time(metadata_path):
+    """
+    Installationszeitpunkt aus einem Metadatenverzeichnis.
+
+    Verwendet die jüngste Änderungszeit von INSTALLER/RECORD, sonst die des
+    Verzeichnisses (bzw. der Datei bei einzelnen *.egg-info-Dateien).
+
+    Returns: datetime.datetime oder None
+    """
+    if not metadata_path:
+        return None
+    times = [t for t in (_mtime(os.path.join(metadata_path, marker))
+                         for marker in INSTALL_MARKERS) if t is not None]
+    timestamp = max(times) if times else _mtime(metadata_path)
+    return datetime.datetime.fromtimestamp(timestamp) if timestamp is not None else None
+
+
+def _read_name_header(path):
+    """Liest das Feld 'Name:' aus dem Kopf einer METADATA-/PKG-INFO-Datei."""
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                if not line.strip():
+                    break  # Ende des Kopfbereichs
+                if line.lower().startswith("name:"):
+                    return line.split(":", 1)[1].strip() or None
+    except OSError:
+        pass
+    return None
+
+
+def project_name_from_metadata_dir(entry_path):
+    """
+    Normalisierter Projektname eines Metadatenverzeichnisses (bzw. einer *.egg-info-Datei).
+
+    Wie importlib.metadata wird das Feld 'Name:' aus METADATA bzw. PKG-INFO
+    gelesen; nur wenn es fehlt, wird der Name aus dem Verzeichnisnamen
+    abgeleitet (bei *.dist-info ist er dort ohne Bindestriche kodiert).
+
+    Returns: str oder None, falls `entry_path` kein Metadatenverzeichnis ist.
+    """
+    entry_name = os.path.basename(entry_path)
+    for suffix in METADATA_SUFFIXES:
+        if entry_name.endswith(suffix):
+            if os.path.isdir(entry_path):
+                metadata_file = os.path.join(
+                    entry_path, "METADATA" if suffix == ".dist-info" else "PKG-INFO")
+            else:
+                metadata_file = entry_path  # Einzelne *.egg-info-Datei (distutils)
+            name = _read_name_header(metadata_file)
+            if name is None and suffix == ".dist-info":
+                name = entry_name[:-len(suffix)].rsplit("-", 1)[0]
+            return normalize_name(name) if name else None
+    return None
+
+
+def scan_install_times(paths):
+    """
+    Liest die Installationszeitpunkte aller Distributionen in `paths` in einem Durchlauf.
+
+    Bei mehrfach installierten Projekten gilt wie beim Import der erste Pfad.
+
+    Returns: dict normalisierter Name -> datetime.datetime
+    """
+    install_times = {}
+    for path in paths:
+        try:
+            entries = list(os.scandir(path or "."))
+        except OSError:
+            continue
+        for entry in entries:
+            name = project_name_from_metadata_dir(entry.path)
+            if name is None or name in install_times:
+                continue
+            installed = metadata_install_time(entry.path)
+            if installed is not None:
+                install_times[name] = installed
+    return install_times
+
+
+class InstallTimeIndex:
+    """Zwischenspeicher der Installationszeitpunkte, getrennt nach Umgebung."""
+
+    def __init__(self):
+        self._environments = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _signature(paths):
+        """Änderungszeiten der durchsuchten Verzeichnisse (ändern sich bei jeder Installation)."""
+        return tuple((path, _mtime(path or ".")) for path in paths)
+
+    def times(self, environment, paths=None):
+        """
+        Installationszeitpunkte einer Umgebung (liest nur nach Änderungen neu).
+
+        Parameters
+        ----------
+        environment : str
+            Schlüssel der Umgebung, z.B. der Interpreterpfad.
+        paths : list of str, optional
+            Durchsuchte Pfade; Standard ist `sys.path`.
+
+        Returns: dict normalisierter Name -> datetime.datetime (nicht verändern)
+        """
+        paths = list(sys.path if paths is None else paths)
+        signature = self._signature(paths)
+        with self._lock:
+            cached = self._environments.get(environment)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        install_times = scan_install_times(paths)
+        with self._lock:
+            self._environments[environment] = (signature, install_times)
+        return install_times
+
+    def invalidate(self, environment=None):
+        """Verwirft die Zeitpunkte einer Umgebung (oder aller Umgebungen)."""
+        with self._lock:
+            if environment is None:
+                self._environments.clear()
+            else:
+                self._environments.pop(environment, None)
+
+
+def sort_by_install_time(packages, install_times, newest_first=True):
+    """Sortiert Paketnamen nach Installationszeitpunkt; Pakete ohne Zeitpunkt stehen am Ende."""
+    dated = [pkg for pkg in packages if normalize_name(pkg) in install_times]
+    undated = [pkg for pkg in packages if normalize_name(pkg) not in install_times]
+    dated.sort(key=lambda pkg: install_times[normalize_name(pkg)], reverse=newest_first)
+    return dated + undated
+
+
+def installed_since(packages, install_times, days, now=None):
+    """Filtert Paketnamen auf die in den letzten `days` Tagen installierten."""
+    cutoff = (now or datetime.datetime.now()) - datetime.timedelta(days=days)
+    return [pkg for pkg in packages
+            if install_times.get(normalize_name(pkg), datetime.datetime.min) >= cutoff]
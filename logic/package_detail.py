@@ -0,0 +1,221 @@
+"""
+Unveränderliche Detail-Records für installierte Pakete.
+
+Ein `PackageDetail` bündelt alles, was Detailansicht, Konfliktprüfung und
+Deinstallation über eine Distribution wissen müssen (geparste Metadaten,
+Lizenz, Homepage, Installationszeit, Rückwärts- und fehlende Abhängigkeiten).
+Er wird pro (Umgebung, Paket, Version) einmal erzeugt und im
+`PackageDetailStore` gehalten. Der Store arbeitet auf einer Momentaufnahme
+des Abhängigkeitsgraphen; nach Änderungen an der Umgebung werden nur die
+Records verworfen, die eine geänderte Distribution betreffen.
+"""
+import os
+import threading
+
+from logic.engine import normalize_name
+from logic.install_times import metadata_install_time
+
+
+def _homepage(metadata):
+    """Homepage: Project-URL 'Homepage', dann 'Source'/'Source code', dann 'Home-page'."""
+    project_urls = metadata.get_all('Project-URL') or []
+    for prefixes in (("homepage,",), ("source,", "source code,")):
+        for url_entry in project_urls:
+            if url_entry.lower().startswith(prefixes):
+                return url_entry.split(',')[1].strip()
+    return metadata.get('Home-page', 'N/A')
+
+
+def _license(dist, metadata):
+    """Lizenz: 'License-Expression', dann erste Zeile der Lizenzdatei, dann 'License'."""
+    license_expression = metadata.get('License-Expression')
+    if license_expression:
+        return license_expression
+    license_files = getattr(dist, 'license_files', None) or []
+    if license_files:
+        try:
+            first_line = (dist.read_text(license_files[0]) or "").splitlines()[0]
+            # Nur kurze Zeilen übernehmen, die nicht wie eine URL aussehen
+            if len(first_line) < 100 and "http" not in first_line:
+                return first_line.strip()
+        except (FileNotFoundError, OSError, IndexError):
+            pass
+    return metadata.get('License', 'N/A')
+
+
+def _stat_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns if path else None
+    except OSError:
+        return None
+
+
+def _metadata_path(dist):
+    path = getattr(dist, "_path", None)  # PathDistribution: das *.dist-info-Verzeichnis
+    return str(path) if path else None
+
+
+def distribution_stamp(dist):
+    """
+    Kennzeichen einer installierten Distribution.
+
+    Returns: (version, metadaten_pfad, mtime_ns); ändert sich bei Neuinstallation
+    auch dann, wenn die Version gleich bleibt.
+    """
+    path = _metadata_path(dist)
+    return dist.version, path, _stat_mtime(path)
+
+
+def stamp_is_current(stamp):
+    """Prüft mit einem einzigen stat(), ob die Distribution unverändert ist."""
+    _version, path, mtime = stamp
+    return path is None or _stat_mtime(path) == mtime
+
+
+class PackageDetail:
+    """Unveränderliche Angaben zu einer installierten Distribution."""
+
+    __slots__ = ("environment", "name", "version", "summary", "homepage", "author", "license",
+                 "location", "requires", "required_by", "missing_deps", "install_time", "stamp")
+
+    def __init__(self, **fields):
+        for slot in self.__slots__:
+            object.__setattr__(self, slot, fields.get(slot))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"PackageDetail ist unveränderlich ({name})")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"PackageDetail ist unveränderlich ({name})")
+
+    @property
+    def key(self):
+        """(Umgebung, normalisierter Name, Version)."""
+        return self.environment, normalize_name(self.name), self.version
+
+    @classmethod
+    def from_distribution(cls, dist, environment, graph, missing_deps=()):
+        """Liest die Metadaten einer Distribution einmal und erzeugt den Record."""
+        metadata = dist.metadata
+        name = metadata.get('Name') or ""
+        return cls(
+            environment=environment,
+            name=name,
+            version=dist.version,
+            summary=metadata.get('Summary', 'N/A'),
+            homepage=_homepage(metadata),
+            author=metadata.get('Author-email') or metadata.get('Author', 'N/A'),
+            license=_license(dist, metadata),
+            location=str(dist.locate_file('')),
+            requires=tuple(metadata.get_all('Requires-Dist') or ()),
+            required_by=tuple(graph.get_required_by(name)),
+            missing_deps=tuple(missing_deps),
+            install_time=metadata_install_time(_metadata_path(dist)),
+            stamp=distribution_stamp(dist),
+        )
+
+    def __repr__(self):
+        return f"<PackageDetail {self.name} {self.version} @ {self.environment}>"
+
+
+class PackageDetailStore:
+    """Hält PackageDetail-Records und den Abhängigkeitsgraphen einer Umgebung."""
+
+    def __init__(self, engine):
+        """
+        Parameters
+        ----------
+        engine : PackageEngine
+            Liefert Distributionen, Graph und fehlende Abhängigkeiten der Umgebung.
+        """
+        self.engine = engine
+        self._records = {}
+        self._graph = None
+        self._stale = False
+        self._lock = threading.RLock()
+
+    @property
+    def environment(self):
+        """Interpreter der Umgebung, zu der die Records gehören."""
+        return self.engine.python_executable
+
+    def graph(self):
+        """
+        Momentaufnahme des Abhängigkeitsgraphen (wird nur nach `mark_stale()` neu gelesen).
+
+        Beim Neuaufbau werden die Records aller Pakete verworfen, deren Version sich
+        geändert hat oder die von einem geänderten Paket abhängen bzw. benötigt werden.
+        """
+        with self._lock:
+            if self._graph is None or self._stale:
+                new_graph = self.engine.dependency_graph()
+                if self._graph is not None:
+                    self._drop_changed(self._graph, new_graph)
+                self._graph = new_graph
+                self._stale = False
+            return self._graph
+
+    def _drop_changed(self, old_graph, new_graph):
+        old_versions = {normalize_name(n): v for n, v in old_graph.versions.items()}
+        new_versions = {normalize_name(n): v for n, v in new_graph.versions.items()}
+        changed = {name for name in old_versions.keys() | new_versions.keys()
+                   if old_versions.get(name) != new_versions.get(name)}
+        # Neu installiert bei gleicher Version (z.B. --force-reinstall)
+        changed.update(key[1] for key, record in self._records.items()
+                       if not stamp_is_current(record.stamp))
+        if not changed:
+            return
+        for key, record in list(self._records.items()):
+            related = {normalize_name(n) for n in record.required_by}
+            related.update(normalize_name(n) for n in new_graph.get_required_by(record.name))
+            related.update(normalize_name(n) for n in new_graph.get_all_dependencies(record.name))
+            related.update(normalize_name(n) for n in old_graph.get_all_dependencies(record.name))
+            if key[1] in changed or related & changed:
+                del self._records[key]
+
+    def mark_stale(self):
+        """Meldet eine mögliche Änderung der Umgebung (z.B. nach einem Pip-Aufruf)."""
+        with self._lock:
+            self._stale = True
+
+    def clear(self):
+        """Verwirft alle Records und den Graphen (z.B. beim Wechsel der Umgebung)."""
+        with self._lock:
+            self._records.clear()
+            self._graph = None
+            self._stale = False
+
+    def get(self, pkg_name):
+        """
+        Gibt den aktuellen Record eines installierten Pakets zurück.
+
+        Raises: importlib.metadata.PackageNotFoundError, falls das Paket fehlt.
+        """
+        graph = self.graph()
+        version = graph.version_of(pkg_name)
+        key = (self.environment, normalize_name(pkg_name), version)
+        with self._lock:
+            record = self._records.get(key)
+        if record is not None:
+            return record
+        dist = self.engine.distribution(pkg_name)
+        missing = self.engine.get_missing_deps(dist, graph.versions)
+        record = PackageDetail.from_distribution(dist, self.environment, graph, missing)
+        with self._lock:
+            self._records[record.key] = record
+        return record
+
+    def is_current(self, record):
+        """True, solange `record` nicht durch eine Änderung der Umgebung verworfen wurde."""
+        with self._lock:
+            if self._stale:
+                return False
+            return self._records.get(record.key) is record
+
+    def discard(self, pkg_name):
+        """Verwirft alle Records eines Pakets."""
+        name = normalize_name(pkg_name)
+        with self._lock:
+            for key in [k for k in self._records if k[1] == name]:
+                del self._records[key]
+
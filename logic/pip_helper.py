@@ -0,0 +1,254 @@
+"""
+Langlebiger Hilfsprozess für lesende Pip-Abfragen.
+
+Für jeden ausgewählten Interpreter wird ein Python-Prozess gestartet, der Pip
+einmal importiert und danach Anfragen über ein einfaches JSON-Zeilenprotokoll
+auf stdin/stdout beantwortet. Dadurch entfallen Interpreter-Start und
+Pip-Import bei jeder Abfrage. Ändert sich die Umgebung (z.B. nach einer
+Installation), wird der Prozess automatisch neu gestartet.
+"""
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+
+DEFAULT_TIMEOUT = 300
+
+# Abfragen mit Netzwerkzugriff laufen in einem eigenen Prozess, damit sie
+# schnelle lokale Abfragen nicht blockieren.
+NETWORK_COMMANDS = frozenset({"outdated"})
+
+# Wird im Ziel-Interpreter ausgeführt. Antworten gehen über den beim Start
+# gesicherten stdout; alle Ausgaben von Pip selbst werden umgeleitet.
+_HELPER_SOURCE = r'''
+import contextlib, io, json, os, sys, site, sysconfig
+_out = sys.stdout
+
+def _site_dirs():
+    dirs = set(site.getsitepackages()) if hasattr(site, "getsitepackages") else set()
+    dirs.add(sysconfig.get_paths()["purelib"])
+    dirs.add(sysconfig.get_paths()["platlib"])
+    if site.ENABLE_USER_SITE:
+        dirs.add(site.getusersitepackages())
+    return sorted(d for d in dirs if os.path.isdir(d))
+
+def _pip(*args):
+    from pip._internal.commands import create_command
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(io.StringIO()):
+        code = create_command(args[0]).main(list(args[1:]) + ["--disable-pip-version-check"])
+    return code, buf.getvalue()
+
+def _list(*extra):
+    code, output = _pip("list", "--format=json", *extra)
+    if code != 0:
+        raise RuntimeError(f"pip list exit code {code}")
+    return json.loads(output or "[]")
+
+def handle(cmd):
+    if cmd == "env":
+        return {"executable": sys.executable, "version": sys.version.split()[0],
+                "site_packages": _site_dirs()}
+    if cmd == "installed":
+        return [p["name"] for p in _list()]
+    if cmd == "outdated":
+        return {p["name"]: {"current": p["version"], "latest": p["latest_version"]}
+                for p in _list("--outdated")}
+    if cmd == "check":
+        return _pip("check")[1]
+    if cmd == "cache_dir":
+        return _pip("cache", "dir")[1].strip()
+    if cmd == "ping":
+        return "pong"
+    raise ValueError(f"unknown command: {cmd}")
+
+import pip._internal.commands  # Pip einmalig vorwärmen
+
+for line in sys.stdin:
+    request = {}
+    try:
+        request = json.loads(line)
+        response = {"id": request.get("id"), "ok": True, "result": handle(request.get("cmd"))}
+    except BaseException as e:  # jeder Fehler geht als Antwort an den Client
+        request_id = request.get("id") if isinstance(request, dict) else None
+        response = {"id": request_id, "ok": False, "error": f"{type(e).__name__}: {e}"}
+    _out.write(json.dumps(response) + "\n")
+    _out.flush()
+'''
+
+
+class PipHelperError(RuntimeError):
+    """Wird ausgelöst, wenn der Hilfsprozess eine Anfrage nicht beantworten kann."""
+
+
+class PipHelper:
+    """Ein warmer Pip-Prozess für genau einen Interpreter."""
+
+    def __init__(self, python_executable, log_callback=None):
+        """
+        Initialisiert den Helfer (der Prozess startet erst bei der ersten Anfrage).
+
+        Parameters
+        ----------
+        python_executable : str
+            Pfad zum Interpreter der Zielumgebung.
+        log_callback : callable, optional
+            Funktion `(message, level)` für Diagnosemeldungen.
+        """
+        self.python_executable = python_executable
+        self.log_callback = log_callback
+        self._process = None
+        self._responses = queue.Queue()
+        self._request_lock = threading.Lock()
+        self._next_id = 0
+        self._site_packages = []
+        self._env_signature = None
+
+    def _log(self, message, level="DEBUG"):
+        if self.log_callback:
+            self.log_callback(message, level)
+
+    def _start(self):
+        """Startet den Hilfsprozess und liest die Umgebungsinformationen."""
+        creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+        self._process = subprocess.Popen(
+            [self.python_executable, "-c", _HELPER_SOURCE],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding="utf-8", bufsize=1, creationflags=creationflags
+        )
+        self._responses = queue.Queue()
+        threading.Thread(target=self._read_responses, args=(self._process, self._responses),
+                         daemon=True).start()
+        env = self._send("env", timeout=60)
+        self._site_packages = env.get("site_packages", [])
+        self._env_signature = self._compute_env_signature()
+        self._log(f"Pip helper started for {self.python_executable} (pid {self._process.pid})")
+
+    @staticmethod
+    def _read_responses(process, responses):
+        """Liest Antwortzeilen des Prozesses in eine Warteschlange."""
+        for line in process.stdout:
+            try:
+                responses.put(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        responses.put(None)
+
+    def _compute_env_signature(self):
+        """Bildet eine Signatur aus den Änderungszeiten der site-packages-Ordner."""
+        signature = []
+        for path in self._site_packages:
+            try:
+                signature.append((path, os.stat(path).st_mtime_ns))
+            except OSError:
+                signature.append((path, None))
+        return tuple(signature)
+
+    def _is_alive(self):
+        return self._process is not None and self._process.poll() is None
+
+    def _send(self, cmd, timeout):
+        """Sendet eine Anfrage und wartet auf die passende Antwort."""
+        self._next_id += 1
+        request_id = self._next_id
+        try:
+            self._process.stdin.write(json.dumps({"id": request_id, "cmd": cmd}) + "\n")
+            self._process.stdin.flush()
+        except (OSError, ValueError) as e:
+            raise PipHelperError(f"Pip helper not reachable: {e}") from e
+
+        while True:
+            try:
+                response = self._responses.get(timeout=timeout)
+            except queue.Empty as e:
+                self.stop()
+                raise PipHelperError(f"Pip helper timed out on '{cmd}'") from e
+            if response is None:
+                raise PipHelperError("Pip helper terminated unexpectedly")
+            if response.get("id") != request_id:
+                continue
+            if not response.get("ok"):
+                raise PipHelperError(response.get("error", "unknown error"))
+            return response.get("result")
+
+    def query(self, cmd, timeout=DEFAULT_TIMEOUT):
+        """
+        Führt eine lesende Abfrage aus ('installed', 'outdated', 'check', 'cache_dir').
+
+        Startet den Prozess bei Bedarf bzw. neu, wenn er beendet wurde oder
+        sich die Umgebung seit dem Start verändert hat.
+        """
+        with self._request_lock:
+            if self._is_alive() and self._compute_env_signature() != self._env_signature:
+                self._log(f"Environment changed, restarting pip helper for "
+                          f"{self.python_executable}")
+                self.stop()
+            if not self._is_alive():
+                try:
+                    self._start()
+                except (OSError, PipHelperError) as e:
+                    self.stop()
+                    raise PipHelperError(f"Could not start pip helper: {e}") from e
+            return self._send(cmd, timeout)
+
+    def invalidate(self):
+        """Erzwingt einen Neustart bei der nächsten Abfrage."""
+        with self._request_lock:
+            self.stop()
+
+    def stop(self):
+        """Beendet den Hilfsprozess."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=2)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            process.kill()
+
+
+class PipHelperPool:
+    """Verwaltet die Hilfsprozesse pro Interpreter (lokal und netzwerkgebunden)."""
+
+    def __init__(self, log_callback=None):
+        self.log_callback = log_callback
+        self._helpers = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(python_executable):
+        return os.path.normcase(os.path.abspath(python_executable))
+
+    def get(self, python_executable, lane="local"):
+        """Gibt den Helfer für einen Interpreter zurück (wird bei Bedarf angelegt)."""
+        key = (self._key(python_executable), lane)
+        with self._lock:
+            helper = self._helpers.get(key)
+            if helper is None:
+                helper = PipHelper(python_executable, self.log_callback)
+                self._helpers[key] = helper
+            return helper
+
+    def query(self, python_executable, cmd, timeout=DEFAULT_TIMEOUT):
+        """Beantwortet eine Abfrage über den passenden Helfer des Interpreters."""
+        lane = "network" if cmd in NETWORK_COMMANDS else "local"
+        return self.get(python_executable, lane).query(cmd, timeout)
+
+    def invalidate(self, python_executable=None):
+        """Startet die Helfer eines (oder aller) Interpreter bei der nächsten Abfrage neu."""
+        with self._lock:
+            helpers = [helper for (key, _lane), helper in self._helpers.items()
+                       if python_executable is None or key == self._key(python_executable)]
+        for helper in helpers:
+            helper.invalidate()
+
+    def shutdown(self):
+        """Beendet alle Hilfsprozesse."""
+        with self._lock:
+            helpers = list(self._helpers.values())
+            self._helpers.clear()
+        for helper in helpers:
+            helper.stop()
@@ -0,0 +1,214 @@
+"""
+Hintergrund-Inventur aller bekannten virtuellen Umgebungen.
+
+Für jede gespeicherte venv werden Interpreter, Python-Version, Plattform-Tag,
+Anzahl installierter Pakete, Speicherbedarf und Erreichbarkeit ermittelt.
+Die Abfragen laufen mit begrenzter Parallelität; Ergebnisse werden anhand der
+Änderungszeiten von 'pyvenv.cfg' und 'site-packages' zwischengespeichert.
+"""
+import glob
+import json
+import os
+import subprocess
+import sys
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+CACHE_FORMAT_VERSION = 1
+PROBE_TIMEOUT = 15
+
+VenvInfo = namedtuple(
+    "VenvInfo",
+    ["path", "python_executable", "python_version", "platform_tag", "package_count",
+     "disk_size", "alive"]
+)
+
+_PROBE_SOURCE = (
+    "import json, sys, sysconfig;"
+    "print(json.dumps([sys.version.split()[0],"
+    " {'cpython': 'cp', 'pypy': 'pp'}.get(sys.implementation.name, sys.implementation.name)"
+    " + '%d%d' % sys.version_info[:2],"
+    " sysconfig.get_platform()]))"
+)
+
+
+def find_venv_python(venv_path):
+    """Gibt den Interpreter einer venv zurück (Windows 'Scripts', sonst 'bin') oder None."""
+    candidates = [
+        os.path.join(venv_path, "Scripts", "python.exe"),
+        os.path.join(venv_path, "Scripts", "pythonw.exe"),
+        os.path.join(venv_path, "bin", "python3"),
+        os.path.join(venv_path, "bin", "python"),
+    ]
+    for candidate in candidates:
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+def find_site_packages(venv_path):
+    """Gibt die site-packages-Ordner einer venv zurück."""
+    paths = [os.path.join(venv_path, "Lib", "site-packages")]
+    paths += glob.glob(os.path.join(venv_path, "lib", "python*", "site-packages"))
+    paths += glob.glob(os.path.join(venv_path, "lib", "pypy*", "site-packages"))
+    return [p for p in paths if os.path.isdir(p)]
+
+
+def _read_pyvenv_cfg(venv_path):
+    """Liest 'pyvenv.cfg' als Dictionary."""
+    values = {}
+    try:
+        with open(os.path.join(venv_path, "pyvenv.cfg"), 'r', encoding='utf-8') as f:
+            for line in f:
+                if "=" in line:
+                    key, value = line.split("=", 1)
+                    values[key.strip().lower()] = value.strip()
+    except OSError:
+        pass
+    return values
+
+
+def _directory_size(path):
+    """Summiert die Dateigrößen unterhalb eines Ordners."""
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                continue
+    return total
+
+
+class VenvInventory:
+    """Ermittelt und cacht Informationen zu mehreren venvs parallel."""
+
+    def __init__(self, cache_path, max_workers=4):
+        """
+        Initialisiert die Inventur.
+
+        Parameters
+        ----------
+        cache_path : str
+            JSON-Datei für die zwischengespeicherten Ergebnisse.
+        max_workers : int
+            Maximale Anzahl gleichzeitig untersuchter venvs.
+        """
+        self.cache_path = cache_path
+        self.max_workers = max_workers
+        self._cache = None
+        self._lock = threading.Lock()
+
+    def _load_cache(self):
+        if self._cache is not None:
+            return
+        self._cache = {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("format") == CACHE_FORMAT_VERSION:
+                self._cache = data.get("venvs", {})
+        except (OSError, json.JSONDecodeError):
+            pass
+
+    def _save_cache(self):
+        with self._lock:
+            data = {"format": CACHE_FORMAT_VERSION, "venvs": dict(self._cache)}
+        tmp_path = self.cache_path + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _cache_key(venv_path):
+        """Schlüssel aus den Änderungszeiten von pyvenv.cfg und site-packages."""
+        mtimes = []
+        for path in [os.path.join(venv_path, "pyvenv.cfg")] + find_site_packages(venv_path):
+            try:
+                mtimes.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return mtimes
+
+    def get_cached(self, venv_path):
+        """Gibt ein noch gültiges zwischengespeichertes Ergebnis zurück oder None."""
+        self._load_cache()
+        with self._lock:
+            entry = self._cache.get(venv_path)
+        if entry and entry.get("key") == self._cache_key(venv_path):
+            return VenvInfo(*entry["info"])
+        return None
+
+    def probe(self, venv_path):
+        """Untersucht eine einzelne venv (blockierend)."""
+        cfg = _read_pyvenv_cfg(venv_path)
+        python_executable = find_venv_python(venv_path)
+        python_version = cfg.get("version") or cfg.get("version_info")
+        platform_tag = None
+        alive = False
+        if python_executable:
+            creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+            try:
+                result = subprocess.run(
+                    [python_executable, "-c", _PROBE_SOURCE],
+                    capture_output=True, text=True, check=False, timeout=PROBE_TIMEOUT,
+                    creationflags=creationflags
+                )
+                if result.returncode == 0:
+                    python_version, impl_tag, platform = json.loads(result.stdout)
+                    platform_tag = f"{impl_tag}-{platform.replace('-', '_').replace('.', '_')}"
+                    alive = True
+            except (OSError, subprocess.SubprocessError, ValueError):
+                pass
+
+        package_count = 0
+        for site_packages in find_site_packages(venv_path):
+            try:
+                package_count += sum(
+                    1 for name in os.listdir(site_packages)
+                    if name.endswith((".dist-info", ".egg-info")))
+            except OSError:
+                continue
+
+        return VenvInfo(venv_path, python_executable, python_version, platform_tag,
+                        package_count, _directory_size(venv_path), alive)
+
+    def probe_all(self, venv_paths, on_result, force=False, submit=None):
+        """
+        Untersucht alle venvs im Hintergrund mit begrenzter Parallelität.
+
+        `on_result(info)` wird für jede venv aus dem Worker-Thread aufgerufen;
+        gültige Cache-Treffer werden sofort gemeldet. `submit(job)` führt den
+        Durchlauf aus (Standard: eigener Daemon-Thread).
+        """
+        def run():
+            self._load_cache()
+            to_probe = []
+            for venv_path in venv_paths:
+                cached = None if force else self.get_cached(venv_path)
+                if cached:
+                    on_result(cached)
+                else:
+                    to_probe.append(venv_path)
+            if not to_probe:
+                return
+
+            def probe_and_store(venv_path):
+                key = self._cache_key(venv_path)
+                info = self.probe(venv_path)
+                with self._lock:
+                    self._cache[venv_path] = {"key": key, "info": list(info)}
+                on_result(info)
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                list(executor.map(probe_and_store, to_probe))
+            self._save_cache()
+
+        if submit:
+            submit(run)
+        else:
+            threading.Thread(target=run, daemon=True).start()
@@ -0,0 +1,172 @@
+"""
+Parallele, inkrementelle Suche nach virtuellen Umgebungen.
+
+Verzeichnisse werden mit `os.scandir` von mehreren Worker-Threads gelesen.
+Für jedes besuchte Verzeichnis merkt sich ein persistenter Index dessen
+Änderungszeit, Unterordner und ob es eine venv ist. Bei einer erneuten Suche
+werden unveränderte Verzeichnisse nicht mehr gelistet; nur geänderte
+Teilbäume werden tatsächlich neu eingelesen.
+"""
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+INDEX_FORMAT_VERSION = 1
+
+DEFAULT_PRUNE = frozenset({
+    "$RECYCLE.BIN", "System Volume Information", "node_modules", ".git", ".hg", ".svn",
+    "site-packages", "__pycache__", ".tox", ".nox", ".mypy_cache", ".pytest_cache",
+    ".ruff_cache",
+})
+
+
+class VenvScanner:
+    """Findet Ordner mit einer 'pyvenv.cfg' unterhalb eines Startverzeichnisses."""
+
+    def __init__(self, index_path, prune=DEFAULT_PRUNE, max_workers=8, progress_interval=0.2):
+        """
+        Initialisiert den Scanner.
+
+        Parameters
+        ----------
+        index_path : str
+            Datei, in der der Verzeichnisindex zwischen den Suchen gespeichert wird.
+        prune : iterable of str
+            Ordnernamen, in die nicht abgestiegen wird.
+        max_workers : int
+            Anzahl paralleler Worker-Threads.
+        progress_interval : float
+            Mindestabstand in Sekunden zwischen zwei Fortschrittsmeldungen.
+        """
+        self.index_path = index_path
+        self.prune = frozenset(prune)
+        self.max_workers = max_workers
+        self.progress_interval = progress_interval
+        self._index = None
+        self._index_lock = threading.Lock()
+
+    def _load_index(self):
+        """Lädt den Verzeichnisindex von der Festplatte."""
+        if self._index is not None:
+            return
+        self._index = {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("format") == INDEX_FORMAT_VERSION:
+                self._index = data.get("dirs", {})
+        except (OSError, json.JSONDecodeError):
+            pass
+
+    def _save_index(self):
+        """Schreibt den Verzeichnisindex auf die Festplatte."""
+        tmp_path = self.index_path + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"format": INDEX_FORMAT_VERSION, "dirs": self._index}, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            pass
+
+    def _visit(self, path):
+        """
+        Liest ein Verzeichnis (oder dessen Indexeintrag, falls unverändert).
+
+        Returns: (is_venv, unterordner, aus_index)
+        """
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return False, [], False
+
+        with self._index_lock:
+            entry = self._index.get(path)
+        if entry and entry.get("mtime") == mtime:
+            return entry.get("venv", False), entry.get("subdirs", []), True
+
+        is_venv = False
+        subdirs = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                        elif entry.name == "pyvenv.cfg":
+                            is_venv = True
+                    except OSError:
+                        continue
+        except OSError:
+            return False, [], False
+
+        with self._index_lock:
+            self._index[path] = {"mtime": mtime, "venv": is_venv,
+                                 "subdirs": [] if is_venv else subdirs}
+        return is_venv, subdirs, False
+
+    def scan(self, root, progress_callback=None, cancel_event=None):
+        """
+        Durchsucht `root` parallel nach venvs.
+
+        Parameters
+        ----------
+        root : str
+            Startverzeichnis.
+        progress_callback : callable, optional
+            Wird gedrosselt mit `(aktueller_pfad, anzahl_gefunden)` aufgerufen.
+        cancel_event : threading.Event, optional
+            Bricht die Suche ab, sobald es gesetzt ist.
+
+        Returns: Sortierte Liste der gefundenen venv-Pfade.
+        """
+        self._load_index()
+        root = os.path.normpath(root)
+        found = []
+        visited = set()
+        last_progress = 0.0
+        cancelled = False
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {executor.submit(self._visit, root): root}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = pending.pop(future)
+                    visited.add(path)
+                    is_venv, subdirs, _from_index = future.result()
+                    if is_venv:
+                        found.append(path)
+                        continue
+                    if cancelled:
+                        continue
+                    for name in subdirs:
+                        if name not in self.prune:
+                            child = os.path.join(path, name)
+                            pending[executor.submit(self._visit, child)] = child
+
+                if cancel_event is not None and cancel_event.is_set() and not cancelled:
+                    cancelled = True
+                    for future in list(pending):
+                        if future.cancel():
+                            pending.pop(future)
+
+                now = time.monotonic()
+                if progress_callback and now - last_progress >= self.progress_interval:
+                    last_progress = now
+                    progress_callback(path, len(found))
+
+        if not cancelled:
+            self._prune_index(root, visited)
+        self._save_index()
+        return sorted(found)
+
+    def _prune_index(self, root, visited):
+        """Entfernt Indexeinträge unterhalb von `root`, die nicht mehr existieren."""
+        prefix = root.rstrip(os.sep) + os.sep
+        with self._index_lock:
+            stale = [p for p in self._index
+                     if (p == root or p.startswith(prefix)) and p not in visited]
+            for path in stale:
+                del self._index[path]
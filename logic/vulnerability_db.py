@@ -0,0 +1,282 @@
+"""
+Lokale, indizierte Schwachstellen-Datenbank für die Sicherheitsprüfung.
+
+Die Datenbank wird einmalig aus einem OSV-Dump (https://osv.dev) importiert,
+nach normalisiertem Paketnamen indiziert und auf der Festplatte abgelegt.
+Ein Scan der installierten Pakete ist danach ein reiner In-Memory-Abgleich
+ohne Netzwerkzugriff.
+"""
+import datetime
+import json
+import os
+import threading
+import zipfile
+from collections import namedtuple
+
+from packaging.utils import canonicalize_name
+from packaging.version import InvalidVersion, Version
+
+DB_FORMAT_VERSION = 1
+
+Vulnerability = namedtuple(
+    "Vulnerability",
+    ["package", "installed_version", "vuln_id", "affected_range", "fixed_version",
+     "summary", "aliases"]
+)
+
+
+def _parse_version(version_str):
+    """Parst eine Version, gibt bei ungültigen Angaben None zurück."""
+    try:
+        return Version(version_str)
+    except (InvalidVersion, TypeError):
+        return None
+
+
+def _ranges_from_events(events):
+    """
+    Wandelt die OSV-Events eines Bereichs in Intervalle um.
+
+    Returns: Liste von (introduced, fixed, last_affected) als Strings bzw. None.
+    """
+    # OSV schreibt keine Sortierung vor; nach Version sortieren, sofern alle parsebar sind.
+    event_versions = [_parse_version(next(iter(event.values()), None)) for event in events]
+    if events and all(v is not None for v in event_versions):
+        events = [e for _, e in sorted(zip(event_versions, events), key=lambda p: p[0])]
+
+    intervals = []
+    introduced = None
+    for event in events:
+        if "introduced" in event:
+            introduced = event["introduced"]
+        elif "fixed" in event and introduced is not None:
+            intervals.append((introduced, event["fixed"], None))
+            introduced = None
+        elif "last_affected" in event and introduced is not None:
+            intervals.append((introduced, None, event["last_affected"]))
+            introduced = None
+    if introduced is not None:
+        intervals.append((introduced, None, None))
+    return intervals
+
+
+def _format_range(introduced, fixed, last_affected):
+    """Erstellt eine lesbare Darstellung eines Intervalls, z.B. '>=1.0, <2.0'."""
+    parts = []
+    if introduced and introduced != "0":
+        parts.append(f">={introduced}")
+    if fixed:
+        parts.append(f"<{fixed}")
+    elif last_affected:
+        parts.append(f"<={last_affected}")
+    return ", ".join(parts) if parts else "*"
+
+
+class _CompiledEntry:
+    """Eine Schwachstelle eines Pakets mit vorab geparsten Versionsgrenzen."""
+
+    __slots__ = ("vuln_id", "summary", "aliases", "intervals", "versions")
+
+    def __init__(self, raw_entry):
+        self.vuln_id = raw_entry["id"]
+        self.summary = raw_entry.get("summary", "")
+        self.aliases = tuple(raw_entry.get("aliases", []))
+        self.intervals = []
+        for introduced, fixed, last_affected in raw_entry.get("ranges", []):
+            self.intervals.append((
+                _parse_version(introduced) if introduced not in (None, "0") else None,
+                _parse_version(fixed) if fixed else None,
+                _parse_version(last_affected) if last_affected else None,
+                _format_range(introduced, fixed, last_affected),
+                fixed,
+            ))
+        self.versions = frozenset(raw_entry.get("versions", []))
+
+    def match(self, version_str, version):
+        """Gibt (affected_range, fixed_version) zurück, falls die Version betroffen ist."""
+        if version_str in self.versions:
+            fixed = next((iv[4] for iv in self.intervals if iv[4]), None)
+            return f"=={version_str}", fixed
+        if version is None:
+            return None
+        for introduced, fixed, last_affected, range_str, fixed_str in self.intervals:
+            if introduced is not None and version < introduced:
+                continue
+            if fixed is not None and version >= fixed:
+                continue
+            if last_affected is not None and version > last_affected:
+                continue
+            return range_str, fixed_str
+        return None
+
+
+class VulnerabilityDatabase:
+    """Hält den Schwachstellen-Index und gleicht installierte Pakete dagegen ab."""
+
+    def __init__(self, db_path):
+        """
+        Initialisiert die Datenbank.
+
+        Parameters
+        ----------
+        db_path : str
+            Pfad zur JSON-Datei, in der der Index gespeichert wird.
+        """
+        self.db_path = db_path
+        self.source = None
+        self.imported_at = None
+        self._raw_index = {}
+        self._compiled = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._raw_index.values())
+
+    @property
+    def is_available(self):
+        """True, wenn ein Index geladen oder auf der Festplatte vorhanden ist."""
+        self.load()
+        return bool(self._raw_index)
+
+    def load(self):
+        """Lädt den Index einmalig von der Festplatte."""
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            if not os.path.exists(self.db_path):
+                return
+            try:
+                with open(self.db_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (json.JSONDecodeError, IOError):
+                return
+            if data.get("format") != DB_FORMAT_VERSION:
+                return
+            self.source = data.get("source")
+            self.imported_at = data.get("imported_at")
+            self._raw_index = data.get("packages", {})
+            self._compiled = {}
+
+    def import_osv_dump(self, dump_path):
+        """
+        Importiert einen OSV-Dump und ersetzt den bestehenden Index.
+
+        Unterstützt werden ZIP-Archive (z.B. 'PyPI/all.zip' von osv.dev),
+        einzelne JSON-Dateien (Eintrag oder Liste) und JSON-Lines-Dateien.
+
+        Returns: Anzahl der importierten Einträge.
+        """
+        index = {}
+        for record in self._iter_osv_records(dump_path):
+            self._add_record(index, record)
+
+        with self._lock:
+            self._raw_index = index
+            self._compiled = {}
+            self._loaded = True
+            self.source = os.path.abspath(dump_path)
+            self.imported_at = datetime.datetime.now().isoformat(timespec="seconds")
+            self._save()
+        return len(self)
+
+    def _iter_osv_records(self, dump_path):
+        """Liefert alle OSV-Einträge aus einer Dump-Datei."""
+        if zipfile.is_zipfile(dump_path):
+            with zipfile.ZipFile(dump_path) as archive:
+                for name in archive.namelist():
+                    if name.endswith(".json"):
+                        yield json.loads(archive.read(name).decode("utf-8"))
+            return
+
+        with open(dump_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError:
+            # JSON-Lines: ein Eintrag pro Zeile
+            for line in content.splitlines():
+                if line.strip():
+                    yield json.loads(line)
+            return
+        if isinstance(data, list):
+            yield from data
+        elif isinstance(data, dict) and "vulns" in data:
+            yield from data["vulns"]
+        else:
+            yield data
+
+    @staticmethod
+    def _add_record(index, record):
+        """Fügt einen OSV-Eintrag dem Index hinzu (nur Ökosystem PyPI)."""
+        vuln_id = record.get("id")
+        if not vuln_id or record.get("withdrawn"):
+            return
+        for affected in record.get("affected", []):
+            package = affected.get("package", {})
+            if package.get("ecosystem") != "PyPI" or not package.get("name"):
+                continue
+            ranges = []
+            for version_range in affected.get("ranges", []):
+                if version_range.get("type") in ("ECOSYSTEM", "SEMVER"):
+                    ranges.extend(_ranges_from_events(version_range.get("events", [])))
+            versions = affected.get("versions", [])
+            if not ranges and not versions:
+                continue
+            index.setdefault(canonicalize_name(package["name"]), []).append({
+                "id": vuln_id,
+                "summary": record.get("summary") or record.get("details", "")[:200],
+                "aliases": record.get("aliases", []),
+                "ranges": ranges,
+                "versions": versions,
+            })
+
+    def _save(self):
+        """Schreibt den Index auf die Festplatte."""
+        data = {
+            "format": DB_FORMAT_VERSION,
+            "source": self.source,
+            "imported_at": self.imported_at,
+            "packages": self._raw_index,
+        }
+        tmp_path = self.db_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.db_path)
+
+    def _entries_for(self, canonical_name):
+        """Gibt die kompilierten Einträge eines Pakets zurück (lazy geparst)."""
+        entries = self._compiled.get(canonical_name)
+        if entries is None:
+            entries = [_CompiledEntry(raw) for raw in self._raw_index.get(canonical_name, [])]
+            self._compiled[canonical_name] = entries
+        return entries
+
+    def scan(self, installed_versions):
+        """
+        Gleicht installierte Pakete gegen den Index ab.
+
+        Parameters
+        ----------
+        installed_versions : dict
+            Zuordnung Paketname -> installierte Version.
+
+        Returns: Liste von Vulnerability-Tupeln, sortiert nach Paket und ID.
+        """
+        self.load()
+        results = []
+        for pkg_name, version_str in installed_versions.items():
+            canonical_name = canonicalize_name(pkg_name)
+            if canonical_name not in self._raw_index:
+                continue
+            version = _parse_version(version_str)
+            for entry in self._entries_for(canonical_name):
+                match = entry.match(version_str, version)
+                if match:
+                    affected_range, fixed_version = match
+                    results.append(Vulnerability(
+                        pkg_name, version_str, entry.vuln_id, affected_range,
+                        fixed_version, entry.summary, entry.aliases))
+        results.sort(key=lambda v: (v.package.lower(), v.vuln_id))
+        return results
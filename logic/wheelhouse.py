@@ -0,0 +1,321 @@
+"""
+Inhaltsadressierter lokaler Speicher für Paketdateien (Wheelhouse).
+
+Jede Datei liegt unter ihrer SHA256-Prüfsumme ('files/<aa>/<sha256>/<dateiname>')
+und wird nur einmal gespeichert, egal für wie viele venvs sie gebraucht wird.
+Eine generierte HTML-Seite dient Pip als '--find-links'-Quelle, sodass
+Installationen mit '--no-index' ohne Netzwerk auskommen. Übersteigt der
+Speicher die Obergrenze, werden die am längsten ungenutzten Dateien entfernt.
+"""
+import email.parser
+import hashlib
+import html
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+import zipfile
+from pathlib import Path
+
+from packaging.utils import (
+    InvalidSdistFilename, InvalidWheelFilename, canonicalize_name, parse_sdist_filename,
+    parse_wheel_filename
+)
+
+DEFAULT_MAX_SIZE = 2 * 1024 * 1024 * 1024
+INDEX_FORMAT_VERSION = 1
+
+
+def parse_distribution_filename(filename):
+    """Gibt (kanonischer Name, Version) einer Wheel- oder sdist-Datei zurück oder None."""
+    try:
+        if filename.endswith(".whl"):
+            name, version, _build, _tags = parse_wheel_filename(filename)
+        else:
+            name, version = parse_sdist_filename(filename)
+    except (InvalidWheelFilename, InvalidSdistFilename):
+        return None
+    return canonicalize_name(name), str(version)
+
+
+def wheel_requirements(path):
+    """Liest die 'Requires-Dist'-Zeilen aus der METADATA-Datei eines Wheels."""
+    with zipfile.ZipFile(path) as archive:
+        for member in archive.namelist():
+            if member.count("/") == 1 and member.endswith(".dist-info/METADATA"):
+                metadata = email.parser.BytesParser().parsebytes(archive.read(member),
+                                                                 headersonly=True)
+                return metadata.get_all("Requires-Dist") or []
+    return []
+
+
+def _version_matches(specifier, version):
+    from packaging.version import InvalidVersion
+    try:
+        return specifier.contains(version, prereleases=True)
+    except InvalidVersion:
+        return False
+
+
+class Wheelhouse:
+    """Verwaltet die Paketdateien im lokalen Speicher."""
+
+    def __init__(self, root_dir, max_size=DEFAULT_MAX_SIZE):
+        """
+        Initialisiert den Speicher.
+
+        Parameters
+        ----------
+        root_dir : str
+            Basisverzeichnis des Speichers.
+        max_size : int
+            Obergrenze in Bytes, ab der alte Dateien entfernt werden.
+        """
+        self.root_dir = root_dir
+        self.max_size = max_size
+        self.files_dir = os.path.join(root_dir, "files")
+        self.incoming_dir = os.path.join(root_dir, "incoming")
+        self.index_path = os.path.join(root_dir, "index.json")
+        self.find_links_path = os.path.join(root_dir, "find-links.html")
+        self._entries = None
+        self._lock = threading.RLock()
+
+    # --- Index ---
+
+    def _load(self):
+        if self._entries is not None:
+            return
+        self._entries = {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("format") == INDEX_FORMAT_VERSION:
+                self._entries = data.get("files", {})
+        except (OSError, json.JSONDecodeError):
+            pass
+
+    def _save(self):
+        """Schreibt Index und find-links-Seite (Aufrufer hält die Sperre)."""
+        os.makedirs(self.root_dir, exist_ok=True)
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"format": INDEX_FORMAT_VERSION, "files": self._entries}, f)
+        os.replace(tmp_path, self.index_path)
+
+        links = []
+        for sha256, entry in sorted(self._entries.items(), key=lambda e: e[1]["filename"]):
+            url = Path(self._blob_path(sha256, entry["filename"])).as_uri()
+            links.append(f'<a href="{html.escape(url)}#sha256={sha256}">'
+                         f'{html.escape(entry["filename"])}</a><br>')
+        tmp_path = self.find_links_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write("<!DOCTYPE html>\n<html><body>\n" + "\n".join(links) + "\n</body></html>\n")
+        os.replace(tmp_path, self.find_links_path)
+
+    def _blob_path(self, sha256, filename):
+        return os.path.join(self.files_dir, sha256[:2], sha256, filename)
+
+    # --- Abfragen ---
+
+    def has(self, sha256):
+        """Prüft, ob eine Datei mit dieser Prüfsumme vorhanden ist."""
+        return self.path_for(sha256) is not None
+
+    def path_for(self, sha256):
+        """Gibt den Pfad der Datei mit dieser Prüfsumme zurück oder None."""
+        if not sha256:
+            return None
+        sha256 = sha256.lower()
+        with self._lock:
+            self._load()
+            entry = self._entries.get(sha256)
+        if entry is None:
+            return None
+        path = self._blob_path(sha256, entry["filename"])
+        return path if os.path.exists(path) else None
+
+    def find(self, project, version=None):
+        """Gibt die Einträge eines Projekts (optional einer Version) zurück."""
+        project = canonicalize_name(project)
+        with self._lock:
+            self._load()
+            return [dict(entry, sha256=sha256) for sha256, entry in self._entries.items()
+                    if entry.get("project") == project
+                    and (version is None or entry.get("version") == version)]
+
+    def missing_requirements(self, project, version, installed=None, environment=None):
+        """
+        Prüft, ob sich 'project==version' samt Abhängigkeiten aus dem Speicher installieren lässt.
+
+        Ausgehend vom Wheel des Projekts werden die 'Requires-Dist'-Angaben
+        rekursiv verfolgt. Eine Anforderung gilt als erfüllt, wenn eine passende
+        Version bereits installiert ist (`installed`: Name -> Version) oder ein
+        passendes Wheel im Speicher liegt. Marker werden gegen `environment`
+        (Standard: der laufende Interpreter) ausgewertet.
+
+        Returns: Liste der nicht erfüllbaren Anforderungen (leer = alles vorhanden)
+        oder None, wenn sich das ohne Bauen nicht feststellen lässt (nur sdist).
+        """
+        from packaging.markers import default_environment
+        from packaging.requirements import InvalidRequirement, Requirement
+        from packaging.specifiers import SpecifierSet
+        from packaging.version import Version
+
+        environment = dict(environment or default_environment())
+        installed = {canonicalize_name(name): v for name, v in (installed or {}).items()}
+        pending = [(canonicalize_name(project), SpecifierSet(f"=={version}"), frozenset(),
+                    f"{project}=={version}")]
+        seen = set()
+        missing = []
+        while pending:
+            name, specifier, extras, label = pending.pop()
+            if (name, str(specifier), extras) in seen:
+                continue
+            seen.add((name, str(specifier), extras))
+            if name in installed and _version_matches(specifier, installed[name]):
+                continue
+            candidates = [entry for entry in self.find(name)
+                          if entry.get("version") and _version_matches(specifier, entry["version"])]
+            if not candidates:
+                missing.append(label)
+                continue
+            wheels = [entry for entry in candidates if entry["filename"].endswith(".whl")]
+            if not wheels:
+                return None  # Abhängigkeiten eines sdist sind erst nach dem Bauen bekannt
+            # Wie Pip die höchste passende Version wählen
+            best = max(wheels, key=lambda entry: Version(entry["version"]))
+            try:
+                requires = wheel_requirements(self._blob_path(best["sha256"], best["filename"]))
+            except (OSError, zipfile.BadZipFile):
+                missing.append(label)
+                continue
+            for line in requires:
+                try:
+                    req = Requirement(line)
+                except InvalidRequirement:
+                    continue
+                if req.marker and not any(req.marker.evaluate(dict(environment, extra=extra))
+                                          for extra in extras | {""}):
+                    continue
+                pending.append((canonicalize_name(req.name), req.specifier,
+                                frozenset(req.extras), str(req)))
+        return missing
+
+    def total_size(self):
+        """Gibt die Gesamtgröße aller gespeicherten Dateien zurück."""
+        with self._lock:
+            self._load()
+            return sum(entry["size"] for entry in self._entries.values())
+
+    # --- Änderungen ---
+
+    def new_incoming_dir(self):
+        """Legt ein eindeutiges temporäres Verzeichnis für Downloads in den Speicher an."""
+        directory = os.path.join(self.incoming_dir, uuid.uuid4().hex)
+        os.makedirs(directory, exist_ok=True)
+        return directory
+
+    def incoming_path(self, filename):
+        """Gibt einen eindeutigen temporären Pfad für einen Download in den Speicher zurück."""
+        return os.path.join(self.new_incoming_dir(), filename)
+
+    def add_file(self, path, sha256=None, move=False):
+        """
+        Nimmt eine Datei in den Speicher auf.
+
+        Returns: Pfad der gespeicherten Datei.
+        """
+        filename = os.path.basename(path)
+        if not sha256:
+            digest = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(256 * 1024), b""):
+                    digest.update(block)
+            sha256 = digest.hexdigest()
+        sha256 = sha256.lower()
+
+        with self._lock:
+            self._load()
+            blob_path = self._blob_path(sha256, filename)
+            if not os.path.exists(blob_path):
+                os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                tmp_path = blob_path + ".tmp"
+                if move:
+                    shutil.move(path, tmp_path)
+                else:
+                    shutil.copyfile(path, tmp_path)
+                os.replace(tmp_path, blob_path)
+            elif move:
+                os.remove(path)
+            parsed = parse_distribution_filename(filename)
+            self._entries[sha256] = {
+                "filename": filename,
+                "size": os.path.getsize(blob_path),
+                "project": parsed[0] if parsed else None,
+                "version": parsed[1] if parsed else None,
+                "last_used": time.time(),
+            }
+            self._evict(keep=sha256)
+            self._save()
+        if move:
+            self._remove_empty_incoming(os.path.dirname(path))
+        return blob_path
+
+    def import_directory(self, directory):
+        """Nimmt alle Paketdateien eines Verzeichnisses auf und leert es dabei."""
+        added = []
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            if os.path.isfile(path) and parse_distribution_filename(name):
+                added.append(self.add_file(path, move=True))
+        self._remove_empty_incoming(directory)
+        return added
+
+    def _remove_empty_incoming(self, directory):
+        """Entfernt ein leeres temporäres Download-Verzeichnis."""
+        if os.path.dirname(directory) == self.incoming_dir:
+            try:
+                os.rmdir(directory)
+            except OSError:
+                pass
+
+    def touch(self, filenames):
+        """Markiert Dateien (nach Dateiname) als gerade benutzt."""
+        filenames = set(filenames)
+        if not filenames:
+            return
+        with self._lock:
+            self._load()
+            now = time.time()
+            changed = False
+            for entry in self._entries.values():
+                if entry["filename"] in filenames:
+                    entry["last_used"] = now
+                    changed = True
+            if changed:
+                self._save()
+
+    def _evict(self, keep=None):
+        """Entfernt die am längsten ungenutzten Dateien oberhalb der Obergrenze."""
+        total = sum(entry["size"] for entry in self._entries.values())
+        if total <= self.max_size:
+            return
+        for sha256, entry in sorted(self._entries.items(), key=lambda e: e[1]["last_used"]):
+            if total <= self.max_size:
+                break
+            if sha256 == keep:
+                continue
+            shutil.rmtree(os.path.dirname(self._blob_path(sha256, entry["filename"])),
+                          ignore_errors=True)
+            del self._entries[sha256]
+            total -= entry["size"]
+
+    def set_max_size(self, max_size):
+        """Ändert die Obergrenze und räumt bei Bedarf sofort auf."""
+        with self._lock:
+            self._load()
+            self.max_size = max_size
+            self._evict()
+            self._save()
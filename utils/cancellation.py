@@ -0,0 +1,74 @@
+"""
+Kooperativer Abbruch für Hintergrundaufgaben.
+
+Worker-Threads lassen sich in Python nicht von außen beenden. Stattdessen
+erhält jede Aufgabe ein `CancellationToken`, das sie zwischen ihren Schritten
+prüft; abgebrochene Aufgaben verwerfen ihr Ergebnis, statt es anzuzeigen.
+`LatestWins` vergibt Tokens für Anfragen, bei denen nur die jeweils neueste
+zählt (z.B. die Detailansicht beim schnellen Blättern durch die Paketliste).
+"""
+import threading
+
+
+class OperationCancelled(Exception):
+    """Wird von `CancellationToken.raise_if_cancelled()` ausgelöst."""
+
+
+class CancellationToken:
+    """Threadsicheres Abbruch-Signal für eine einzelne Aufgabe."""
+
+    __slots__ = ("label", "_event")
+
+    def __init__(self, label=None):
+        self.label = label
+        self._event = threading.Event()
+
+    def cancel(self):
+        """Markiert die Aufgabe als abgebrochen."""
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        """True, sobald `cancel()` aufgerufen wurde."""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        """Beendet die Aufgabe an einem sicheren Punkt mit `OperationCancelled`."""
+        if self._event.is_set():
+            raise OperationCancelled(self.label)
+
+    def __repr__(self):
+        state = "cancelled" if self.cancelled else "active"
+        return f"<CancellationToken {self.label!r} {state}>"
+
+
+class LatestWins:
+    """Vergibt Tokens, von denen immer nur das zuletzt vergebene aktiv ist."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._current = None
+
+    def begin(self, label=None):
+        """
+        Startet eine neue Anfrage und bricht die vorherige ab.
+
+        Returns: CancellationToken der neuen Anfrage.
+        """
+        token = CancellationToken(label)
+        with self._lock:
+            previous, self._current = self._current, token
+        if previous is not None:
+            previous.cancel()
+        return token
+
+    def is_current(self, token):
+        """True, wenn `token` die neueste und nicht abgebrochene Anfrage ist."""
+        return token is self._current and not token.cancelled
+
+    def cancel(self):
+        """Bricht die laufende Anfrage ab, ohne eine neue zu starten."""
+        with self._lock:
+            previous, self._current = self._current, None
+        if previous is not None:
+            previous.cancel()
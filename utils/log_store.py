@@ -0,0 +1,90 @@
+"""
+Begrenzter, threadsicherer Speicher für Log-Meldungen.
+
+Die Meldungen liegen in einem Ringpuffer fester Größe. Solange ein Log-Fenster
+geöffnet ist, landen neue Zeilen zusätzlich in einer Warteschlange, die der
+GUI-Thread in festen Abständen gebündelt abarbeitet.
+"""
+import queue
+import threading
+from collections import deque
+
+DEFAULT_MAX_RECORDS = 5000
+
+
+class LogStore:
+    """Ringpuffer für Log-Zeilen mit optionaler Warteschlange für die Anzeige."""
+
+    def __init__(self, max_records=DEFAULT_MAX_RECORDS):
+        """
+        Initialisiert den Speicher.
+
+        Parameters
+        ----------
+        max_records : int
+            Maximale Anzahl gespeicherter Zeilen; ältere werden verworfen.
+        """
+        self._records = deque(maxlen=max(1, int(max_records)))
+        self._pending = queue.SimpleQueue()
+        self._has_consumer = False
+        # Hält Ringpuffer und Konsumenten-Flag konsistent (append vs. attach_consumer)
+        self._lock = threading.Lock()
+
+    @property
+    def max_records(self):
+        """Gibt die aktuelle Obergrenze zurück."""
+        return self._records.maxlen
+
+    def set_max_records(self, max_records):
+        """Ändert die Obergrenze; überzählige alte Zeilen werden verworfen."""
+        with self._lock:
+            self._records = deque(self._records, maxlen=max(1, int(max_records)))
+
+    def append(self, line):
+        """Fügt eine Zeile hinzu (aus jedem Thread aufrufbar)."""
+        with self._lock:
+            self._records.append(line)
+            if self._has_consumer:
+                self._pending.put(line)
+
+    def snapshot(self):
+        """Gibt eine Kopie aller gespeicherten Zeilen zurück."""
+        with self._lock:
+            return list(self._records)
+
+    def attach_consumer(self):
+        """
+        Meldet einen Anzeige-Konsumenten an und gibt den aktuellen Stand zurück.
+
+        Ab jetzt werden neue Zeilen zusätzlich für `drain()` vorgehalten. Stand
+        und Flag werden gemeinsam unter der Sperre gesetzt, damit keine Zeile
+        sowohl im Stand als auch in der Warteschlange landet.
+        """
+        with self._lock:
+            self._discard_pending()
+            self._has_consumer = True
+            return list(self._records)
+
+    def detach_consumer(self):
+        """Meldet den Konsumenten ab und verwirft nicht abgeholte Zeilen."""
+        with self._lock:
+            self._has_consumer = False
+            self._discard_pending()
+
+    def drain(self, max_items=None):
+        """Holt bis zu `max_items` wartende Zeilen ab (ohne zu blockieren)."""
+        lines = []
+        while max_items is None or len(lines) < max_items:
+            try:
+                lines.append(self._pending.get_nowait())
+            except queue.Empty:
+                break
+        return lines
+
+    def _discard_pending(self):
+        """Leert die Warteschlange."""
+        while True:
+            try:
+                self._pending.get_nowait()
+            except queue.Empty:
+                return
@@ -0,0 +1,101 @@
+"""
+Fortschrittsauswertung für gestreamte Pip-Ausgaben.
+
+Der Reporter wird vom Worker-Thread mit jeder Ausgabezeile gefüttert und
+zählt dabei die Phasen von Pip (Collecting, Downloading, Installing,
+Uninstalling) zu echten Schritten zusammen. Die GUI fragt den Zustand in
+einem festen Takt ab, sodass unabhängig von der Zeilenanzahl höchstens
+eine Aktualisierung pro Frame entsteht.
+"""
+import re
+import threading
+
+DEFAULT_FPS = 10
+
+_COLLECTING = re.compile(r"^\s*Collecting\s+(\S+)")
+_DOWNLOADING = re.compile(r"^\s*(Downloading|Using cached)\s+\S+")
+_SATISFIED = re.compile(r"^\s*Requirement already satisfied:")
+_INSTALLING = re.compile(r"^\s*Installing collected packages:\s*(.+)$")
+_FOUND_EXISTING = re.compile(r"^\s*Found existing installation:")
+_UNINSTALLED = re.compile(r"^\s*Successfully uninstalled\s+\S+")
+_FINISHED = re.compile(r"^\s*Successfully installed\b")
+
+
+class PipProgressReporter:
+    """Sammelt den Fortschritt eines Pip-Laufs threadsicher."""
+
+    def __init__(self, fps=DEFAULT_FPS):
+        """
+        Initialisiert den Reporter.
+
+        Parameters
+        ----------
+        fps : int
+            Maximale Anzahl an GUI-Aktualisierungen pro Sekunde.
+        """
+        self.interval_ms = max(1, int(1000 / fps))
+        self._lock = threading.Lock()
+        self._collected = 0
+        self._downloaded = 0
+        self._install_total = None
+        self._installed = 0
+        self._to_uninstall = 0
+        self._uninstalled = 0
+        self._text = ""
+        self._revision = 0
+        self._finished = False
+
+    def set_text(self, text):
+        """Setzt den Statustext ohne Schrittzählung (z.B. Start-/Endmeldung)."""
+        with self._lock:
+            self._text = text
+            self._revision += 1
+
+    def feed(self, line):
+        """Wertet eine Ausgabezeile von Pip aus."""
+        line = line.rstrip()
+        with self._lock:
+            if _COLLECTING.match(line):
+                self._collected += 1
+            elif _DOWNLOADING.match(line):
+                self._downloaded += 1
+            elif _SATISFIED.match(line):
+                pass
+            elif _INSTALLING.match(line):
+                packages = _INSTALLING.match(line).group(1)
+                self._install_total = len([p for p in packages.split(",") if p.strip()])
+            elif _FOUND_EXISTING.match(line):
+                self._to_uninstall += 1
+            elif _UNINSTALLED.match(line):
+                self._uninstalled += 1
+            elif _FINISHED.match(line):
+                self._installed = self._install_total or self._collected
+            if line:
+                self._text = line
+            self._revision += 1
+
+    def finish(self, text=None):
+        """Markiert den Lauf als beendet."""
+        with self._lock:
+            if text is not None:
+                self._text = text
+            self._finished = True
+            self._revision += 1
+
+    def snapshot(self):
+        """
+        Gibt den aktuellen Zustand zurück.
+
+        Returns: (revision, text, step, total, finished); `total` ist 0, solange
+        noch keine Schritte bekannt sind.
+        """
+        with self._lock:
+            install_total = (self._install_total if self._install_total is not None
+                             else self._collected)
+            # Jedes gesammelte Paket wird heruntergeladen und installiert,
+            # jede ersetzte Installation zusätzlich deinstalliert.
+            total = self._collected + install_total + self._to_uninstall
+            step = min(self._downloaded, self._collected) + self._installed + self._uninstalled
+            if self._finished:
+                step = total
+            return self._revision, self._text, min(step, total), total, self._finished
@@ -0,0 +1,147 @@
+"""
+Vorausschauendes Laden in einen größenbegrenzten Cache.
+
+`LruCache` hält die zuletzt verwendeten Einträge bis zu einer maximalen
+Anzahl und einer geschätzten Gesamtgröße. `Prefetcher` lädt Einträge, die
+bald gebraucht werden dürften (z.B. die Nachbarn der aktuellen Auswahl), mit
+niedriger Priorität über den TaskScheduler; jede neue Anforderung verdrängt
+die noch nicht begonnenen Ladevorgänge der vorherigen.
+"""
+import sys
+import threading
+from collections import OrderedDict
+
+from utils.cancellation import LatestWins, OperationCancelled
+from utils.task_scheduler import LANE_PREFETCH
+
+
+def _default_size(value):
+    return sys.getsizeof(value)
+
+
+class LruCache:
+    """Threadsicherer LRU-Cache mit Obergrenze für Anzahl und geschätzte Größe."""
+
+    def __init__(self, max_entries=256, max_bytes=8 * 1024 * 1024, size_func=None):
+        """
+        Parameters
+        ----------
+        max_entries : int
+            Maximale Anzahl der Einträge.
+        max_bytes : int
+            Obergrenze der mit `size_func` geschätzten Gesamtgröße.
+        size_func : callable, optional
+            Funktion `(wert) -> bytes` (Standard: sys.getsizeof).
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size_func = size_func or _default_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """Gibt den Eintrag zurück und markiert ihn als zuletzt verwendet."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        """Speichert einen Eintrag und verdrängt bei Bedarf die ältesten."""
+        size = self.size_func(value)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.total_bytes -= old[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self.total_bytes += size
+            while len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes:
+                _key, (_value, old_size) = self._entries.popitem(last=False)
+                self.total_bytes -= old_size
+
+    def discard(self, key):
+        """Entfernt einen Eintrag, falls vorhanden."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.total_bytes -= entry[1]
+
+    def clear(self):
+        """Leert den Cache."""
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+
+class Prefetcher:
+    """Lädt absehbar benötigte Einträge im Hintergrund in einen LruCache."""
+
+    def __init__(self, scheduler, load, cache, lane=LANE_PREFETCH, log_callback=None):
+        """
+        Parameters
+        ----------
+        scheduler : TaskScheduler
+            Führt die Ladevorgänge aus.
+        load : callable
+            Funktion `(schlüssel, token) -> wert`; läuft im Worker-Thread.
+        cache : LruCache
+            Ziel der geladenen Werte.
+        """
+        self.scheduler = scheduler
+        self.load = load
+        self.cache = cache
+        self.lane = lane
+        self.log_callback = log_callback
+        self._requests = LatestWins()
+        self._in_flight = set()
+        self._lock = threading.Lock()
+
+    def prefetch(self, keys):
+        """
+        Reiht das Laden aller noch nicht gecachten `keys` in der angegebenen Reihenfolge ein.
+
+        Noch nicht begonnene Ladevorgänge eines früheren Aufrufs werden verworfen.
+        """
+        token = self._requests.begin("prefetch")
+        for key in keys:
+            with self._lock:
+                if key in self.cache or key in self._in_flight:
+                    continue
+            self.scheduler.submit(lambda key=key: self._run(key, token), f"prefetch {key}",
+                                  self.lane, token=token)
+
+    def cancel(self):
+        """Verwirft alle noch nicht begonnenen Ladevorgänge."""
+        self._requests.cancel()
+
+    def _run(self, key, token):
+        with self._lock:
+            if key in self.cache or key in self._in_flight:
+                return
+            self._in_flight.add(key)
+        try:
+            self.cache.put(key, self.load(key, token))
+        except OperationCancelled:
+            raise
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Vorladen ist optional; Fehler zeigt erst die tatsächliche Auswahl an
+            if self.log_callback:
+                self.log_callback(f"prefetch {key}: {e}", "DEBUG")
+        finally:
+            with self._lock:
+                self._in_flight.discard(key)
@@ -0,0 +1,135 @@
+"""
+Kleine Task-Pipeline für voneinander unabhängige Ladeschritte.
+
+Stufen ohne gegenseitige Abhängigkeiten laufen parallel; jede Stufe meldet ihr
+Ergebnis sofort nach Abschluss über einen Callback, statt auf die langsamste
+Stufe zu warten. Die Laufzeit jeder Stufe wird protokolliert.
+"""
+import threading
+import time
+
+
+class PipelineStage:
+    """Beschreibt eine einzelne Stufe der Pipeline."""
+
+    __slots__ = ("name", "func", "depends_on", "on_result", "on_error",
+                 "result", "error", "duration", "state")
+
+    def __init__(self, name, func, depends_on=(), on_result=None, on_error=None):
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+        self.on_result = on_result
+        self.on_error = on_error
+        self.result = None
+        self.error = None
+        self.duration = None
+        self.state = "pending"  # pending, running, done, failed, skipped
+
+
+def _start_thread(job):
+    """Standard-Ausführung: jede Stufe in einem eigenen Daemon-Thread."""
+    threading.Thread(target=job, daemon=True).start()
+
+
+class TaskPipeline:
+    """Führt Stufen nebenläufig aus, sobald ihre Abhängigkeiten erfüllt sind."""
+
+    def __init__(self, submit=None):
+        """
+        Initialisiert die Pipeline.
+
+        Parameters
+        ----------
+        submit : callable, optional
+            Funktion, die einen parameterlosen Job zur Ausführung annimmt.
+            Standardmäßig wird pro Stufe ein Daemon-Thread gestartet.
+        """
+        self._submit = submit or _start_thread
+        self._stages = {}
+        self._lock = threading.Lock()
+        self._on_finish = None
+        self._started_at = None
+        self.total_duration = None
+
+    def add_stage(self, name, func, depends_on=(), on_result=None, on_error=None):
+        """
+        Fügt eine Stufe hinzu.
+
+        `on_result(result)` bzw. `on_error(exception)` werden im Worker-Thread
+        aufgerufen, sobald die Stufe abgeschlossen ist.
+        """
+        for dep in depends_on:
+            if dep not in self._stages:
+                raise ValueError(f"Unbekannte Abhängigkeit '{dep}' für Stufe '{name}'")
+        self._stages[name] = PipelineStage(name, func, depends_on, on_result, on_error)
+        return self
+
+    @property
+    def timings(self):
+        """Gibt die Laufzeiten der abgeschlossenen Stufen in Sekunden zurück."""
+        return {name: stage.duration for name, stage in self._stages.items()
+                if stage.duration is not None}
+
+    def run(self, on_finish=None):
+        """
+        Startet alle Stufen ohne offene Abhängigkeiten.
+
+        `on_finish(pipeline)` wird einmalig aufgerufen, wenn keine Stufe mehr läuft.
+        """
+        self._on_finish = on_finish
+        self._started_at = time.perf_counter()
+        if not self._stages:
+            self._finish()
+            return
+        self._schedule_ready()
+
+    def _schedule_ready(self):
+        """Startet alle Stufen, deren Abhängigkeiten erfolgreich abgeschlossen sind."""
+        ready = []
+        finished = False
+        with self._lock:
+            for stage in self._stages.values():
+                if stage.state != "pending":
+                    continue
+                dep_states = [self._stages[dep].state for dep in stage.depends_on]
+                if any(s in ("failed", "skipped") for s in dep_states):
+                    stage.state = "skipped"
+                elif all(s == "done" for s in dep_states):
+                    stage.state = "running"
+                    ready.append(stage)
+            if not ready and all(s.state in ("done", "failed", "skipped")
+                                 for s in self._stages.values()):
+                finished = self.total_duration is None
+                if finished:
+                    self.total_duration = time.perf_counter() - self._started_at
+        for stage in ready:
+            self._submit(lambda s=stage: self._run_stage(s))
+        if finished and self._on_finish:
+            self._on_finish(self)
+
+    def _run_stage(self, stage):
+        """Führt eine Stufe aus und meldet das Ergebnis."""
+        start = time.perf_counter()
+        try:
+            stage.result = stage.func()
+        except Exception as e: # pylint: disable=broad-except
+            stage.error = e
+        stage.duration = time.perf_counter() - start
+
+        try:
+            if stage.error is None:
+                if stage.on_result:
+                    stage.on_result(stage.result)
+            elif stage.on_error:
+                stage.on_error(stage.error)
+        finally:
+            with self._lock:
+                stage.state = "done" if stage.error is None else "failed"
+            self._schedule_ready()
+
+    def _finish(self):
+        """Schließt eine leere Pipeline sofort ab."""
+        self.total_duration = 0.0
+        if self._on_finish:
+            self._on_finish(self)
@@ -0,0 +1,219 @@
+"""
+Zentraler Scheduler für alle Hintergrundaufgaben der Anwendung.
+
+Statt für jede Aktion einen eigenen Thread zu starten, laufen Aufgaben in
+getrennten Spuren mit jeweils begrenzter Worker-Anzahl:
+  - 'interactive': Abfragen, auf die der Benutzer wartet (Paketdetails,
+    Paketliste, Versionen, Konfliktprüfung vor einer Aktion)
+  - 'background':  Synchronisation und Wartung (Index, Update-Prüfung,
+    venv-Suche, Cache-Verwaltung)
+  - 'pip':         verändernde Pip-Aufrufe; Aufgaben mit demselben Schlüssel
+    (der Python-Umgebung) laufen strikt nacheinander in Einreichungsreihenfolge
+  - 'prefetch':    spekulatives Vorladen mit niedriger Priorität (wenige Worker)
+
+Jede Spur hat eigene Worker, sodass lang laufende Hintergrundarbeit keine
+interaktive Abfrage verzögert. Worker werden bei Bedarf gestartet und beenden
+sich nach einer Leerlaufzeit wieder.
+"""
+import itertools
+import threading
+import time
+import traceback
+from collections import deque
+
+from utils.cancellation import CancellationToken, OperationCancelled
+
+LANE_INTERACTIVE = "interactive"
+LANE_BACKGROUND = "background"
+LANE_PIP = "pip"
+LANE_PREFETCH = "prefetch"
+DEFAULT_LANE_WORKERS = {LANE_INTERACTIVE: 4, LANE_BACKGROUND: 3, LANE_PIP: 2, LANE_PREFETCH: 2}
+WORKER_IDLE_TIMEOUT = 30.0
+FINISHED_HISTORY = 50
+
+
+class ScheduledTask:
+    """Eine eingereihte, laufende oder beendete Aufgabe."""
+
+    __slots__ = ("task_id", "name", "lane", "key", "func", "token", "state",
+                 "submitted_at", "started_at", "finished_at", "error")
+
+    def __init__(self, task_id, name, lane, key, func, token):
+        self.task_id = task_id
+        self.name = name
+        self.lane = lane
+        self.key = key
+        self.func = func
+        self.token = token
+        self.state = "pending"  # pending, running, done, failed, cancelled
+        self.submitted_at = time.monotonic()
+        self.started_at = None
+        self.finished_at = None
+        self.error = None
+
+    @property
+    def duration(self):
+        """Laufzeit (bzw. bisherige Laufzeit) in Sekunden, None vor dem Start."""
+        if self.started_at is None:
+            return None
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    def cancel(self):
+        """Bricht die Aufgabe ab (eingereihte werden übersprungen, laufende kooperativ)."""
+        self.token.cancel()
+
+    def __repr__(self):
+        return f"<ScheduledTask #{self.task_id} {self.name!r} {self.lane}/{self.state}>"
+
+
+class _Lane:
+    __slots__ = ("name", "max_workers", "pending", "workers", "idle", "running", "running_keys")
+
+    def __init__(self, name, max_workers):
+        self.name = name
+        self.max_workers = max_workers
+        self.pending = deque()
+        self.workers = 0
+        self.idle = 0
+        self.running = []
+        self.running_keys = set()
+
+
+class TaskScheduler:
+    """Verteilt Aufgaben auf Spuren mit begrenzten Worker-Pools."""
+
+    def __init__(self, lane_workers=None, log_callback=None):
+        """
+        Initialisiert den Scheduler.
+
+        Parameters
+        ----------
+        lane_workers : dict, optional
+            Maximale Worker-Anzahl pro Spur (Standard: DEFAULT_LANE_WORKERS).
+        log_callback : callable, optional
+            Funktion `(nachricht, level)` für unerwartete Fehler in Aufgaben.
+        """
+        workers = dict(DEFAULT_LANE_WORKERS, **(lane_workers or {}))
+        self._lanes = {name: _Lane(name, count) for name, count in workers.items()}
+        self._cond = threading.Condition()
+        self._ids = itertools.count(1)
+        self._finished = deque(maxlen=FINISHED_HISTORY)
+        self._shutdown = False
+        self.log_callback = log_callback
+
+    def submit(self, func, name=None, lane=LANE_BACKGROUND, key=None, token=None):
+        """
+        Reiht `func()` in eine Spur ein.
+
+        Parameters
+        ----------
+        key : hashable, optional
+            Aufgaben derselben Spur mit gleichem Schlüssel laufen nie gleichzeitig
+            (z.B. der Interpreterpfad für Pip-Aufrufe).
+        token : CancellationToken, optional
+            Abbruchsignal; wird keins übergeben, erhält die Aufgabe ein eigenes.
+
+        Returns: ScheduledTask
+        """
+        task = ScheduledTask(next(self._ids), name or getattr(func, "__name__", "task"),
+                             lane, key, func, token or CancellationToken(name))
+        with self._cond:
+            if self._shutdown:
+                task.state = "cancelled"
+                return task
+            lane_state = self._lanes[lane]
+            lane_state.pending.append(task)
+            if lane_state.idle == 0 and lane_state.workers < lane_state.max_workers:
+                lane_state.workers += 1
+                threading.Thread(target=self._work, args=(lane_state,),
+                                 name=f"scheduler-{lane}", daemon=True).start()
+            else:
+                self._cond.notify_all()
+        return task
+
+    def tasks(self):
+        """Momentaufnahme aller laufenden, eingereihten und zuletzt beendeten Aufgaben."""
+        with self._cond:
+            active = [task for lane in self._lanes.values()
+                      for task in itertools.chain(lane.running, lane.pending)]
+            return active + list(reversed(self._finished))
+
+    def cancel(self, task_id):
+        """Bricht die Aufgabe mit der angegebenen ID ab."""
+        for task in self.tasks():
+            if task.task_id == task_id:
+                task.cancel()
+                with self._cond:
+                    self._cond.notify_all()
+                return True
+        return False
+
+    def shutdown(self):
+        """Bricht alle Aufgaben ab und lässt die Worker auslaufen."""
+        with self._cond:
+            self._shutdown = True
+            for lane in self._lanes.values():
+                for task in itertools.chain(lane.running, lane.pending):
+                    task.cancel()
+            self._cond.notify_all()
+
+    # --- Worker ---
+
+    def _take_next(self, lane):
+        """Entnimmt die erste ausführbare Aufgabe (Aufruf nur mit gehaltener Sperre)."""
+        for task in list(lane.pending):
+            if task.token.cancelled:
+                lane.pending.remove(task)
+                task.state = "cancelled"
+                self._finished.append(task)
+            elif task.key is None or task.key not in lane.running_keys:
+                lane.pending.remove(task)
+                return task
+        return None
+
+    def _work(self, lane):
+        while True:
+            with self._cond:
+                task = None
+                while not self._shutdown:
+                    task = self._take_next(lane)
+                    if task is not None:
+                        break
+                    lane.idle += 1
+                    notified = self._cond.wait(WORKER_IDLE_TIMEOUT)
+                    lane.idle -= 1
+                    if not notified:
+                        task = self._take_next(lane)
+                        break
+                if task is None:
+                    lane.workers -= 1
+                    return
+                task.state = "running"
+                task.started_at = time.monotonic()
+                lane.running.append(task)
+                if task.key is not None:
+                    lane.running_keys.add(task.key)
+
+            self._run(task)
+
+            with self._cond:
+                lane.running.remove(task)
+                lane.running_keys.discard(task.key)
+                self._finished.append(task)
+                self._cond.notify_all()
+
+    def _run(self, task):
+        try:
+            task.func()
+            task.state = "done"
+        except OperationCancelled:
+            task.state = "cancelled"
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Ein fehlerhafter Job darf den Worker nicht beenden
+            task.state = "failed"
+            task.error = e
+            if self.log_callback:
+                self.log_callback(f"{task.name}: {e}\n{traceback.format_exc()}", "ERROR")
+        finally:
+            task.finished_at = time.monotonic()
+            task.func = None
@@ -0,0 +1,172 @@
+"""
+Leichtgewichtige Zeitmessung für Start- und Hot-Path-Abschnitte.
+
+Ein Abschnitt (Span) wird über `tracer.span(name)` als Kontextmanager,
+`tracer.traced(name)` als Dekorator oder `tracer.start(name)`/`.end()` für
+asynchrone Abläufe gemessen. Ist der Tracer deaktiviert, liefern alle
+Varianten ein gemeinsames Leerobjekt und kosten praktisch nichts. Die
+aufgezeichneten Abschnitte lassen sich als Chrome-Trace-JSON exportieren
+(chrome://tracing, Perfetto) oder als Zusammenfassung ausgeben.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+DEFAULT_MAX_EVENTS = 100000
+
+
+class _NullSpan:
+    """Leerobjekt für den deaktivierten Tracer."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+    def end(self):
+        """Beendet nichts."""
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """Ein laufender Messabschnitt."""
+
+    __slots__ = ("_tracer", "name", "args", "_start", "_thread")
+
+    def __init__(self, tracer, name, args):
+        self._tracer = tracer
+        self.name = name
+        self.args = args
+        self._thread = threading.current_thread()
+        self._start = time.perf_counter()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        self.end()
+        return False
+
+    def end(self):
+        """Beendet den Abschnitt und zeichnet ihn auf."""
+        self._tracer.record(self.name, self._start, time.perf_counter() - self._start,
+                            self._thread, self.args)
+
+
+class Tracer:
+    """Sammelt Messabschnitte threadsicher in einem begrenzten Puffer."""
+
+    def __init__(self, enabled=False, max_events=DEFAULT_MAX_EVENTS):
+        """
+        Initialisiert den Tracer.
+
+        Parameters
+        ----------
+        enabled : bool
+            Ob Abschnitte aufgezeichnet werden.
+        max_events : int
+            Maximale Anzahl gespeicherter Abschnitte; ältere werden verworfen.
+        """
+        self.enabled = enabled
+        self._events = deque(maxlen=max_events)
+        self._origin = time.perf_counter()
+
+    def span(self, name, **args):
+        """Kontextmanager, der die Dauer des Blocks misst."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, args)
+
+    # Für Abläufe über Callbacks: `handle = tracer.start(name)` ... `handle.end()`
+    start = span
+
+    def traced(self, name=None):
+        """Dekorator, der jeden Aufruf der Funktion misst."""
+        def decorator(func):
+            span_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with Span(self, span_name, None):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def record(self, name, start, duration, thread=None, args=None):
+        """Zeichnet einen abgeschlossenen Abschnitt mit `perf_counter`-Startzeit auf."""
+        if not self.enabled:
+            return
+        thread = thread or threading.current_thread()
+        # Abschnitte, die vor dem Tracer begannen (z.B. Prozessstart), verschieben den Nullpunkt
+        self._origin = min(self._origin, start)
+        self._events.append((name, start, duration, thread.name, thread.ident, args))
+
+    def reset(self):
+        """Verwirft alle aufgezeichneten Abschnitte."""
+        self._events.clear()
+
+    def summary(self):
+        """
+        Fasst die Abschnitte pro Name zusammen.
+
+        Returns: Liste von (name, anzahl, gesamt_s, mittel_s, max_s, threads),
+        absteigend nach Gesamtdauer sortiert.
+        """
+        stats = {}
+        for name, _start, duration, thread_name, _tid, _args in list(self._events):
+            entry = stats.setdefault(name, [0, 0.0, 0.0, set()])
+            entry[0] += 1
+            entry[1] += duration
+            entry[2] = max(entry[2], duration)
+            entry[3].add(thread_name)
+        rows = [(name, count, total, total / count, maximum, sorted(threads))
+                for name, (count, total, maximum, threads) in stats.items()]
+        rows.sort(key=lambda row: row[2], reverse=True)
+        return rows
+
+    def format_summary(self):
+        """Gibt die Zusammenfassung als Textzeilen einer Tabelle zurück."""
+        lines = [f"{'span':<40} {'count':>7} {'total ms':>11} {'mean ms':>10} {'max ms':>10}"]
+        for name, count, total, mean, maximum, _threads in self.summary():
+            lines.append(f"{name[:40]:<40} {count:>7} {total * 1000:>11.1f} "
+                         f"{mean * 1000:>10.1f} {maximum * 1000:>10.1f}")
+        return lines
+
+    def export_chrome_trace(self, path):
+        """
+        Schreibt alle Abschnitte im Chrome-Trace-Event-Format.
+
+        Returns: Anzahl der exportierten Abschnitte.
+        """
+        pid = os.getpid()
+        trace_events = []
+        thread_names = {}
+        for name, start, duration, thread_name, tid, args in list(self._events):
+            thread_names[tid] = thread_name
+            event = {"name": name, "ph": "X", "pid": pid, "tid": tid,
+                     "ts": round((start - self._origin) * 1e6, 3),
+                     "dur": round(duration * 1e6, 3)}
+            if args:
+                event["args"] = {key: str(value) for key, value in args.items()}
+            trace_events.append(event)
+        span_count = len(trace_events)
+        for tid, thread_name in thread_names.items():
+            trace_events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                                 "args": {"name": thread_name}})
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f)
+        return span_count
+
+
+# Prozessweiter Tracer; wird per Umgebungsvariable oder Einstellung aktiviert.
+TRACER = Tracer(enabled=os.environ.get("PIP_MANAGER_TRACE") == "1")
@@ -0,0 +1,142 @@
+"""
+Sprachkatalog mit bedarfsweisem Laden.
+
+Es wird nur die aktive Sprache (zusammen mit der Ersatzsprache) geladen und
+zu einer flachen Nachschlagetabelle zusammengeführt. Diese Tabelle wird pro
+Sprache auf der Festplatte zwischengespeichert und nur neu erzeugt, wenn sich
+eine der zugrunde liegenden JSON-Dateien geändert hat. Die Namen aller
+verfügbaren Sprachen stehen in einem kleinen Manifest, sodass für die
+Sprachauswahl keine weiteren Sprachdateien geparst werden müssen.
+"""
+import json
+import os
+import threading
+
+CACHE_FORMAT_VERSION = 1
+
+
+class TranslationCatalog:
+    """Liefert übersetzte Texte für die jeweils aktive Sprache."""
+
+    def __init__(self, lang_dir, cache_dir=None, fallback="de", builtin=None):
+        """
+        Initialisiert den Katalog (es wird noch nichts geladen).
+
+        Parameters
+        ----------
+        lang_dir : str
+            Verzeichnis mit den Dateien '<code>.json'.
+        cache_dir : str, optional
+            Verzeichnis für die vorkompilierten Tabellen; ohne wird nicht gecacht.
+        fallback : str
+            Sprache, deren Texte für fehlende Schlüssel verwendet werden.
+        builtin : dict, optional
+            Eingebaute Notfalltexte pro Sprache, falls Dateien fehlen.
+        """
+        self.lang_dir = lang_dir
+        self.cache_dir = cache_dir
+        self.fallback = fallback
+        self.builtin = builtin or {}
+        self.language = None
+        self._table = {}
+        self._lock = threading.Lock()
+        self._signature = None
+        self._names = None
+
+    # --- Quelldateien ---
+
+    def _source_path(self, code):
+        return os.path.join(self.lang_dir, f"{code}.json")
+
+    def _source_signature(self):
+        """Änderungszeit und Größe aller Sprachdateien."""
+        if self._signature is None:
+            signature = {}
+            if os.path.isdir(self.lang_dir):
+                for filename in os.listdir(self.lang_dir):
+                    if filename.endswith('.json'):
+                        stat = os.stat(os.path.join(self.lang_dir, filename))
+                        signature[filename[:-5]] = [stat.st_mtime_ns, stat.st_size]
+            self._signature = signature
+        return self._signature
+
+    def _parse(self, code):
+        """Liest eine Sprachdatei (oder die eingebauten Notfalltexte)."""
+        texts = dict(self.builtin.get(code, {}))
+        try:
+            with open(self._source_path(code), 'r', encoding='utf-8') as f:
+                texts.update(json.load(f))
+        except (OSError, json.JSONDecodeError):
+            pass
+        return texts
+
+    # --- Cache ---
+
+    def _read_cache(self, name):
+        if not self.cache_dir:
+            return None
+        try:
+            with open(os.path.join(self.cache_dir, name), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        return data if data.get("format") == CACHE_FORMAT_VERSION else None
+
+    def _write_cache(self, name, data):
+        if not self.cache_dir:
+            return
+        data = dict(data, format=CACHE_FORMAT_VERSION)
+        path = os.path.join(self.cache_dir, name)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(path + ".tmp", 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(path + ".tmp", path)
+        except OSError:
+            pass
+
+    def _compile(self, code):
+        """Gibt die flache Tabelle für eine Sprache zurück (aus dem Cache oder neu erzeugt)."""
+        signature = self._source_signature()
+        sources = {c: signature.get(c) for c in {code, self.fallback}}
+        cached = self._read_cache(f"{code}.json")
+        if cached and cached.get("sources") == sources:
+            return cached["texts"]
+
+        texts = self._parse(self.fallback) if code != self.fallback else {}
+        texts.update(self._parse(code))
+        self._write_cache(f"{code}.json", {"sources": sources, "texts": texts})
+        return texts
+
+    # --- Öffentliche Schnittstelle ---
+
+    def language_names(self):
+        """Gibt eine Zuordnung Sprachcode -> Anzeigename aller verfügbaren Sprachen zurück."""
+        if self._names is None:
+            signature = self._source_signature()
+            manifest = self._read_cache("manifest.json")
+            if manifest and manifest.get("sources") == signature:
+                self._names = manifest["names"]
+            else:
+                codes = sorted(set(signature) | set(self.builtin))
+                self._names = {code: self._parse(code).get("language_name", code)
+                               for code in codes}
+                self._write_cache("manifest.json", {"sources": signature, "names": self._names})
+        return self._names
+
+    def set_language(self, code):
+        """Wechselt die aktive Sprache; es wird nur diese Sprache geladen."""
+        if code == self.language:
+            return
+        if code not in self._source_signature() and code not in self.builtin:
+            code = self.fallback
+        with self._lock:
+            self._table = self._compile(code)
+            self.language = code
+
+    def get(self, key):
+        """Gibt den Text für `key` zurück oder einen Platzhalter, falls er fehlt."""
+        try:
+            return self._table[key]
+        except KeyError:
+            return f"<{key}>"
@@ -0,0 +1,123 @@
+"""
+Gebündelte GUI-Aktualisierungen aus Worker-Threads.
+
+Worker-Threads legen Aktualisierungen in eine Warteschlange, statt für jede
+Änderung selbst `root.after(...)` aufzurufen (Tk ist nicht threadsicher). Der Tk-Thread
+leert die Warteschlange in festem Takt und mit begrenzter Zeit pro Durchlauf.
+Aktualisierungen mit demselben Schlüssel (z.B. der Text eines Labels) werden
+zusammengefasst: Nur die zuletzt eingereihte wird ausgeführt.
+"""
+import itertools
+import threading
+import time
+import tkinter as tk
+from collections import OrderedDict
+
+DEFAULT_INTERVAL_MS = 30
+DEFAULT_BUDGET_MS = 15
+
+
+class UiDispatcher:
+    """Warteschlange für GUI-Aktualisierungen, die im Tk-Thread abgearbeitet wird."""
+
+    def __init__(self, root, interval_ms=DEFAULT_INTERVAL_MS, budget_ms=DEFAULT_BUDGET_MS,
+                 error_callback=None):
+        """
+        Initialisiert den Dispatcher (der Takt beginnt mit `start()`).
+
+        Parameters
+        ----------
+        root : tk.Tk
+            Hauptfenster, dessen Ereignisschleife die Warteschlange leert.
+        interval_ms : int
+            Abstand zwischen zwei Durchläufen.
+        budget_ms : int
+            Maximale Zeit pro Durchlauf; übrige Einträge folgen im nächsten Takt.
+        error_callback : callable, optional
+            Funktion `(exception)` für Fehler in einzelnen Aktualisierungen.
+        """
+        self.root = root
+        self.interval_ms = interval_ms
+        self.budget = budget_ms / 1000
+        self.error_callback = error_callback
+        self._pending = OrderedDict()
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()
+        self._after_id = None
+        self.coalesced = 0
+
+    def start(self):
+        """Startet den Takt (nur aus dem Tk-Thread aufrufen)."""
+        if self._after_id is None:
+            self._after_id = self.root.after(self.interval_ms, self._drain)
+
+    def stop(self):
+        """Beendet den Takt; noch eingereihte Aktualisierungen verfallen."""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        with self._lock:
+            self._pending.clear()
+
+    def post(self, callback, key=None):
+        """
+        Reiht `callback()` für den Tk-Thread ein (aus jedem Thread aufrufbar).
+
+        Eine noch nicht ausgeführte Aktualisierung mit demselben `key` wird ersetzt.
+        """
+        with self._lock:
+            if key is None:
+                key = ("#", next(self._sequence))
+            elif self._pending.pop(key, None) is not None:
+                self.coalesced += 1
+            self._pending[key] = callback
+
+    def post_later(self, delay_ms, callback, key=None):
+        """
+        Führt `callback()` nach `delay_ms` im Tk-Thread aus (aus jedem Thread aufrufbar).
+
+        Der Timer wird erst im Tk-Thread mit `root.after` gestellt; `key` fasst wie
+        bei `post()` noch nicht gestellte Timer zusammen.
+        """
+        def schedule():
+            try:
+                self.root.after(delay_ms, callback)
+            except (tk.TclError, RuntimeError):
+                pass
+
+        self.post(schedule, key=key)
+
+    def configure(self, widget, **options):
+        """Setzt Widget-Optionen; spätere Werte für dieselben Optionen ersetzen frühere."""
+        self.post(lambda: widget.config(**options), key=(str(widget), tuple(sorted(options))))
+
+    def _take_all(self):
+        with self._lock:
+            pending, self._pending = self._pending, OrderedDict()
+        return pending
+
+    def _requeue(self, remaining):
+        """Stellt nicht abgearbeitete Einträge vor die inzwischen neu eingereihten."""
+        with self._lock:
+            for key, callback in reversed(remaining):
+                if key not in self._pending:
+                    self._pending[key] = callback
+                    self._pending.move_to_end(key, last=False)
+
+    def _drain(self):
+        pending = list(self._take_all().items())
+        deadline = time.perf_counter() + self.budget
+        for index, (_key, callback) in enumerate(pending):
+            try:
+                callback()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # Ein fehlerhaftes Update (z.B. zerstörtes Widget) blockiert die übrigen nicht
+                if self.error_callback:
+                    self.error_callback(e)
+            if time.perf_counter() > deadline:
+                self._requeue(pending[index + 1:])
+                break
+        try:
+            self._after_id = self.root.after(self.interval_ms, self._drain)
+        except (tk.TclError, RuntimeError):
+            self._after_id = None